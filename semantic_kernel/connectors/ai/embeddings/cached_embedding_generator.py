@@ -0,0 +1,88 @@
+from hashlib import sha256
+from typing import List, Optional
+
+from numpy import asarray, empty, float32, ndarray, stack
+
+from semantic_kernel.connectors.ai.embeddings.embedding_cache_base import (
+    EmbeddingCacheBase,
+)
+from semantic_kernel.connectors.ai.embeddings.embedding_generator_base import (
+    EmbeddingGeneratorBase,
+)
+from semantic_kernel.connectors.ai.embeddings.lru_embedding_cache import (
+    LruEmbeddingCache,
+)
+
+class CachedEmbeddingGenerator(EmbeddingGeneratorBase):
+    """
+    Wraps an embedding generator with a cache keyed by a SHA-256 hash of
+    `model_id` and the text, generating only the texts missing from the
+    cache, in one batch. Use a different `model_id` for every model.
+    """
+
+    _generator: EmbeddingGeneratorBase
+    _cache: EmbeddingCacheBase
+    _model_id: str
+    _hits: int
+    _misses: int
+
+    def __init__(
+        self,
+        generator: EmbeddingGeneratorBase,
+        model_id: str = "",
+        cache: Optional[EmbeddingCacheBase] = None,
+    ) -> None:
+        self._generator = generator
+        self._model_id = model_id
+        self._cache = cache if cache is not None else LruEmbeddingCache()
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def cache(self) -> EmbeddingCacheBase:
+        return self._cache
+
+    @property
+    def hits(self) -> int:
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        return self._misses
+
+    def reset_counters(self) -> None:
+        self._hits = 0
+        self._misses = 0
+
+    async def generate_embeddings_async(self, texts: List[str]) -> ndarray:
+        if not texts:
+            return empty((0, 0), dtype=float32)
+
+        # Repeated texts within a call are hashed, looked up and generated
+        # once.
+        unique_texts = list(dict.fromkeys(texts))
+        keys = [self._key(text) for text in unique_texts]
+        embeddings = list(await self._cache.get_many_async(keys))
+
+        missing = [row for row, embedding in enumerate(embeddings) if embedding is None]
+        missing_texts = {unique_texts[row] for row in missing}
+        hits = sum(text not in missing_texts for text in texts)
+        self._hits += hits
+        self._misses += len(texts) - hits
+
+        if missing:
+            generated = asarray(
+                await self._generator.generate_embeddings_async(
+                    [unique_texts[row] for row in missing]
+                ),
+                dtype=float32,
+            ).reshape(len(missing), -1)
+            await self._cache.put_many_async([keys[row] for row in missing], generated)
+            for row, embedding in zip(missing, generated):
+                embeddings[row] = embedding
+
+        rows = {text: row for row, text in enumerate(unique_texts)}
+        return stack([asarray(embeddings[rows[text]], dtype=float32) for text in texts])
+
+    def _key(self, text: str) -> str:
+        return sha256(f"{self._model_id}\0{text}".encode("utf-8")).hexdigest()
@@ -0,0 +1,94 @@
+import asyncio
+from typing import List, Optional, Set, Tuple
+
+from numpy import ndarray
+
+from semantic_kernel.connectors.ai.embeddings.embedding_generator_base import (
+    EmbeddingGeneratorBase,
+)
+
+class CoalescingEmbeddingGenerator(EmbeddingGeneratorBase):
+    """
+    Wraps an embedding generator so that calls made within `window` seconds,
+    up to `max_batch_size` texts, are sent as one batch; every caller gets
+    its own rows, or the batch's error.
+    """
+
+    _generator: EmbeddingGeneratorBase
+    _window: float
+    _max_batch_size: int
+    _pending: List[Tuple[List[str], asyncio.Future]]
+    _pending_texts: int
+    _timer: Optional[asyncio.TimerHandle]
+    _tasks: Set[asyncio.Task]
+
+    def __init__(
+        self,
+        generator: EmbeddingGeneratorBase,
+        window: float = 0.003,
+        max_batch_size: int = 256,
+    ) -> None:
+        if window < 0:
+            raise ValueError("The batching window cannot be negative")
+        if max_batch_size <= 0:
+            raise ValueError("The maximum batch size must be a positive integer")
+
+        self._generator = generator
+        self._window = window
+        self._max_batch_size = max_batch_size
+        self._pending = []
+        self._pending_texts = 0
+        self._timer = None
+        self._tasks = set()
+
+    async def generate_embeddings_async(self, texts: List[str]) -> ndarray:
+        if not texts:
+            return await self._generator.generate_embeddings_async(texts)
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((list(texts), future))
+        self._pending_texts += len(texts)
+
+        if self._pending_texts >= self._max_batch_size:
+            self._dispatch()
+        elif self._timer is None:
+            self._timer = loop.call_later(self._window, self._dispatch)
+
+        return await future
+
+    def _dispatch(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        batch = self._pending
+        self._pending = []
+        self._pending_texts = 0
+        if not batch:
+            return
+
+        # Keep a reference so the task is not garbage collected mid-flight.
+        task = asyncio.get_running_loop().create_task(self._generate(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _generate(self, batch: List[Tuple[List[str], asyncio.Future]]) -> None:
+        texts = [text for request, _ in batch for text in request]
+        try:
+            embeddings = await self._generator.generate_embeddings_async(texts)
+
+            offset = 0
+            for request, future in batch:
+                if not future.done():
+                    future.set_result(embeddings[offset : offset + len(request)])
+                offset += len(request)
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+        finally:
+            # Cancelling the task (on shutdown, say) must not leave any
+            # caller waiting forever.
+            for _, future in batch:
+                future.cancel()
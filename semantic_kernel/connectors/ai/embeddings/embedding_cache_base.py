@@ -0,0 +1,13 @@
+from abc import ABC, abstractmethod
+from typing import List, Optional
+
+from numpy import ndarray
+
+class EmbeddingCacheBase(ABC):
+    @abstractmethod
+    async def get_many_async(self, keys: List[str]) -> List[Optional[ndarray]]:
+        pass
+
+    @abstractmethod
+    async def put_many_async(self, keys: List[str], embeddings: ndarray) -> None:
+        pass
@@ -1,8 +1,9 @@
 from abc import ABC, abstractmethod
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 
 from numpy import ndarray
 
+from semantic_kernel.memory.memory_filter import MemoryFilter
 from semantic_kernel.memory.memory_record import MemoryRecord
 
 class EmbeddingIndexBase(ABC):
@@ -13,5 +14,21 @@ class EmbeddingIndexBase(ABC):
         embedding: ndarray,
         limit: int,
         min_relevance_score: float,
+        filter: Optional[MemoryFilter] = None,
     ) -> List[Tuple[MemoryRecord, float]]:
-        pass
\ No newline at end of file
+        pass
+
+    async def get_nearest_matches_batch_async(
+        self,
+        collection: str,
+        embeddings: ndarray,
+        limit: int,
+        min_relevance_score: float,
+        filter: Optional[MemoryFilter] = None,
+    ) -> List[List[Tuple[MemoryRecord, float]]]:
+        return [
+            await self.get_nearest_matches_async(
+                collection, embedding, limit, min_relevance_score, filter
+            )
+            for embedding in embeddings.reshape(embeddings.shape[0], -1)
+        ]
@@ -0,0 +1,72 @@
+from collections import OrderedDict
+from typing import List, Optional
+
+from numpy import asarray, float32, ndarray
+
+from semantic_kernel.connectors.ai.embeddings.embedding_cache_base import (
+    EmbeddingCacheBase,
+)
+
+class LruEmbeddingCache(EmbeddingCacheBase):
+    """
+    In-process embedding cache bounded by the bytes its vectors and keys
+    take; the least recently used entries are evicted first. Vectors are
+    kept as float32.
+    """
+
+    _max_bytes: int
+    _entries: "OrderedDict[str, ndarray]"
+    _bytes: int
+
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024) -> None:
+        if max_bytes <= 0:
+            raise ValueError("The cache size must be a positive number of bytes")
+
+        self._max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def max_bytes(self) -> int:
+        return self._max_bytes
+
+    @property
+    def size_bytes(self) -> int:
+        return self._bytes
+
+    async def get_many_async(self, keys: List[str]) -> List[Optional[ndarray]]:
+        embeddings = []
+        for key in keys:
+            embedding = self._entries.get(key)
+            if embedding is not None:
+                self._entries.move_to_end(key)
+            embeddings.append(embedding)
+        return embeddings
+
+    async def put_many_async(self, keys: List[str], embeddings: ndarray) -> None:
+        for key, embedding in zip(keys, embeddings):
+            embedding = asarray(embedding, dtype=float32).reshape(-1).copy()
+            size = self._entry_bytes(key, embedding)
+            if size > self._max_bytes:
+                continue
+
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= self._entry_bytes(key, previous)
+            self._entries[key] = embedding
+            self._bytes += size
+
+        while self._bytes > self._max_bytes:
+            key, embedding = self._entries.popitem(last=False)
+            self._bytes -= self._entry_bytes(key, embedding)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._bytes = 0
+
+    @staticmethod
+    def _entry_bytes(key: str, embedding: ndarray) -> int:
+        return embedding.nbytes + len(key)
@@ -0,0 +1,71 @@
+from typing import Any, List, Optional
+
+from numpy import asarray, float32, frombuffer, ndarray
+
+from semantic_kernel.connectors.ai.embeddings.embedding_cache_base import (
+    EmbeddingCacheBase,
+)
+from semantic_kernel.utils.sqlite_connection import SqliteConnection
+
+class SqliteEmbeddingCache(EmbeddingCacheBase):
+    """
+    Persistent embedding cache in a single SQLite file that processes on
+    the same host can share; concurrent writers wait up to `timeout` seconds
+    for the lock. Entries are never evicted.
+    """
+
+    _SCHEMA = """
+        CREATE TABLE IF NOT EXISTS embedding_cache (
+            key TEXT PRIMARY KEY,
+            embedding BLOB NOT NULL
+        ) WITHOUT ROWID
+    """
+    # Stays below SQLite's default limit on host parameters per statement.
+    _LOOKUP_BATCH = 500
+
+    _sqlite: SqliteConnection
+
+    def __init__(self, path: str, timeout: float = 30.0) -> None:
+        self._sqlite = SqliteConnection(
+            path, self._SCHEMA, "sqlite-embedding-cache", timeout
+        )
+
+    async def get_many_async(self, keys: List[str]) -> List[Optional[ndarray]]:
+        return await self._sqlite.run(self._get_many, keys)
+
+    async def put_many_async(self, keys: List[str], embeddings: ndarray) -> None:
+        rows = [
+            (key, asarray(embedding, dtype=float32).reshape(-1).tobytes())
+            for key, embedding in zip(keys, embeddings)
+        ]
+        await self._sqlite.run(self._put_many, rows)
+
+    async def close_async(self) -> None:
+        await self._sqlite.close_async()
+
+    def _get_many(self, keys: List[str]) -> List[Optional[ndarray]]:
+        found = {}
+        for start in range(0, len(keys), self._LOOKUP_BATCH):
+            batch = keys[start : start + self._LOOKUP_BATCH]
+            placeholders = ", ".join("?" * len(batch))
+            found.update(
+                self._sqlite.connection.execute(
+                    f"SELECT key, embedding FROM embedding_cache "
+                    f"WHERE key IN ({placeholders})",
+                    batch,
+                ).fetchall()
+            )
+
+        return [
+            frombuffer(found[key], dtype=float32) if key in found else None
+            for key in keys
+        ]
+
+    def _put_many(self, rows: List[Any]) -> None:
+        # Vectors are deterministic per key, so whichever process wins a
+        # race for the same key writes the same value.
+        with self._sqlite.connection as connection:
+            connection.executemany(
+                "INSERT OR IGNORE INTO embedding_cache (key, embedding) VALUES (?, ?)",
+                rows,
+            )
@@ -230,7 +230,9 @@ class Kernel:
         if embeddings_generator is None:
             raise ValueError("The embedding generator cannot be `None`")
 
-        self.register_memory(SemanticTextMemory(storage, embeddings_generator))
+        self.register_memory(
+            SemanticTextMemory(storage, embeddings_generator, logger=self._log)
+        )
 
     def register_memory(self, memory: SemanticTextMemory):
         self._memory = memory
@@ -28,4 +28,6 @@ class MemoryConfiguration(ExtendsKernel):
         if embeddings_generator is None:
             raise ValueError("The embedding generator cannot be `None`")
 
-        kernel.register_memory(SemanticTextMemory(storage, embeddings_generator))
+        kernel.register_memory(
+            SemanticTextMemory(storage, embeddings_generator, logger=kernel.logger)
+        )
@@ -0,0 +1,160 @@
+import re
+from collections import Counter
+from math import log
+from typing import Dict, List, Optional, Tuple
+
+from numpy import fromiter, int64, nan, ndarray, zeros
+
+from semantic_kernel.memory.memory_filter import MemoryFilter
+from semantic_kernel.memory.memory_record import MemoryRecord
+from semantic_kernel.memory.metadata_index import MetadataIndex
+from semantic_kernel.memory.similarity import top_k_indices
+
+class Bm25Index:
+    """
+    Incrementally maintained BM25 index over the text and description of
+    the records of a memory collection. Each term's postings are turned into
+    NumPy arrays on the first query after they change, so scoring is a few
+    vectorized passes.
+    """
+
+    INITIAL_CAPACITY = 16
+    TOKEN_PATTERN = re.compile(r"\w+")
+
+    _k1: float
+    _b: float
+
+    _slots: Dict[str, int]
+    _keys: List[Optional[str]]
+    _metadata: MetadataIndex
+    _terms: List[Optional[Dict[str, int]]]
+    _lengths: ndarray
+    _free_slots: List[int]
+    _total_length: int
+    _postings: Dict[str, Dict[int, int]]
+    _columns: Dict[str, Tuple[ndarray, ndarray]]
+
+    def __init__(self, k1: float = 1.2, b: float = 0.75) -> None:
+        self._k1 = k1
+        self._b = b
+
+        self._slots = {}
+        self._keys = []
+        self._metadata = MetadataIndex()
+        self._terms = []
+        self._lengths = zeros((self.INITIAL_CAPACITY,), dtype=float)
+        self._free_slots = []
+        self._total_length = 0
+        self._postings = {}
+        self._columns = {}
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._slots
+
+    @classmethod
+    def tokenize(cls, text: Optional[str]) -> List[str]:
+        if not text:
+            return []
+        return cls.TOKEN_PATTERN.findall(text.lower())
+
+    def upsert(self, key: str, record: MemoryRecord) -> None:
+        self.remove(key)
+
+        counts = Counter(self.tokenize(record.text))
+        counts.update(self.tokenize(record.description))
+
+        if self._free_slots:
+            slot = self._free_slots.pop()
+        else:
+            slot = len(self._keys)
+            self._keys.append(None)
+            self._terms.append(None)
+            if slot >= self._lengths.shape[0]:
+                lengths = zeros((2 * self._lengths.shape[0],), dtype=float)
+                lengths[:slot] = self._lengths[:slot]
+                self._lengths = lengths
+
+        length = sum(counts.values())
+        self._slots[key] = slot
+        self._keys[slot] = key
+        self._metadata.set(slot, record)
+        self._terms[slot] = dict(counts)
+        self._lengths[slot] = length
+        self._total_length += length
+
+        for term, count in counts.items():
+            self._postings.setdefault(term, {})[slot] = count
+            self._columns.pop(term, None)
+
+    def remove(self, key: str) -> None:
+        slot = self._slots.pop(key, None)
+        if slot is None:
+            return
+
+        for term in self._terms[slot]:
+            postings = self._postings[term]
+            del postings[slot]
+            if not postings:
+                del self._postings[term]
+            self._columns.pop(term, None)
+
+        self._total_length -= int(self._lengths[slot])
+        self._lengths[slot] = 0
+        self._keys[slot] = None
+        self._terms[slot] = None
+        self._free_slots.append(slot)
+
+    def search(
+        self, query: str, limit: int, filter: Optional[MemoryFilter] = None
+    ) -> List[Tuple[str, float]]:
+        """
+        Finds the `limit` records with the highest BM25 score for a query, as
+        (key, score) pairs; records sharing no term with it are never returned.
+        """
+        count = len(self._slots)
+        if count == 0 or self._total_length == 0:
+            return []
+
+        average_length = self._total_length / count
+        scores = zeros((len(self._keys),), dtype=float)
+        for term in set(self.tokenize(query)):
+            column = self._column(term)
+            if column is None:
+                continue
+
+            slots, frequencies = column
+            idf = log(1 + (count - len(slots) + 0.5) / (len(slots) + 0.5))
+            length_norms = self._k1 * (
+                1 - self._b + self._b * self._lengths[slots] / average_length
+            )
+            scores[slots] += (
+                idf * frequencies * (self._k1 + 1) / (frequencies + length_norms)
+            )
+
+        scores[scores <= 0] = nan
+        if filter is not None:
+            scores[~self._metadata.mask(filter, len(self._keys), self._slots)] = nan
+
+        return [
+            (self._keys[slot], scores[slot])
+            for slot in top_k_indices(scores, limit, 0.0)
+        ]
+
+    def _column(self, term: str) -> Optional[Tuple[ndarray, ndarray]]:
+        column = self._columns.get(term)
+        if column is not None:
+            return column
+
+        postings = self._postings.get(term)
+        if postings is None:
+            return None
+
+        column = (
+            fromiter(postings.keys(), dtype=int64, count=len(postings)),
+            fromiter(postings.values(), dtype=float, count=len(postings)),
+        )
+        self._columns[term] = column
+        return column
@@ -0,0 +1,461 @@
+from typing import Dict, List, Optional, Tuple
+
+from numpy import (
+    arange,
+    asarray,
+    concatenate,
+    dtype as numpy_dtype,
+    empty,
+    flatnonzero,
+    float32,
+    int64,
+    linalg,
+    memmap,
+    ndarray,
+    result_type,
+    searchsorted,
+    stack,
+    where,
+    zeros,
+)
+from numpy.typing import DTypeLike
+
+from semantic_kernel.memory.memory_filter import MemoryFilter
+from semantic_kernel.memory.memory_record import MemoryRecord
+from semantic_kernel.memory.metadata_index import MetadataIndex
+from semantic_kernel.memory.similarity import score_rows
+
+def with_embedding(record: MemoryRecord, embedding: Optional[ndarray]) -> MemoryRecord:
+    return MemoryRecord(
+        is_reference=record.is_reference,
+        external_source_name=record.external_source_name,
+        id=record.id,
+        description=record.description,
+        text=record.text,
+        embedding=embedding,
+    )
+
+class CollectionView:
+    """
+    The rows of a CollectionIndex as they were when the view was taken.
+    Growth and compaction give the index new arrays, so a view can be
+    searched on another thread while the index changes; `record` restores a
+    stored record's embedding from its row.
+    """
+
+    embeddings: Optional[ndarray]
+    norms: ndarray
+    live: ndarray
+    records: List[Optional[MemoryRecord]]
+    keys: List[Optional[str]]
+    codes: Optional[ndarray]
+    low: Optional[ndarray]
+    scale: Optional[ndarray]
+
+    def __init__(
+        self,
+        embeddings: Optional[ndarray],
+        norms: ndarray,
+        live: ndarray,
+        records: List[Optional[MemoryRecord]],
+        keys: List[Optional[str]],
+        codes: Optional[ndarray] = None,
+        low: Optional[ndarray] = None,
+        scale: Optional[ndarray] = None,
+    ) -> None:
+        self.embeddings = embeddings
+        self.norms = norms
+        self.live = live
+        self.records = records
+        self.keys = keys
+        self.codes = codes
+        self.low = low
+        self.scale = scale
+
+    def __len__(self) -> int:
+        return self.live.shape[0]
+
+    def record(self, row: int) -> Optional[MemoryRecord]:
+        stored = self.records[row]
+        if stored is None:
+            return None
+        return with_embedding(
+            stored, self.embeddings[row].astype(float) * self.norms[row]
+        )
+
+    def rows(self, start: int, end: int) -> "CollectionView":
+        """
+        A view of the rows from `start` to `end`, without their records.
+        """
+        return CollectionView(
+            self.embeddings[start:end],
+            self.norms[start:end],
+            self.live[start:end],
+            [],
+            [],
+            self.codes[start:end] if self.codes is not None else None,
+            self.low,
+            self.scale,
+        )
+
+    def approximate_scores(
+        self, queries: ndarray, rows: Optional[ndarray] = None
+    ) -> ndarray:
+        # q.x ~= q.(low + scale * (code + 128)), so the codes only need to be
+        # multiplied by the scaled query and offset by a per-query constant.
+        queries = queries.astype(float32, copy=False)
+        weights = queries * self.scale
+        offsets = queries.dot(self.low + 128 * self.scale)
+        codes = self.codes if rows is None else self.codes[rows]
+        return score_rows(weights, codes) + offsets.reshape(-1, 1)
+
+    def exact_scores(self, query: ndarray, rows: ndarray) -> Tuple[ndarray, ndarray]:
+        """
+        Scores the given rows against their full-precision embeddings, for
+        the normalized `query`; rows removed meanwhile are dropped.
+        """
+        rows = rows[self.live[rows]]
+        scores = score_rows(query.reshape(1, -1), self.embeddings[rows])[0]
+        scores[self.norms[rows] == 0] = -1.0
+        return rows, scores
+
+class CollectionIndex:
+    """
+    Contiguous, L2-normalized embedding matrix of a memory collection, with
+    the original norms, the keys and the records (stored without their
+    embedding) kept in step, and a MetadataIndex turning filters into row
+    masks. Removes only clear a row's `live` bit; compaction rewrites the
+    matrix without the dead rows, and its copy can run on another thread
+    between `begin_compaction` and `finish_compaction`.
+    """
+
+    INITIAL_CAPACITY = 16
+    GROWTH_FACTOR = 1.25
+    COMPACTION_RATIO = 0.25
+    COMPACTION_MIN_DEAD_ROWS = 64
+    # Rows copied at a time when compacting.
+    COPY_BLOCK_ROWS = 65536
+
+    _dtype: numpy_dtype
+    _dimension: Optional[int]
+    _matrix: Optional[ndarray]
+    _norms: Optional[ndarray]
+    _live: ndarray
+    _keys: List[Optional[str]]
+    _records: List[Optional[MemoryRecord]]
+    _rows: Dict[str, int]
+    _metadata: MetadataIndex
+
+    _compaction_size: Optional[int]
+    _overwritten: Optional[List[int]]
+
+    def __init__(self, dtype: DTypeLike = float32) -> None:
+        self._dtype = numpy_dtype(dtype)
+        self._dimension = None
+        self._matrix = None
+        self._norms = None
+        self._compaction_size = None
+        self._overwritten = None
+        self._clear()
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._rows
+
+    @property
+    def dtype(self) -> numpy_dtype:
+        return self._dtype
+
+    @property
+    def size(self) -> int:
+        # Rows in use, dead ones included.
+        return len(self._keys)
+
+    @property
+    def embeddings(self) -> ndarray:
+        if self._matrix is None:
+            return empty((0, 0), dtype=self._dtype)
+        return self._matrix[: len(self._keys)]
+
+    @property
+    def norms(self) -> ndarray:
+        if self._norms is None:
+            return empty((0,), dtype=float)
+        return self._norms[: len(self._keys)]
+
+    @property
+    def live(self) -> ndarray:
+        return self._live[: len(self._keys)]
+
+    @property
+    def keys(self) -> List[Optional[str]]:
+        return self._keys
+
+    @property
+    def records(self) -> List[Optional[MemoryRecord]]:
+        # As stored, without their embedding.
+        return self._records
+
+    @property
+    def row_bytes(self) -> int:
+        # The bytes a row takes in the row-aligned arrays held in memory.
+        if self._norms is None:
+            return 0
+        return sum(
+            array.nbytes // array.shape[0]
+            for array in self._row_arrays()
+            if not isinstance(array, memmap)
+        ) + self._live.itemsize
+
+    @property
+    def dead_rows(self) -> int:
+        return len(self._keys) - len(self._rows)
+
+    @property
+    def needs_compaction(self) -> bool:
+        dead_rows = self.dead_rows
+        return (
+            dead_rows >= self.COMPACTION_MIN_DEAD_ROWS
+            and dead_rows >= self.COMPACTION_RATIO * len(self._keys)
+        )
+
+    def view(self) -> CollectionView:
+        return CollectionView(
+            self.embeddings, self.norms, self.live, self._records, self._keys
+        )
+
+    def get_record(self, key: str) -> Optional[MemoryRecord]:
+        return self.get_records([key])[0]
+
+    def get_records(self, keys: List[str]) -> List[Optional[MemoryRecord]]:
+        # The embeddings of all the rows found are restored in one pass.
+        view = self.view()
+        rows = [self._rows.get(key) for key in keys]
+        found = [row for row in rows if row is not None]
+        embeddings = iter(
+            view.embeddings[found].astype(float) * view.norms[found].reshape(-1, 1)
+        )
+        return [
+            with_embedding(view.records[row], next(embeddings))
+            if row is not None
+            else None
+            for row in rows
+        ]
+
+    def get_vectors(self, keys: List[str]) -> ndarray:
+        """
+        The embeddings of the given records, restored from their rows, as
+        one matrix in the precision of the index (at least float32).
+        """
+        rows = [self._rows[key] for key in keys]
+        vectors = self.embeddings[rows].astype(result_type(self._dtype, float32))
+        vectors *= self.norms[rows].reshape(-1, 1)
+        return vectors
+
+    def mask(self, filter: MemoryFilter) -> ndarray:
+        return self._metadata.mask(filter, len(self._keys), self._rows) & self.live
+
+    def upsert(self, key: str, record: MemoryRecord) -> None:
+        self.upsert_many([key], [record])
+
+    def upsert_many(
+        self,
+        keys: List[str],
+        records: List[MemoryRecord],
+        vectors: Optional[ndarray] = None,
+    ) -> List[int]:
+        """
+        Inserts or replaces many records at once, normalizing their embeddings
+        (or `vectors`, when given) in one pass, and returns their rows.
+        """
+        if not keys:
+            return []
+
+        if vectors is None:
+            vectors = stack(
+                [
+                    asarray(record.embedding, dtype=float).reshape(-1)
+                    for record in records
+                ]
+            )
+
+        if self._dimension is None or (
+            len(self._rows) == 0 and self._dimension != vectors.shape[1]
+        ):
+            self._clear()
+            self._allocate(vectors.shape[1])
+        elif self._dimension != vectors.shape[1]:
+            raise ValueError(
+                f"Embedding dimension {vectors.shape[1]} does not match "
+                f"the collection dimension {self._dimension}"
+            )
+
+        self._reserve(len(self._keys) + len(set(keys).difference(self._rows)))
+        rows = []
+        for key, record, vector in zip(keys, records, vectors):
+            stored = self._stored_record(record, vector)
+            row = self._rows.get(key)
+            if row is None:
+                row = len(self._keys)
+                self._rows[key] = row
+                self._keys.append(key)
+                self._records.append(stored)
+                self._live[row] = True
+            else:
+                self._records[row] = stored
+                if self._overwritten is not None and row < self._compaction_size:
+                    self._overwritten.append(row)
+            self._metadata.set(row, record)
+            rows.append(row)
+
+        norms = linalg.norm(vectors, axis=1)
+        self._norms[rows] = norms
+        self._write_rows(rows, vectors / where(norms == 0, 1.0, norms).reshape(-1, 1))
+        return rows
+
+    def remove(self, key: str) -> None:
+        row = self._rows.pop(key, None)
+        if row is None:
+            return
+
+        self._live[row] = False
+        self._keys[row] = None
+        self._records[row] = None
+
+    def compact(self) -> None:
+        """
+        Rewrites the rows without the dead ones, in one step.
+        """
+        rows = self.begin_compaction()
+        self.finish_compaction(rows, self.copy_rows(rows))
+
+    def begin_compaction(self) -> ndarray:
+        """
+        Starts a compaction and returns the rows live now, for `copy_rows`;
+        rows written from now on are tracked for `finish_compaction`.
+        """
+        self._compaction_size = len(self._keys)
+        self._overwritten = []
+        return flatnonzero(self.live)
+
+    def copy_rows(self, rows: ndarray) -> List[ndarray]:
+        """
+        Copies the given rows of every row-aligned array into new arrays,
+        with room to grow. Only reads the index, so it may run on another
+        thread.
+        """
+        if self._norms is None:
+            return []
+
+        capacity = max(self.INITIAL_CAPACITY, int(len(rows) * self.GROWTH_FACTOR))
+        copies = []
+        for current in self._row_arrays():
+            copy = self._new_row_array(current, capacity)
+            for start in range(0, len(rows), self.COPY_BLOCK_ROWS):
+                block = rows[start : start + self.COPY_BLOCK_ROWS]
+                copy[start : start + len(block)] = current[block]
+            copies.append(copy)
+        return copies
+
+    def finish_compaction(self, rows: ndarray, copies: List[ndarray]) -> None:
+        """
+        Replaces the arrays with the compacted copies, adding the rows
+        appended and re-copying the rows overwritten since
+        `begin_compaction`. Rows removed meanwhile stay as dead rows.
+        """
+        size, overwritten = self._compaction_size, self._overwritten
+        self._compaction_size = None
+        self._overwritten = None
+        if size is None or self._norms is None or len(copies) != len(
+            self._row_arrays()
+        ):
+            return
+
+        appended = arange(size, len(self._keys), dtype=int64)
+        kept = concatenate([rows.astype(int64), appended])
+        capacity = max(self.INITIAL_CAPACITY, int(len(kept) * self.GROWTH_FACTOR))
+        if copies and copies[0].shape[0] >= len(kept):
+            capacity = copies[0].shape[0]
+
+        # Overwritten rows that were copied, and where they now live.
+        overwritten = asarray(sorted(set(overwritten)), dtype=int64)
+        positions = searchsorted(rows, overwritten)
+        copied = positions < len(rows)
+        copied[copied] = rows[positions[copied]] == overwritten[copied]
+        sources, targets = overwritten[copied], positions[copied]
+
+        arrays = []
+        for current, copy in zip(self._row_arrays(), copies):
+            array = copy
+            if copy.shape[0] < capacity:
+                array = self._new_row_array(current, capacity)
+                array[: len(rows)] = copy[: len(rows)]
+            array[len(rows) : len(kept)] = current[appended]
+            array[targets] = current[sources]
+            arrays.append(array)
+
+        live = zeros((capacity,), dtype=bool)
+        live[: len(kept)] = self._live[kept]
+
+        kept_rows = kept.tolist()
+        self._keys = [self._keys[row] for row in kept_rows]
+        self._records = [self._records[row] for row in kept_rows]
+        self._rows = {key: row for row, key in enumerate(self._keys) if key is not None}
+        self._metadata.select(kept)
+        self._live = live
+        self._set_row_arrays(arrays)
+
+    def _allocate(self, dimension: int) -> None:
+        self._dimension = dimension
+        self._matrix = empty((self.INITIAL_CAPACITY, dimension), dtype=self._dtype)
+        self._norms = empty((self.INITIAL_CAPACITY,), dtype=float)
+
+    def _stored_record(self, record: MemoryRecord, vector: ndarray) -> MemoryRecord:
+        # The matrix holds the embedding, so the record is kept without it.
+        return with_embedding(record, None)
+
+    def _write_rows(self, rows: List[int], vectors: ndarray) -> None:
+        # `vectors` are the normalized embeddings of `rows`.
+        self._matrix[rows] = vectors
+
+    def _new_row_array(self, current: ndarray, capacity: int) -> ndarray:
+        # An uninitialized array like `current`, with `capacity` rows.
+        return empty((capacity,) + current.shape[1:], dtype=current.dtype)
+
+    def _row_arrays(self) -> List[ndarray]:
+        # The arrays holding one entry per row, besides the live mask.
+        return [self._matrix, self._norms]
+
+    def _set_row_arrays(self, arrays: List[ndarray]) -> None:
+        self._matrix, self._norms = arrays[0], arrays[1]
+
+    def _clear(self) -> None:
+        self._live = zeros((self.INITIAL_CAPACITY,), dtype=bool)
+        self._keys = []
+        self._records = []
+        self._rows = {}
+        self._metadata = MetadataIndex()
+        # A compaction in flight no longer matches the rows.
+        self._compaction_size = None
+        self._overwritten = None
+
+    def _reserve(self, size: int) -> None:
+        capacity = self._norms.shape[0]
+        if size <= capacity:
+            return
+
+        capacity = max(size, int(capacity * self.GROWTH_FACTOR))
+
+        size = len(self._keys)
+        arrays = []
+        for current in self._row_arrays():
+            array = self._new_row_array(current, capacity)
+            array[:size] = current[:size]
+            arrays.append(array)
+        self._set_row_arrays(arrays)
+
+        live = zeros((capacity,), dtype=bool)
+        live[:size] = self._live[:size]
+        self._live = live
@@ -0,0 +1,256 @@
+from datetime import datetime
+from logging import Logger
+from typing import Dict, List, Optional, Tuple
+
+from numpy import empty, flatnonzero, float32, int64, ndarray
+from numpy.typing import DTypeLike
+
+from semantic_kernel.memory.collection_index import CollectionIndex
+from semantic_kernel.memory.memory_filter import MemoryFilter
+from semantic_kernel.memory.memory_record import MemoryRecord
+from semantic_kernel.memory.memory_store_base import MemoryStoreBase
+from semantic_kernel.memory.similarity import normalize_queries, top_k_rows
+from semantic_kernel.memory.storage.data_entry import DataEntry
+from semantic_kernel.memory.storage.string_column import StringColumn
+
+from semantic_kernel.utils.null_logger import NullLogger
+
+class ColumnarCollection(CollectionIndex):
+    """
+    A CollectionIndex keeping its records as columns instead of objects:
+    strings in StringColumns, reference flags and timestamps in arrays.
+    Entries and records are only built for the rows read, and overwritten
+    rows count towards compaction, as their old strings stay behind.
+    """
+
+    _ids: StringColumn
+    _texts: StringColumn
+    _descriptions: StringColumn
+    _sources: StringColumn
+    _is_reference: Optional[ndarray]
+    _timestamps: Optional[ndarray]
+    _overwritten_rows: int
+
+    def __init__(self, dtype: DTypeLike = float32) -> None:
+        self._is_reference = None
+        self._timestamps = None
+        super().__init__(dtype)
+
+    @property
+    def size_bytes(self) -> int:
+        # The columns only; the key -> row dictionary is not counted.
+        size = sum(column.size_bytes for column in self._string_columns())
+        arrays = [self._live]
+        if self._norms is not None:
+            arrays.extend(self._row_arrays())
+        return size + sum(array.nbytes for array in arrays)
+
+    @property
+    def needs_compaction(self) -> bool:
+        stale_rows = self.dead_rows + self._overwritten_rows
+        return (
+            stale_rows >= self.COMPACTION_MIN_DEAD_ROWS
+            and stale_rows >= self.COMPACTION_RATIO * len(self._keys)
+        )
+
+    def get(self, key: str) -> Optional[DataEntry]:
+        row = self._rows.get(key)
+        if row is None:
+            return None
+        return self.entry(row)
+
+    def get_all(self) -> List[DataEntry]:
+        return [self.entry(row) for row in sorted(self._rows.values())]
+
+    def get_records(self, keys: List[str]) -> List[Optional[MemoryRecord]]:
+        rows = [self._rows.get(key) for key in keys]
+        return [self.record(row) if row is not None else None for row in rows]
+
+    def entry(self, row: int) -> DataEntry:
+        return DataEntry(
+            self._keys[row],
+            self.record(row),
+            datetime.fromtimestamp(int(self._timestamps[row]) / 1e6),
+        )
+
+    def record(self, row: int) -> MemoryRecord:
+        return MemoryRecord(
+            is_reference=bool(self._is_reference[row]),
+            external_source_name=self._sources.get(row),
+            id=self._ids.get(row),
+            description=self._descriptions.get(row),
+            text=self._texts.get(row),
+            embedding=self._matrix[row].astype(float) * self._norms[row],
+        )
+
+    def put_many(self, entries: List[DataEntry]) -> None:
+        size = len(self._rows)
+        rows = self.upsert_many(
+            [entry.key for entry in entries], [entry.value for entry in entries]
+        )
+        self._overwritten_rows += len(rows) - (len(self._rows) - size)
+
+        for entry, row in zip(entries, rows):
+            record = entry.value
+            self._ids.set(row, record.id)
+            self._texts.set(row, record.text)
+            self._descriptions.set(row, record.description)
+            self._sources.set(row, record.external_source_name)
+            self._is_reference[row] = record.is_reference
+            self._timestamps[row] = int(round(entry.timestamp.timestamp() * 1e6))
+        self._compact_if_due()
+
+    def remove(self, key: str) -> None:
+        super().remove(key)
+        self._compact_if_due()
+
+    def search(
+        self,
+        queries: ndarray,
+        limit: int,
+        min_relevance_score: float,
+        filter: Optional[MemoryFilter] = None,
+    ) -> List[List[Tuple[MemoryRecord, float]]]:
+        if len(self._rows) == 0:
+            return [[] for _ in range(queries.shape[0])]
+
+        results = top_k_rows(
+            queries,
+            self.embeddings,
+            self.norms,
+            limit,
+            min_relevance_score,
+            None if filter is None else flatnonzero(self.mask(filter)),
+            self.live,
+        )
+        return [
+            [(self.record(row), score) for row, score in zip(rows, scores)]
+            for rows, scores in results
+        ]
+
+    def compact(self) -> None:
+        # Only run in one step, so the live rows now are the rows kept.
+        rows = flatnonzero(self.live).tolist()
+        super().compact()
+        self._ids, self._texts, self._descriptions, self._sources = (
+            column.select(rows) for column in self._string_columns()
+        )
+        self._overwritten_rows = 0
+
+    def _compact_if_due(self) -> None:
+        if self.needs_compaction:
+            self.compact()
+
+    def _allocate(self, dimension: int) -> None:
+        super()._allocate(dimension)
+        self._is_reference = empty((self.INITIAL_CAPACITY,), dtype=bool)
+        self._timestamps = empty((self.INITIAL_CAPACITY,), dtype=int64)
+
+    def _stored_record(self, record: MemoryRecord, vector: ndarray) -> None:
+        # The columns hold the record.
+        return None
+
+    def _row_arrays(self) -> List[ndarray]:
+        return super()._row_arrays() + [self._is_reference, self._timestamps]
+
+    def _set_row_arrays(self, arrays: List[ndarray]) -> None:
+        super()._set_row_arrays(arrays)
+        self._is_reference, self._timestamps = arrays[2], arrays[3]
+
+    def _string_columns(self) -> List[StringColumn]:
+        return [self._ids, self._texts, self._descriptions, self._sources]
+
+    def _clear(self) -> None:
+        super()._clear()
+        self._ids = StringColumn()
+        self._texts = StringColumn()
+        self._descriptions = StringColumn()
+        self._sources = StringColumn()
+        self._overwritten_rows = 0
+
+class ColumnarMemoryStore(MemoryStoreBase):
+    """
+    In-memory store that keeps each collection as a ColumnarCollection, so
+    a stored record costs its vector, its characters and a few fixed-size
+    column entries rather than a DataEntry, a MemoryRecord and their
+    attribute objects. Entries and records are materialized on read;
+    embeddings come back in the precision of `dtype`.
+    """
+
+    _dtype: DTypeLike
+    _collections: Dict[str, ColumnarCollection]
+
+    def __init__(
+        self, logger: Optional[Logger] = None, dtype: DTypeLike = float32
+    ) -> None:
+        self._dtype = dtype
+        self._collections = {}
+        self._logger = logger or NullLogger()
+
+    async def get_collections_async(self) -> List[str]:
+        return list(self._collections.keys())
+
+    async def get_all_async(self, collection: str) -> List[DataEntry]:
+        if collection not in self._collections:
+            return []
+
+        return self._collections[collection].get_all()
+
+    async def get_async(self, collection: str, key: str) -> Optional[DataEntry]:
+        if collection not in self._collections:
+            return None
+
+        return self._collections[collection].get(key)
+
+    async def put_async(self, collection: str, value: DataEntry) -> DataEntry:
+        await self.put_many_async(collection, [value])
+        return value
+
+    async def put_many_async(
+        self, collection: str, values: List[DataEntry]
+    ) -> List[DataEntry]:
+        if collection not in self._collections:
+            self._collections[collection] = ColumnarCollection(self._dtype)
+        self._collections[collection].put_many(values)
+
+        return values
+
+    async def remove_async(self, collection: str, key: str) -> None:
+        if collection not in self._collections:
+            return
+
+        self._collections[collection].remove(key)
+
+    async def get_nearest_matches_async(
+        self,
+        collection: str,
+        embedding: ndarray,
+        limit: int = 1,
+        min_relevance_score: float = 0.7,
+        filter: Optional[MemoryFilter] = None,
+    ) -> List[Tuple[MemoryRecord, float]]:
+        results = await self.get_nearest_matches_batch_async(
+            collection, embedding.reshape(1, -1), limit, min_relevance_score, filter
+        )
+        return results[0]
+
+    async def get_nearest_matches_batch_async(
+        self,
+        collection: str,
+        embeddings: ndarray,
+        limit: int = 1,
+        min_relevance_score: float = 0.7,
+        filter: Optional[MemoryFilter] = None,
+    ) -> List[List[Tuple[MemoryRecord, float]]]:
+        embeddings = embeddings.reshape(embeddings.shape[0], -1)
+
+        store = self._collections.get(collection)
+        if store is None or len(store) == 0:
+            return [[] for _ in range(embeddings.shape[0])]
+
+        return store.search(
+            normalize_queries(embeddings),
+            limit,
+            min_relevance_score,
+            filter,
+        )
@@ -0,0 +1,330 @@
+import asyncio
+import json
+import os
+import shutil
+from datetime import datetime
+from logging import Logger
+from struct import Struct
+from typing import IO, Any, Dict, List, Optional, Tuple
+
+from numpy import asarray, empty, float32, frombuffer, load, ndarray, save
+from numpy.typing import DTypeLike
+
+from semantic_kernel.memory.memory_record import MemoryRecord
+from semantic_kernel.memory.storage.binary_record import (
+    LENGTH,
+    pack_string,
+    unpack_string,
+)
+from semantic_kernel.memory.storage.data_entry import DataEntry
+from semantic_kernel.memory.storage.write_ahead_log import WriteAheadLog
+from semantic_kernel.memory.volatile_memory_store import VolatileMemoryStore
+
+_PUT = 1
+_REMOVE = 2
+
+_OP = Struct("<B")
+_PUT_FIELDS = Struct("<dB")
+
+def _sync(fp: IO) -> None:
+    fp.flush()
+    os.fsync(fp.fileno())
+
+def _sync_directory(path: str) -> None:
+    descriptor = os.open(path, os.O_RDONLY)
+    try:
+        os.fsync(descriptor)
+    finally:
+        os.close(descriptor)
+
+def _encode_put(collection: str, entry: DataEntry) -> bytes:
+    record = entry.value
+    embedding = asarray(record.embedding, dtype=float32).reshape(-1)
+    return b"".join(
+        [
+            _OP.pack(_PUT),
+            pack_string(collection),
+            pack_string(entry.key),
+            _PUT_FIELDS.pack(entry.timestamp.timestamp(), int(record.is_reference)),
+            pack_string(record.external_source_name),
+            pack_string(record.id),
+            pack_string(record.description),
+            pack_string(record.text),
+            LENGTH.pack(embedding.shape[0]),
+            embedding.tobytes(),
+        ]
+    )
+
+def _encode_remove(collection: str, key: str) -> bytes:
+    return _OP.pack(_REMOVE) + pack_string(collection) + pack_string(key)
+
+def _decode(payload: bytes) -> Tuple[int, str, Any]:
+    (op,) = _OP.unpack_from(payload, 0)
+    collection, offset = unpack_string(payload, _OP.size)
+    key, offset = unpack_string(payload, offset)
+    if op == _REMOVE:
+        return op, collection, key
+
+    timestamp, is_reference = _PUT_FIELDS.unpack_from(payload, offset)
+    offset += _PUT_FIELDS.size
+    external_source_name, offset = unpack_string(payload, offset)
+    id, offset = unpack_string(payload, offset)
+    description, offset = unpack_string(payload, offset)
+    text, offset = unpack_string(payload, offset)
+    (dimension,) = LENGTH.unpack_from(payload, offset)
+    offset += LENGTH.size
+    embedding = frombuffer(payload, dtype=float32, count=dimension, offset=offset)
+
+    record = MemoryRecord(
+        bool(is_reference), external_source_name, id, description, text, embedding.copy()
+    )
+    return op, collection, DataEntry(key, record, datetime.fromtimestamp(timestamp))
+
+class DurableMemoryStore(VolatileMemoryStore):
+    """
+    VolatileMemoryStore that survives restarts without re-embedding: every
+    put and remove is group-committed to a write-ahead log under `directory`,
+    and once a log segment passes `snapshot_bytes` the collections are
+    snapshotted and the log they cover removed. Collection dtype,
+    quantization and lexical index options are not persisted.
+    """
+
+    SNAPSHOT_PREFIX = "snapshot-"
+    MANIFEST_FILE = "manifest.json"
+    RECOVERY_BATCH_SIZE = 65536
+
+    _directory: str
+    _wal: WriteAheadLog
+    _snapshot_bytes: int
+    _wait_for_commit: bool
+    _snapshot_task: Optional[asyncio.Task]
+
+    def __init__(
+        self,
+        directory: str,
+        logger: Optional[Logger] = None,
+        dtype: DTypeLike = float32,
+        quantized: bool = False,
+        commit_interval: float = 0.005,
+        snapshot_bytes: int = 64 * 1024 * 1024,
+        wait_for_commit: bool = False,
+        lexical_index: bool = False,
+    ) -> None:
+        super().__init__(logger, dtype, quantized, lexical_index=lexical_index)
+        os.makedirs(directory, exist_ok=True)
+        self._directory = directory
+        self._wal = WriteAheadLog(
+            os.path.join(directory, "wal"), commit_interval, self._logger
+        )
+        self._snapshot_bytes = snapshot_bytes
+        self._wait_for_commit = wait_for_commit
+        self._snapshot_task = None
+
+        self._recover()
+
+    async def put_async(self, collection: str, value: DataEntry) -> DataEntry:
+        entry = await super().put_async(collection, value)
+        await self._log(_encode_put(collection, entry))
+
+        return entry
+
+    async def put_many_async(
+        self, collection: str, values: List[DataEntry]
+    ) -> List[DataEntry]:
+        entries = await super().put_many_async(collection, values)
+        for entry in entries:
+            await self._log(_encode_put(collection, entry))
+
+        return entries
+
+    async def remove_async(self, collection: str, key: str) -> None:
+        if collection not in self._store or key not in self._store[collection]:
+            return
+
+        await super().remove_async(collection, key)
+        await self._log(_encode_remove(collection, key))
+
+    async def flush_async(self) -> None:
+        await self._wal.flush_async()
+
+    async def snapshot_async(self) -> None:
+        if self._snapshot_task is not None:
+            await asyncio.shield(self._snapshot_task)
+            return
+
+        self._snapshot_task = asyncio.get_running_loop().create_task(
+            self._write_snapshot_async()
+        )
+        try:
+            await asyncio.shield(self._snapshot_task)
+        finally:
+            self._snapshot_task = None
+
+    async def close_async(self) -> None:
+        if self._snapshot_task is not None:
+            await asyncio.shield(self._snapshot_task)
+        await self._wal.close_async()
+        await super().close_async()
+
+    async def _log(self, payload: bytes) -> None:
+        commit = self._wal.append(payload)
+        if self._wait_for_commit:
+            await commit
+
+        if self._wal.segment_bytes >= self._snapshot_bytes and self._snapshot_task is None:
+            self._snapshot_task = asyncio.get_running_loop().create_task(
+                self._snapshot_in_background()
+            )
+
+    async def _snapshot_in_background(self) -> None:
+        try:
+            await self._write_snapshot_async()
+        except Exception as e:
+            self._logger.error(f"Writing a memory snapshot failed: {e}")
+        finally:
+            self._snapshot_task = None
+
+    async def _write_snapshot_async(self) -> None:
+        # Everything logged before the rotation is in an older segment and
+        # in the state captured right after it. Replaying the new segment on
+        # top of the snapshot is safe because puts and removes are idempotent.
+        segment = await self._wal.rotate_async()
+
+        collections = []
+        for collection, entries in self._store.items():
+            # Stored records hold no embedding; the index restores them.
+            metadata = [
+                {
+                    "key": entry.key,
+                    "timestamp": entry.timestamp.timestamp(),
+                    "is_reference": entry.value.is_reference,
+                    "external_source_name": entry.value.external_source_name,
+                    "id": entry.value.id,
+                    "description": entry.value.description,
+                    "text": entry.value.text,
+                }
+                for entry in entries.values()
+            ]
+            embeddings = (
+                self._indexes[collection]
+                .get_vectors(list(entries.keys()))
+                .astype(float32, copy=False)
+                if entries
+                else empty((0, 0), dtype=float32)
+            )
+            collections.append((collection, metadata, embeddings))
+
+        await asyncio.get_running_loop().run_in_executor(
+            None, self._write_snapshot, segment, collections
+        )
+        self._wal.remove_segments_before(segment)
+
+    def _write_snapshot(
+        self, segment: int, collections: List[Tuple[str, List[Dict[str, Any]], ndarray]]
+    ) -> None:
+        path = os.path.join(self._directory, f"{self.SNAPSHOT_PREFIX}{segment:08d}")
+        temporary_path = path + ".tmp"
+        shutil.rmtree(temporary_path, ignore_errors=True)
+        os.makedirs(temporary_path)
+
+        manifest: Dict[str, Any] = {"segment": segment, "collections": []}
+        for i, (collection, metadata, embeddings) in enumerate(collections):
+            with open(os.path.join(temporary_path, f"{i}.npy"), "wb") as fp:
+                save(fp, embeddings)
+                _sync(fp)
+            with open(os.path.join(temporary_path, f"{i}.json"), "w") as fp:
+                json.dump(metadata, fp)
+                _sync(fp)
+            manifest["collections"].append(
+                {"name": collection, "embeddings": f"{i}.npy", "records": f"{i}.json"}
+            )
+
+        with open(os.path.join(temporary_path, self.MANIFEST_FILE), "w") as fp:
+            json.dump(manifest, fp)
+            _sync(fp)
+        # The rename only publishes the snapshot once its files and both
+        # directory entries are on disk; the log is removed after that.
+        _sync_directory(temporary_path)
+        os.replace(temporary_path, path)
+        _sync_directory(self._directory)
+
+        for name in self._snapshot_names():
+            if name < os.path.basename(path):
+                shutil.rmtree(os.path.join(self._directory, name), ignore_errors=True)
+
+    def _snapshot_names(self) -> List[str]:
+        return sorted(
+            name
+            for name in os.listdir(self._directory)
+            if name.startswith(self.SNAPSHOT_PREFIX) and not name.endswith(".tmp")
+        )
+
+    def _recover(self) -> None:
+        first_segment = 0
+
+        snapshots = self._snapshot_names()
+        if snapshots:
+            path = os.path.join(self._directory, snapshots[-1])
+            with open(os.path.join(path, self.MANIFEST_FILE)) as fp:
+                manifest = json.load(fp)
+
+            for collection in manifest["collections"]:
+                with open(os.path.join(path, collection["records"])) as fp:
+                    metadata = json.load(fp)
+                embeddings = load(os.path.join(path, collection["embeddings"]))
+
+                self._store.setdefault(collection["name"], {})
+                self._restore_puts(
+                    collection["name"],
+                    [
+                        DataEntry(
+                            fields["key"],
+                            MemoryRecord(
+                                fields["is_reference"],
+                                fields["external_source_name"],
+                                fields["id"],
+                                fields["description"],
+                                fields["text"],
+                                embedding,
+                            ),
+                            datetime.fromtimestamp(fields["timestamp"]),
+                        )
+                        for fields, embedding in zip(metadata, embeddings)
+                    ],
+                )
+            first_segment = manifest["segment"]
+
+        # Replayed puts are indexed in batches per collection. A remove
+        # drops the put of its key still waiting in the batch, so the order
+        # of the log is kept.
+        pending: Dict[str, Dict[str, DataEntry]] = {}
+        for payload in self._wal.read(first_segment):
+            op, collection, value = _decode(payload)
+            batch = pending.setdefault(collection, {})
+            if op == _PUT:
+                batch[value.key] = value
+                if len(batch) >= self.RECOVERY_BATCH_SIZE:
+                    self._restore_puts(collection, list(batch.values()))
+                    batch.clear()
+            else:
+                batch.pop(value, None)
+                self._restore_remove(collection, value)
+        for collection, batch in pending.items():
+            self._restore_puts(collection, list(batch.values()))
+
+        for index in self._indexes.values():
+            if index.needs_compaction:
+                index.compact()
+
+    def _restore_puts(self, collection: str, entries: List[DataEntry]) -> None:
+        if not entries:
+            return
+
+        stored = self._index_entries(collection, entries)
+        self._store.setdefault(collection, {}).update(
+            (entry.key, entry) for entry in stored
+        )
+
+    def _restore_remove(self, collection: str, key: str) -> None:
+        self._unindex_entry(collection, key)
+        self._store.get(collection, {}).pop(key, None)
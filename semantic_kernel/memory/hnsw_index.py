@@ -0,0 +1,406 @@
+from heapq import heapify, heappop, heappush
+from math import ceil, log
+from random import Random
+from typing import Dict, List, Optional, Tuple
+
+from numpy import (
+    asarray,
+    empty,
+    float32,
+    flatnonzero,
+    full,
+    inf,
+    linalg,
+    maximum,
+    ndarray,
+)
+from numpy.typing import DTypeLike
+
+from semantic_kernel.memory.collection_index import with_embedding
+from semantic_kernel.memory.memory_filter import MemoryFilter
+from semantic_kernel.memory.memory_record import MemoryRecord
+from semantic_kernel.memory.metadata_index import MetadataIndex
+from semantic_kernel.memory.similarity import score_rows, top_k_rows
+
+class HnswIndex:
+    """
+    Hierarchical navigable small world graph over the normalized embeddings
+    of a memory collection. Deleted nodes stay as tombstones, relinked
+    around and routed through until an insert reuses their slot, so the
+    graph is never rebuilt. Filtered searches scan the matching nodes when
+    they are few (`FILTER_SCAN_RATIO`) and otherwise widen the beam.
+    """
+
+    INITIAL_CAPACITY = 16
+    FILTER_SCAN_RATIO = 0.25
+
+    _m: int
+    _max_m0: int
+    _ef_construction: int
+    _ef_search: int
+    _level_multiplier: float
+    _random: Random
+    _dtype: DTypeLike
+
+    _vectors: Optional[ndarray]
+    _norms: Optional[ndarray]
+    _keys: List[Optional[str]]
+    _records: List[Optional[MemoryRecord]]
+    _nodes: Dict[str, int]
+    _links: List[List[List[int]]]
+    _deleted: List[bool]
+    _free_nodes: List[int]
+    _metadata: MetadataIndex
+    _entry_point: Optional[int]
+    _max_level: int
+
+    def __init__(
+        self,
+        m: int = 16,
+        ef_construction: int = 200,
+        ef_search: int = 50,
+        dtype: DTypeLike = float32,
+        seed: Optional[int] = None,
+    ) -> None:
+        if m < 2:
+            raise ValueError("The HNSW parameter M must be at least 2")
+
+        self._m = m
+        self._max_m0 = 2 * m
+        self._ef_construction = max(ef_construction, m)
+        self._ef_search = ef_search
+        self._level_multiplier = 1 / log(m)
+        self._random = Random(seed)
+        self._dtype = dtype
+        self._reset()
+
+    def __len__(self) -> int:
+        return len(self._nodes)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._nodes
+
+    @property
+    def ef_search(self) -> int:
+        return self._ef_search
+
+    @ef_search.setter
+    def ef_search(self, value: int) -> None:
+        self._ef_search = value
+
+    @property
+    def row_bytes(self) -> int:
+        if self._vectors is None:
+            return 0
+        return self._vectors.itemsize * self._vectors.shape[1] + self._norms.itemsize
+
+    def get_records(self, keys: List[str]) -> List[Optional[MemoryRecord]]:
+        return [
+            self._record(self._nodes[key]) if key in self._nodes else None
+            for key in keys
+        ]
+
+    def upsert(self, key: str, record: MemoryRecord) -> MemoryRecord:
+        """
+        Inserts or replaces a record, returning the copy kept without its
+        embedding.
+        """
+        vector = asarray(record.embedding, dtype=float).reshape(-1)
+
+        if self._vectors is None or (
+            len(self._nodes) == 0 and self._vectors.shape[1] != vector.shape[0]
+        ):
+            self._reset()
+            self._vectors = empty(
+                (self.INITIAL_CAPACITY, vector.shape[0]), dtype=self._dtype
+            )
+            self._norms = empty((self.INITIAL_CAPACITY,), dtype=float)
+        elif self._vectors.shape[1] != vector.shape[0]:
+            raise ValueError(
+                f"Embedding dimension {vector.shape[0]} does not match "
+                f"the collection dimension {self._vectors.shape[1]}"
+            )
+
+        if key in self._nodes:
+            self.remove(key)
+
+        if self._free_nodes:
+            node = self._free_nodes.pop()
+        else:
+            node = len(self._keys)
+            self._reserve(node + 1)
+            self._keys.append(None)
+            self._records.append(None)
+            self._deleted.append(True)
+            self._links.append([])
+
+        norm = linalg.norm(vector)
+        self._norms[node] = norm
+        self._vectors[node] = vector / norm if norm != 0 else vector
+        self._keys[node] = key
+        self._records[node] = with_embedding(record, None)
+        self._deleted[node] = False
+        self._metadata.set(node, record)
+        self._nodes[key] = node
+
+        self._insert(node)
+        return self._records[node]
+
+    def remove(self, key: str) -> None:
+        node = self._nodes.pop(key, None)
+        if node is None:
+            return
+
+        self._deleted[node] = True
+        self._keys[node] = None
+        self._records[node] = None
+        self._unlink(node)
+        if node != self._entry_point:
+            self._free_nodes.append(node)
+
+    def search(
+        self,
+        query: ndarray,
+        limit: int,
+        min_relevance_score: float,
+        filter: Optional[MemoryFilter] = None,
+    ) -> List[Tuple[str, float]]:
+        """
+        Finds the `limit` live records most similar to a unit-length query, as
+        (key, score) pairs by descending score.
+        """
+        if self._entry_point is None or len(self._nodes) == 0 or limit <= 0:
+            return []
+
+        allowed = None
+        matching = len(self._nodes)
+        if filter is not None:
+            allowed = self._metadata.mask(filter, len(self._keys), self._nodes)
+            allowed[asarray(self._deleted, dtype=bool)] = False
+            matching = int(allowed.sum())
+            if matching == 0:
+                return []
+            if matching <= self.FILTER_SCAN_RATIO * len(self._nodes):
+                return self._scan(
+                    query, flatnonzero(allowed), limit, min_relevance_score
+                )
+
+        entry_points = [self._entry_point]
+        for level in range(self._max_level, 0, -1):
+            entry_points = [self._search_layer(query, entry_points, 1, level)[0][1]]
+
+        # Widen the beam by the fraction of nodes that cannot be returned,
+        # deleted or filtered out, so they do not crowd out the rest.
+        ef = ceil(max(self._ef_search, limit) * len(self._keys) / matching)
+        found = self._search_layer(query, entry_points, ef, 0)
+
+        results = []
+        for score, node in found:
+            if self._deleted[node] or (allowed is not None and not allowed[node]):
+                continue
+            if self._norms[node] == 0:
+                score = -1.0
+            if score >= min_relevance_score:
+                results.append((node, score))
+        results.sort(key=lambda x: x[1], reverse=True)
+        return [(self._keys[node], score) for node, score in results[:limit]]
+
+    def _scan(
+        self, query: ndarray, nodes: ndarray, limit: int, min_relevance_score: float
+    ) -> List[Tuple[str, float]]:
+        nodes, scores = top_k_rows(
+            query.reshape(1, -1),
+            self._vectors,
+            self._norms,
+            limit,
+            min_relevance_score,
+            nodes,
+        )[0]
+        return [(self._keys[node], score) for node, score in zip(nodes, scores)]
+
+    def _record(self, node: int) -> MemoryRecord:
+        return with_embedding(
+            self._records[node], self._vectors[node].astype(float) * self._norms[node]
+        )
+
+    def _reset(self) -> None:
+        self._vectors = None
+        self._norms = None
+        self._keys = []
+        self._records = []
+        self._nodes = {}
+        self._links = []
+        self._deleted = []
+        self._free_nodes = []
+        self._metadata = MetadataIndex()
+        self._entry_point = None
+        self._max_level = -1
+
+    def _reserve(self, size: int) -> None:
+        capacity = self._vectors.shape[0]
+        if size <= capacity:
+            return
+
+        while capacity < size:
+            capacity *= 2
+
+        count = len(self._keys)
+        grown = empty((capacity, self._vectors.shape[1]), dtype=self._vectors.dtype)
+        grown[:count] = self._vectors[:count]
+        grown_norms = empty((capacity,), dtype=self._norms.dtype)
+        grown_norms[:count] = self._norms[:count]
+        self._vectors = grown
+        self._norms = grown_norms
+
+    def _similarities(self, query: ndarray, nodes: List[int]) -> List[float]:
+        return score_rows(query.reshape(1, -1), self._vectors[nodes])[0].tolist()
+
+    def _random_level(self) -> int:
+        return int(-log(1.0 - self._random.random()) * self._level_multiplier)
+
+    def _insert(self, node: int) -> None:
+        query = self._vectors[node]
+        level = self._random_level()
+        self._links[node] = [[] for _ in range(level + 1)]
+
+        if self._entry_point is None:
+            self._entry_point = node
+            self._max_level = level
+            return
+
+        # A reused slot can still be reached through links to the node it
+        # held before, so the searches skip it.
+        entry_points = [self._entry_point]
+        for layer in range(self._max_level, level, -1):
+            entry_points = [
+                self._search_layer(query, entry_points, 1, layer, node)[0][1]
+            ]
+
+        for layer in range(min(level, self._max_level), -1, -1):
+            found = self._search_layer(
+                query, entry_points, self._ef_construction, layer, node
+            )
+            neighbors = self._select_neighbors(found, self._m)
+            self._links[node][layer] = neighbors
+
+            max_links = self._max_m0 if layer == 0 else self._m
+            for neighbor in neighbors:
+                links = self._links[neighbor][layer]
+                links.append(node)
+                if len(links) > max_links:
+                    self._links[neighbor][layer] = self._prune(
+                        neighbor, links, max_links
+                    )
+
+            entry_points = [n for _, n in found]
+
+        if level > self._max_level:
+            self._entry_point = node
+            self._max_level = level
+
+    def _unlink(self, node: int) -> None:
+        # Reconnect every neighbour that pointed at `node` through the
+        # deleted node's own neighbourhood.
+        for layer, node_links in enumerate(self._links[node]):
+            max_links = self._max_m0 if layer == 0 else self._m
+            for neighbor in node_links:
+                if self._deleted[neighbor] or layer >= len(self._links[neighbor]):
+                    continue
+                links = self._links[neighbor][layer]
+                if node not in links:
+                    continue
+
+                candidates = {n for n in links if n != node}
+                candidates.update(
+                    n
+                    for n in node_links
+                    if n != neighbor
+                    and not self._deleted[n]
+                    and layer < len(self._links[n])
+                )
+                self._links[neighbor][layer] = self._prune(
+                    neighbor, list(candidates), max_links
+                )
+
+    def _prune(self, node: int, links: List[int], max_links: int) -> List[int]:
+        scores = self._similarities(self._vectors[node], links)
+        candidates = sorted(zip(scores, links), reverse=True)
+        return self._select_neighbors(candidates, max_links)
+
+    def _select_neighbors(
+        self, candidates: List[Tuple[float, int]], count: int
+    ) -> List[int]:
+        # Heuristic selection: keep a candidate only if it is closer to the
+        # base element than to every neighbour already kept, then top up
+        # with the closest rejected candidates.
+        if len(candidates) <= count:
+            return [n for _, n in candidates]
+
+        nodes = [n for _, n in candidates]
+        vectors = self._vectors[nodes]
+        pairwise = score_rows(vectors, vectors)
+
+        # Similarity of every candidate to its closest kept neighbour.
+        closest = full((len(nodes),), -inf)
+        selected: List[int] = []
+        rejected: List[int] = []
+        for i, (score, _) in enumerate(candidates):
+            if closest[i] < score:
+                selected.append(i)
+                if len(selected) == count:
+                    break
+                closest = maximum(closest, pairwise[i])
+            else:
+                rejected.append(i)
+
+        selected.extend(rejected[: count - len(selected)])
+        return [nodes[i] for i in selected]
+
+    def _search_layer(
+        self,
+        query: ndarray,
+        entry_points: List[int],
+        ef: int,
+        layer: int,
+        excluded: Optional[int] = None,
+    ) -> List[Tuple[float, int]]:
+        visited = set(entry_points)
+        visited.add(excluded)
+        scores = self._similarities(query, entry_points)
+
+        # `candidates` is a max-heap (negated scores) of nodes to expand and
+        # `best` a min-heap of the `ef` closest nodes found so far.
+        candidates = [(-score, node) for score, node in zip(scores, entry_points)]
+        best = [(score, node) for score, node in zip(scores, entry_points)]
+        heapify(candidates)
+        heapify(best)
+        while len(best) > ef:
+            heappop(best)
+
+        while candidates:
+            negated, node = heappop(candidates)
+            if len(best) >= ef and -negated < best[0][0]:
+                break
+
+            links = self._links[node]
+            if layer >= len(links):
+                continue
+            # Links left over from a reused slot may point at a node that
+            # no longer reaches this layer.
+            neighbors = [
+                n
+                for n in links[layer]
+                if n not in visited and layer < len(self._links[n])
+            ]
+            if not neighbors:
+                continue
+            visited.update(neighbors)
+
+            for score, neighbor in zip(self._similarities(query, neighbors), neighbors):
+                if len(best) < ef or score > best[0][0]:
+                    heappush(candidates, (-score, neighbor))
+                    heappush(best, (score, neighbor))
+                    if len(best) > ef:
+                        heappop(best)
+
+        return sorted(best, reverse=True)
@@ -0,0 +1,91 @@
+from logging import Logger
+from typing import Dict, List, Optional, Tuple
+
+from numpy import float32, ndarray
+from numpy.typing import DTypeLike
+
+from semantic_kernel.memory.hnsw_index import HnswIndex
+from semantic_kernel.memory.memory_filter import MemoryFilter
+from semantic_kernel.memory.memory_record import MemoryRecord
+from semantic_kernel.memory.memory_store_base import MemoryStoreBase
+from semantic_kernel.memory.similarity import normalize_queries
+from semantic_kernel.memory.storage.data_entry import DataEntry
+from semantic_kernel.memory.storage.indexed_data_store import IndexedDataStore
+
+from semantic_kernel.utils.null_logger import NullLogger
+
+class HnswMemoryStore(IndexedDataStore, MemoryStoreBase):
+    """
+    In-memory store that answers nearest-match queries from an HNSW graph
+    per collection. `m` bounds the links per node, and `ef_construction`
+    and `ef_search` are the beam widths used to insert and to query; larger
+    values trade speed for recall.
+    """
+
+    _indexes: Dict[str, HnswIndex]
+
+    def __init__(
+        self,
+        logger: Optional[Logger] = None,
+        m: int = 16,
+        ef_construction: int = 200,
+        ef_search: int = 50,
+        dtype: DTypeLike = float32,
+        seed: Optional[int] = None,
+    ) -> None:
+        super().__init__()
+        self._indexes = {}
+        self._m = m
+        self._ef_construction = ef_construction
+        self._ef_search = ef_search
+        self._dtype = dtype
+        self._seed = seed
+        self._logger = logger or NullLogger()
+
+    async def put_async(self, collection: str, value: DataEntry) -> DataEntry:
+        if collection not in self._indexes:
+            self._indexes[collection] = HnswIndex(
+                self._m, self._ef_construction, self._ef_search, self._dtype, self._seed
+            )
+        # The index keeps the only copy of the embedding.
+        record = self._indexes[collection].upsert(value.key, value.value)
+        await super().put_async(
+            collection, DataEntry(value.key, record, value.timestamp)
+        )
+
+        return value
+
+    async def remove_async(self, collection: str, key: str) -> None:
+        if collection in self._indexes:
+            self._indexes[collection].remove(key)
+
+        await super().remove_async(collection, key)
+
+    def set_ef_search(self, ef_search: int, collection: Optional[str] = None) -> None:
+        if collection is None:
+            self._ef_search = ef_search
+            indexes = list(self._indexes.values())
+        else:
+            indexes = [self._indexes[collection]] if collection in self._indexes else []
+
+        for index in indexes:
+            index.ef_search = ef_search
+
+    async def get_nearest_matches_async(
+        self,
+        collection: str,
+        embedding: ndarray,
+        limit: int = 1,
+        min_relevance_score: float = 0.7,
+        filter: Optional[MemoryFilter] = None,
+    ) -> List[Tuple[MemoryRecord, float]]:
+        await self._expire_async(collection)
+        index = self._indexes.get(collection)
+        if index is None or len(index) == 0:
+            return []
+
+        embedding = normalize_queries(embedding.reshape(-1))
+
+        return self._matched_records(
+            collection, index.search(embedding, limit, min_relevance_score, filter)
+        )
@@ -0,0 +1,380 @@
+from math import sqrt
+from typing import Dict, List, Optional, Set, Tuple
+
+from numpy import (
+    add,
+    arange,
+    argmax,
+    argsort,
+    array,
+    asarray,
+    concatenate,
+    empty,
+    flatnonzero,
+    float32,
+    inf,
+    int64,
+    linalg,
+    nan,
+    ndarray,
+    newaxis,
+    searchsorted,
+    zeros,
+)
+from numpy.random import default_rng
+from numpy.typing import DTypeLike
+
+from semantic_kernel.memory.collection_index import CollectionIndex, CollectionView
+from semantic_kernel.memory.memory_filter import MemoryFilter
+from semantic_kernel.memory.memory_record import MemoryRecord
+from semantic_kernel.memory.similarity import score_rows, top_k_indices, top_k_rows
+
+class IvfTraining:
+    """
+    A training run of an IvfIndex: the lists as they were when it began,
+    and, once fitted, the new quantizer and lists.
+    """
+
+    views: List[CollectionView]
+    keys: List[List[Optional[str]]]
+    n_lists: int
+    centroids: Optional[ndarray]
+    lists: Optional[List[CollectionIndex]]
+    assignments: Optional[Dict[str, int]]
+
+    def __init__(
+        self, views: List[CollectionView], keys: List[List[Optional[str]]], n_lists: int
+    ) -> None:
+        self.views = views
+        self.keys = keys
+        self.n_lists = n_lists
+        self.centroids = None
+        self.lists = None
+        self.assignments = None
+
+class IvfIndex:
+    """
+    Inverted-file index over the normalized embeddings of a memory
+    collection: a spherical k-means quantizer splits the rows into lists,
+    each its own CollectionIndex, and queries score only the `n_probe`
+    closest lists. Below `training_threshold` rows everything is in one
+    list. Writes never train; the owner runs `fit` between `begin_training`
+    and `finish_training`, on another thread if it likes.
+    """
+
+    RETRAIN_GROWTH = 2.0
+    REBALANCE_GROWTH = 1.1
+    REBALANCE_RATIO = 4.0
+    KMEANS_ITERATIONS = 20
+    TRAINING_SAMPLES_PER_LIST = 64
+    ASSIGNMENT_BLOCK_ROWS = 65536
+
+    _n_lists: Optional[int]
+    _n_probe: int
+    _training_threshold: int
+    _dtype: DTypeLike
+
+    _centroids: Optional[ndarray]
+    _lists: List[CollectionIndex]
+    _assignments: Dict[str, int]
+    _trained_size: int
+    _changed_keys: Optional[Set[str]]
+
+    def __init__(
+        self,
+        n_lists: Optional[int] = None,
+        n_probe: int = 8,
+        training_threshold: int = 1024,
+        dtype: DTypeLike = float32,
+        seed: Optional[int] = None,
+    ) -> None:
+        self._n_lists = n_lists
+        self._n_probe = n_probe
+        self._training_threshold = training_threshold
+        self._dtype = dtype
+        self._random = default_rng(seed)
+
+        self._centroids = None
+        self._lists = [CollectionIndex(dtype)]
+        self._assignments = {}
+        self._trained_size = 0
+        self._changed_keys = None
+
+    def __len__(self) -> int:
+        return len(self._assignments)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._assignments
+
+    @property
+    def n_probe(self) -> int:
+        return self._n_probe
+
+    @n_probe.setter
+    def n_probe(self, value: int) -> None:
+        self._n_probe = value
+
+    @property
+    def is_trained(self) -> bool:
+        return self._centroids is not None
+
+    @property
+    def needs_training(self) -> bool:
+        count = len(self._assignments)
+        if count < self._training_threshold:
+            return False
+        if self._centroids is None:
+            return True
+        if count >= self.RETRAIN_GROWTH * self._trained_size:
+            return True
+        if count < self.REBALANCE_GROWTH * self._trained_size:
+            return False
+
+        largest = max(len(x) for x in self._lists)
+        return largest > self.REBALANCE_RATIO * count / len(self._lists)
+
+    @property
+    def row_bytes(self) -> int:
+        return max(index.row_bytes for index in self._lists)
+
+    def get_records(self, keys: List[str]) -> List[Optional[MemoryRecord]]:
+        return [
+            self._lists[self._assignments[key]].get_record(key)
+            if key in self._assignments
+            else None
+            for key in keys
+        ]
+
+    def upsert(self, key: str, record: MemoryRecord) -> MemoryRecord:
+        """
+        Inserts or replaces a record, returning the copy kept without its
+        embedding.
+        """
+        target = self._assign(record.embedding)
+
+        current = self._assignments.get(key)
+        if current is not None and current != target:
+            self._remove_from_list(current, key)
+        (row,) = self._lists[target].upsert_many([key], [record])
+        self._assignments[key] = target
+        if self._changed_keys is not None:
+            self._changed_keys.add(key)
+        return self._lists[target].records[row]
+
+    def remove(self, key: str) -> None:
+        current = self._assignments.pop(key, None)
+        if current is not None:
+            self._remove_from_list(current, key)
+        if self._changed_keys is not None:
+            self._changed_keys.add(key)
+
+    def train(self, n_lists: Optional[int] = None) -> None:
+        """
+        Fits the quantizer with `n_lists` lists (by default the configured
+        number, or the square root of the collection size) and reassigns every
+        row, in one step.
+        """
+        training = self.begin_training(n_lists)
+        if training is not None:
+            self.finish_training(self.fit(training))
+
+    def begin_training(self, n_lists: Optional[int] = None) -> Optional["IvfTraining"]:
+        """
+        Starts a training run with `n_lists` lists and returns the rows to
+        `fit`, or None; keys written from now on are tracked for
+        `finish_training`.
+        """
+        count = len(self._assignments)
+        if count == 0:
+            return None
+
+        self._changed_keys = set()
+        return IvfTraining(
+            [index.view() for index in self._lists],
+            [list(index.keys) for index in self._lists],
+            min(n_lists or self._n_lists or max(1, int(sqrt(count))), count),
+        )
+
+    def fit(self, training: "IvfTraining") -> "IvfTraining":
+        """
+        Trains the quantizer on the rows of a training run and builds the
+        new lists, filling each with a single `upsert_many`. Only reads the
+        index, so it may run on another thread.
+        """
+        keys: List[str] = []
+        records: List[MemoryRecord] = []
+        embeddings, norms = [], []
+        for view, view_keys in zip(training.views, training.keys):
+            rows = [
+                row
+                for row in flatnonzero(view.live[: len(view_keys)]).tolist()
+                if view.records[row] is not None
+            ]
+            keys.extend(view_keys[row] for row in rows)
+            records.extend(view.records[row] for row in rows)
+            embeddings.append(view.embeddings[rows])
+            norms.append(view.norms[rows])
+
+        count = len(keys)
+        if count == 0:
+            return training
+        embeddings = concatenate(embeddings)
+        norms = concatenate(norms)
+
+        n_lists = min(training.n_lists, count)
+        sample_size = min(count, n_lists * self.TRAINING_SAMPLES_PER_LIST)
+        sample = embeddings[self._random.choice(count, sample_size, replace=False)]
+        centroids = self._kmeans(sample.astype(float32), n_lists)
+
+        targets = empty((count,), dtype=int64)
+        for start in range(0, count, self.ASSIGNMENT_BLOCK_ROWS):
+            block = embeddings[start : start + self.ASSIGNMENT_BLOCK_ROWS]
+            targets[start : start + len(block)] = argmax(
+                score_rows(block, centroids), axis=1
+            )
+
+        # The lists store their records without embeddings, so the vectors
+        # are restored from the normalized rows and their norms.
+        order = argsort(targets, kind="stable")
+        bounds = searchsorted(targets[order], arange(n_lists + 1))
+        lists = [CollectionIndex(self._dtype) for _ in range(n_lists)]
+        for target, index in enumerate(lists):
+            rows = order[bounds[target] : bounds[target + 1]]
+            if len(rows) == 0:
+                continue
+            index.upsert_many(
+                [keys[row] for row in rows.tolist()],
+                [records[row] for row in rows.tolist()],
+                embeddings[rows].astype(float) * norms[rows].reshape(-1, 1),
+            )
+
+        training.centroids = centroids
+        training.lists = lists
+        training.assignments = dict(zip(keys, targets.tolist()))
+        return training
+
+    def finish_training(self, training: Optional["IvfTraining"]) -> None:
+        """
+        Swaps in the lists built by `fit` and re-applies the keys written
+        since `begin_training`; None abandons the run.
+        """
+        changed, self._changed_keys = self._changed_keys, None
+        if training is None or training.lists is None or changed is None:
+            return
+
+        # The current value of every changed key, from the lists replaced.
+        updates: List[Tuple[str, Optional[MemoryRecord]]] = []
+        for key in changed:
+            current = self._assignments.get(key)
+            record = None
+            if current is not None:
+                record = self._lists[current].get_record(key)
+            updates.append((key, record))
+
+        self._centroids = training.centroids
+        self._lists = training.lists
+        self._assignments = training.assignments
+        self._trained_size = len(training.assignments)
+        for key, record in updates:
+            if record is None:
+                self.remove(key)
+            else:
+                self.upsert(key, record)
+
+    def search(
+        self,
+        query: ndarray,
+        limit: int,
+        min_relevance_score: float,
+        filter: Optional[MemoryFilter] = None,
+    ) -> List[Tuple[str, float]]:
+        """
+        Finds the `limit` records most similar to a unit-length query among the
+        `n_probe` closest lists, as (key, score) pairs by descending score.
+        """
+        if len(self._assignments) == 0:
+            return []
+
+        # The rows of each list that may be returned; None means all.
+        allowed = [
+            None if filter is None else flatnonzero(index.mask(filter))
+            for index in self._lists
+        ]
+        non_empty = array(
+            [
+                len(index) > 0 if rows is None else len(rows) > 0
+                for index, rows in zip(self._lists, allowed)
+            ]
+        )
+
+        if self._centroids is None:
+            probed = [0] if non_empty[0] else []
+        else:
+            centroid_scores = score_rows(query.reshape(1, -1), self._centroids)[0]
+            centroid_scores[~non_empty] = nan
+            probed = top_k_indices(centroid_scores, self._n_probe, -inf).tolist()
+
+        # Each probed list gives its own top rows; concatenating them in
+        # probe order keeps ties broken as in one pass over the lists.
+        keys: List[Optional[str]] = []
+        scores = []
+        for i in probed:
+            view = self._lists[i].view()
+            rows, list_scores = top_k_rows(
+                query.reshape(1, -1),
+                view.embeddings,
+                view.norms,
+                limit,
+                min_relevance_score,
+                allowed[i],
+                view.live,
+            )[0]
+            keys.extend(view.keys[row] for row in rows.tolist())
+            scores.append(list_scores)
+
+        if not scores:
+            return []
+        scores = concatenate(scores)
+        return [
+            (keys[position], scores[position])
+            for position in top_k_indices(scores, limit, min_relevance_score)
+        ]
+
+    def _remove_from_list(self, list_number: int, key: str) -> None:
+        # Lists are small, so they are compacted in place as soon as the
+        # dead fraction passes the ratio, whatever the dead row count.
+        index = self._lists[list_number]
+        index.remove(key)
+        if index.dead_rows >= index.COMPACTION_RATIO * index.size:
+            index.compact()
+
+    def _assign(self, embedding: ndarray) -> int:
+        if self._centroids is None:
+            return 0
+
+        vector = asarray(embedding, dtype=float32).reshape(1, -1)
+        return int(argmax(score_rows(vector, self._centroids)[0]))
+
+    def _kmeans(self, sample: ndarray, n_lists: int) -> ndarray:
+        # Spherical k-means: centroids are kept unit length, so assignment
+        # is a single product with the sample.
+        centroids = sample[self._random.choice(len(sample), n_lists, replace=False)]
+        for _ in range(self.KMEANS_ITERATIONS):
+            assignments = argmax(sample.dot(centroids.T), axis=1)
+
+            sums = zeros(centroids.shape, dtype=float32)
+            add.at(sums, assignments, sample)
+            norms = linalg.norm(sums, axis=1)
+
+            # Reseed empty (or all-zero) lists with random sample rows.
+            empty_lists = norms == 0
+            if empty_lists.any():
+                reseeded = self._random.choice(
+                    len(sample), int(empty_lists.sum()), replace=False
+                )
+                sums[empty_lists] = sample[reseeded]
+                norms[empty_lists] = linalg.norm(sample[reseeded], axis=1)
+                norms[norms == 0] = 1.0
+
+            centroids = sums / norms[:, newaxis]
+        return centroids
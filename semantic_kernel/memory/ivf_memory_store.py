@@ -0,0 +1,136 @@
+import asyncio
+from logging import Logger
+from typing import Dict, List, Optional, Tuple
+
+from numpy import float32, ndarray
+from numpy.typing import DTypeLike
+
+from semantic_kernel.memory.ivf_index import IvfIndex
+from semantic_kernel.memory.memory_filter import MemoryFilter
+from semantic_kernel.memory.memory_record import MemoryRecord
+from semantic_kernel.memory.memory_store_base import MemoryStoreBase
+from semantic_kernel.memory.similarity import normalize_queries
+from semantic_kernel.memory.storage.data_entry import DataEntry
+from semantic_kernel.memory.storage.indexed_data_store import IndexedDataStore
+
+from semantic_kernel.utils.null_logger import NullLogger
+
+class IvfMemoryStore(IndexedDataStore, MemoryStoreBase):
+    """
+    In-memory store that answers nearest-match queries from an inverted-file
+    index per collection. Collections due for (re)training are trained in
+    the background on the default executor; `train_async` trains on demand.
+    """
+
+    _indexes: Dict[str, IvfIndex]
+    _training_tasks: Dict[str, asyncio.Task]
+
+    def __init__(
+        self,
+        logger: Optional[Logger] = None,
+        n_lists: Optional[int] = None,
+        n_probe: int = 8,
+        training_threshold: int = 1024,
+        dtype: DTypeLike = float32,
+        seed: Optional[int] = None,
+    ) -> None:
+        super().__init__()
+        self._indexes = {}
+        self._training_tasks = {}
+        self._n_lists = n_lists
+        self._n_probe = n_probe
+        self._training_threshold = training_threshold
+        self._dtype = dtype
+        self._seed = seed
+        self._logger = logger or NullLogger()
+
+    async def put_async(self, collection: str, value: DataEntry) -> DataEntry:
+        if collection not in self._indexes:
+            self._indexes[collection] = IvfIndex(
+                self._n_lists,
+                self._n_probe,
+                self._training_threshold,
+                self._dtype,
+                self._seed,
+            )
+        index = self._indexes[collection]
+        # The index keeps the only copy of the embedding.
+        record = index.upsert(value.key, value.value)
+        if index.needs_training and collection not in self._training_tasks:
+            self._start_training(collection)
+        await super().put_async(
+            collection, DataEntry(value.key, record, value.timestamp)
+        )
+
+        return value
+
+    async def remove_async(self, collection: str, key: str) -> None:
+        if collection in self._indexes:
+            self._indexes[collection].remove(key)
+
+        await super().remove_async(collection, key)
+
+    async def train_async(self, collection: str, n_lists: Optional[int] = None) -> None:
+        """
+        Trains the index of the given collection, waiting for any training
+        already running.
+        """
+        task = self._training_tasks.get(collection)
+        if task is not None:
+            await asyncio.shield(task)
+        if collection in self._indexes:
+            await asyncio.shield(self._start_training(collection, n_lists))
+
+    def _start_training(
+        self, collection: str, n_lists: Optional[int] = None
+    ) -> asyncio.Task:
+        return self._start_task(
+            self._training_tasks,
+            collection,
+            self._train_index_async(collection, self._indexes[collection], n_lists),
+        )
+
+    async def _train_index_async(
+        self, collection: str, index: IvfIndex, n_lists: Optional[int]
+    ) -> None:
+        training = None
+        try:
+            training = index.begin_training(n_lists)
+            if training is not None:
+                training = await asyncio.get_running_loop().run_in_executor(
+                    None, index.fit, training
+                )
+        except Exception as e:
+            self._logger.error(f"Training the index of collection '{collection}' failed: {e}")
+            training = None
+        finally:
+            index.finish_training(training)
+
+    def set_n_probe(self, n_probe: int, collection: Optional[str] = None) -> None:
+        if collection is None:
+            self._n_probe = n_probe
+            indexes = list(self._indexes.values())
+        else:
+            indexes = [self._indexes[collection]] if collection in self._indexes else []
+
+        for index in indexes:
+            index.n_probe = n_probe
+
+    async def get_nearest_matches_async(
+        self,
+        collection: str,
+        embedding: ndarray,
+        limit: int = 1,
+        min_relevance_score: float = 0.7,
+        filter: Optional[MemoryFilter] = None,
+    ) -> List[Tuple[MemoryRecord, float]]:
+        await self._expire_async(collection)
+        index = self._indexes.get(collection)
+        if index is None or len(index) == 0:
+            return []
+
+        embedding = normalize_queries(embedding.reshape(-1))
+
+        return self._matched_records(
+            collection, index.search(embedding, limit, min_relevance_score, filter)
+        )
@@ -0,0 +1,40 @@
+from typing import Any, Dict, FrozenSet, Iterable, Optional, Union
+
+from semantic_kernel.memory.memory_record import MemoryRecord
+
+FilterValue = Union[bool, str, Iterable[Optional[str]], None]
+
+class MemoryFilter:
+    """
+    Equality conditions on the metadata fields of a MemoryRecord: a field
+    matches its value, or any of a list of values. Fields left as `None` are
+    not checked; pass `[None]` to match records where the field is unset.
+    """
+
+    FIELDS = ("is_reference", "external_source_name", "id", "description")
+
+    conditions: Dict[str, FrozenSet[Any]]
+
+    def __init__(
+        self,
+        is_reference: Optional[bool] = None,
+        external_source_name: FilterValue = None,
+        id: FilterValue = None,
+        description: FilterValue = None,
+    ) -> None:
+        self.conditions = {}
+        for field, value in zip(
+            self.FIELDS, (is_reference, external_source_name, id, description)
+        ):
+            if value is None:
+                continue
+            if isinstance(value, (bool, str)):
+                self.conditions[field] = frozenset([value])
+            else:
+                self.conditions[field] = frozenset(value)
+
+    def matches(self, record: MemoryRecord) -> bool:
+        return all(
+            getattr(record, field) in values
+            for field, values in self.conditions.items()
+        )
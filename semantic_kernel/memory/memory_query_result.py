@@ -1,4 +1,7 @@
 from typing import Optional
+
+from numpy import ndarray
+
 from semantic_kernel.memory.memory_record import MemoryRecord
 
 class MemoryQueryResult:
@@ -8,6 +11,7 @@ class MemoryQueryResult:
     description: Optional[str]
     text: Optional[str]
     relevance: float
+    embedding: Optional[ndarray]
     
     def __init__(
         self,
@@ -17,6 +21,7 @@ class MemoryQueryResult:
         description: Optional[str],
         text: Optional[str],
         relevance: float,
+        embedding: Optional[ndarray] = None,
     ) -> None:
         self.is_reference = is_reference
         self.external_source_name = external_source_name
@@ -24,10 +29,11 @@ class MemoryQueryResult:
         self.description = description
         self.text = text
         self.relevance = relevance
+        self.embedding = embedding
     
     @staticmethod
     def from_memory_record(
-        record: MemoryRecord, relevance: float
+        record: MemoryRecord, relevance: float, with_embedding: bool = False
     ) -> "MemoryQueryResult":
         return MemoryQueryResult(
             is_reference=record.is_reference,
@@ -36,5 +42,6 @@ class MemoryQueryResult:
             description=record.description,
             text=record.text,
             relevance=relevance,
+            embedding=record.embedding if with_embedding else None,
         )
         
\ No newline at end of file
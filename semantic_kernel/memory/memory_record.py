@@ -2,6 +2,15 @@ from typing import Optional
 from numpy import ndarray
 
 class MemoryRecord:
+    __slots__ = (
+        "is_reference",
+        "external_source_name",
+        "id",
+        "description",
+        "text",
+        "_embedding",
+    )
+
     is_reference: bool
     external_source_name: Optional[str]
     id: str
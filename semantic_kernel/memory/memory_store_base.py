@@ -1,8 +1,50 @@
 from abc import ABC
+from datetime import datetime
+from typing import List, Optional, Tuple
 
-from semantic_kernel.ai.embeddings.embedding_index_base import EmbeddingIndexBase
-class DataStoreBase():
-    pass
+from semantic_kernel.connectors.ai.embeddings.embedding_index_base import EmbeddingIndexBase
+from semantic_kernel.memory.memory_filter import MemoryFilter
+from semantic_kernel.memory.memory_record import MemoryRecord
+from semantic_kernel.memory.storage.data_entry import DataEntry
+from semantic_kernel.memory.storage.data_store_base import DataStoreBase
 
-class MemoryStoreBase(DatastorBase, EmbeddingIndexBase, ABC):
-    pass
+class MemoryStoreBase(DataStoreBase, EmbeddingIndexBase, ABC):
+    async def get_value_async(self, collection: str, key: str) -> MemoryRecord:
+        entry = await self.get_async(collection, key)
+
+        if entry is None:
+            raise Exception(f"Key '{key}' not found in collection '{collection}'")
+
+        return entry.value
+
+    async def get_batch_async(
+        self, collection: str, keys: List[str], with_embeddings: bool = True
+    ) -> List[Optional[DataEntry]]:
+        """
+        Looks many keys up at once. Stores may leave the embeddings out of
+        the records when `with_embeddings` is False.
+        """
+        return await super().get_batch_async(collection, keys)
+
+    async def put_value_async(
+        self, collection: str, key: str, value: MemoryRecord
+    ) -> None:
+        entry = DataEntry(key, value, datetime.now())
+        await self.put_async(collection, entry)
+
+    def has_lexical_index(self, collection: str) -> bool:
+        """
+        Whether `get_lexical_matches_async` can search the collection.
+        """
+        return False
+
+    async def get_lexical_matches_async(
+        self,
+        collection: str,
+        query: str,
+        limit: int,
+        filter: Optional[MemoryFilter] = None,
+    ) -> List[Tuple[MemoryRecord, float]]:
+        raise NotImplementedError(
+            f"{type(self).__name__} does not keep a lexical index"
+        )
@@ -0,0 +1,123 @@
+from typing import Any, Dict, List, Mapping, Optional
+
+from numpy import empty, flatnonzero, full, int32, isin, ndarray, ones, unique, zeros
+
+from semantic_kernel.memory.memory_filter import MemoryFilter
+from semantic_kernel.memory.memory_record import MemoryRecord
+
+class MetadataIndex:
+    """
+    The filterable fields of every row of a collection, so that a
+    MemoryFilter becomes a boolean row mask. The fields in `ENCODED_FIELDS`
+    are stored as int32 codes; ids and descriptions, which are close to
+    unique, as references to the record's strings.
+    """
+
+    INITIAL_CAPACITY = 16
+    ENCODED_FIELDS = ("is_reference", "external_source_name")
+
+    _codes: ndarray
+    _values: List[Dict[Any, int]]
+    _ids: List[Optional[str]]
+    _descriptions: List[Optional[str]]
+
+    def __init__(self) -> None:
+        self.clear()
+
+    def clear(self) -> None:
+        self._codes = full(
+            (self.INITIAL_CAPACITY, len(self.ENCODED_FIELDS)), -1, dtype=int32
+        )
+        self._values = [{} for _ in self.ENCODED_FIELDS]
+        self._ids = []
+        self._descriptions = []
+
+    def set(self, row: int, record: MemoryRecord) -> None:
+        self.set_values(row, [getattr(record, field) for field in MemoryFilter.FIELDS])
+
+    def set_values(self, row: int, values: List[Any]) -> None:
+        """
+        Stores the filterable fields of a row, given in the order of
+        `MemoryFilter.FIELDS`.
+        """
+        self.reserve(row + 1)
+        fields = dict(zip(MemoryFilter.FIELDS, values))
+        for column, field in enumerate(self.ENCODED_FIELDS):
+            codes = self._values[column]
+            code = codes.get(fields[field])
+            if code is None:
+                code = codes[fields[field]] = len(codes)
+            self._codes[row, column] = code
+        self._ids[row] = fields["id"]
+        self._descriptions[row] = fields["description"]
+
+    def reserve(self, size: int) -> None:
+        """
+        Makes room for `size` rows, so a mask can cover rows never set.
+        """
+        if size > self._codes.shape[0]:
+            capacity = self._codes.shape[0]
+            while capacity < size:
+                capacity *= 2
+            grown = full((capacity, self._codes.shape[1]), -1, dtype=int32)
+            grown[: self._codes.shape[0]] = self._codes
+            self._codes = grown
+        if size > len(self._ids):
+            self._ids.extend([None] * (size - len(self._ids)))
+            self._descriptions.extend([None] * (size - len(self._descriptions)))
+
+    def select(self, rows: ndarray) -> None:
+        """
+        Keeps only the given rows, renumbered in the order given, and the
+        codes they use.
+        """
+        codes = empty(
+            (max(self.INITIAL_CAPACITY, len(rows)), self._codes.shape[1]), dtype=int32
+        )
+        for column, values in enumerate(self._values):
+            used, codes[: len(rows), column] = unique(
+                self._codes[rows, column], return_inverse=True
+            )
+            by_code = {code: value for value, code in values.items()}
+            self._values[column] = {
+                by_code[code]: new_code for new_code, code in enumerate(used.tolist())
+            }
+        self._codes = codes
+
+        kept = rows.tolist()
+        self._ids = [self._ids[row] for row in kept]
+        self._descriptions = [self._descriptions[row] for row in kept]
+
+    def mask(
+        self,
+        filter: MemoryFilter,
+        size: int,
+        rows_by_key: Optional[Mapping[str, int]] = None,
+    ) -> ndarray:
+        """
+        The boolean mask of the first `size` rows that match a filter; ids are
+        found through `rows_by_key`, the owner's key -> row map, when given.
+        """
+        mask = ones((size,), dtype=bool)
+        ids = filter.conditions.get("id")
+        if ids is not None and rows_by_key is not None and None not in ids:
+            mask = zeros((size,), dtype=bool)
+            mask[[rows_by_key[id] for id in ids if id in rows_by_key]] = True
+
+        for column, field in enumerate(self.ENCODED_FIELDS):
+            accepted = filter.conditions.get(field)
+            if accepted is None:
+                continue
+
+            values = self._values[column]
+            codes = [values[value] for value in accepted if value in values]
+            mask &= isin(self._codes[:size, column], codes)
+
+        for field, values in (("id", self._ids), ("description", self._descriptions)):
+            accepted = filter.conditions.get(field)
+            if accepted is None:
+                continue
+
+            rows = flatnonzero(mask)
+            mask[rows] = [values[row] in accepted for row in rows.tolist()]
+        return mask
@@ -0,0 +1,528 @@
+import os
+from datetime import datetime
+from logging import Logger
+from mmap import ACCESS_READ, mmap
+from struct import Struct
+from typing import Dict, List, Optional, Set, Tuple
+
+from numpy import (
+    asarray,
+    empty,
+    flatnonzero,
+    float32,
+    full,
+    int64,
+    linalg,
+    ndarray,
+    where,
+    zeros,
+)
+from numpy.lib.format import open_memmap
+from numpy.typing import DTypeLike
+
+from semantic_kernel.memory.memory_filter import MemoryFilter
+from semantic_kernel.memory.memory_record import MemoryRecord
+from semantic_kernel.memory.memory_store_base import MemoryStoreBase
+from semantic_kernel.memory.metadata_index import MetadataIndex
+from semantic_kernel.memory.similarity import normalize_queries, top_k_rows
+from semantic_kernel.memory.storage.binary_record import pack_string, unpack_string
+from semantic_kernel.memory.storage.data_entry import DataEntry
+
+from semantic_kernel.utils.null_logger import NullLogger
+
+class MmapCollection:
+    """
+    A memory collection kept on disk as a memory-mapped `.npy` matrix of
+    normalized embeddings plus an append-only side file of records, so
+    processes opening the same directory share one copy through the page
+    cache. Records are decoded from the mapped side file only when read or
+    filtered on; only a single writer per collection is supported.
+    """
+
+    EMBEDDINGS_FILE = "embeddings.npy"
+    RECORDS_FILE = "records.bin"
+    INITIAL_CAPACITY = 1024
+    # The side file is rewritten once it holds this many entries per live
+    # record (and at least `COMPACTION_MIN_ENTRIES` entries).
+    COMPACTION_RATIO = 2.0
+    COMPACTION_MIN_ENTRIES = 1024
+
+    # Every entry is framed by its length and op; a put is followed by its
+    # row, norm, timestamp and is_reference, then the key, source name,
+    # id, description and text strings. A remove only holds the key.
+    FRAME = Struct("<IB")
+    PUT_FIELDS = Struct("<qdd?")
+    PUT = 1
+    REMOVE = 2
+
+    _path: str
+    _dtype: DTypeLike
+    _embeddings: Optional[ndarray]
+    _embeddings_inode: Optional[int]
+    _norms: ndarray
+    _live: ndarray
+    _offsets: ndarray
+    _unindexed_rows: List[int]
+    _metadata: MetadataIndex
+    _rows: Dict[str, int]
+    _free_rows: Set[int]
+    _high_water: int
+    _log: Optional[mmap]
+    _log_inode: Optional[int]
+    _log_offset: int
+    _log_entries: int
+
+    def __init__(self, path: str, dtype: DTypeLike = float32) -> None:
+        self._path = path
+        self._dtype = dtype
+        os.makedirs(path, exist_ok=True)
+
+        self._embeddings = None
+        self._embeddings_inode = None
+        self._reset()
+        self.refresh()
+
+    @property
+    def embeddings_path(self) -> str:
+        return os.path.join(self._path, self.EMBEDDINGS_FILE)
+
+    @property
+    def records_path(self) -> str:
+        return os.path.join(self._path, self.RECORDS_FILE)
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def keys(self) -> List[str]:
+        return list(self._rows.keys())
+
+    def refresh(self) -> None:
+        """
+        Remaps the embeddings file if it was replaced and applies any side
+        file entries written since the last refresh.
+        """
+        self._map_embeddings()
+
+        if not os.path.exists(self.records_path):
+            return
+
+        stat = os.stat(self.records_path)
+        if stat.st_ino != self._log_inode or stat.st_size < self._log_offset:
+            self._reset()
+            self._log_inode = stat.st_ino
+            if self._embeddings is not None:
+                self._reserve_metadata(self._embeddings.shape[0])
+        if stat.st_size == self._log_offset:
+            return
+
+        with open(self.records_path, "rb") as fp:
+            self._log = mmap(fp.fileno(), 0, access=ACCESS_READ)
+        size = len(self._log)
+        while self._log_offset + self.FRAME.size <= size:
+            length, op = self.FRAME.unpack_from(self._log, self._log_offset)
+            end = self._log_offset + self.FRAME.size + length
+            # An entry cut short is still being written.
+            if end > size:
+                break
+            self._apply(op, self._log_offset)
+            self._log_offset = end
+
+        # The writer may have grown the matrix between the check above and
+        # the entries just applied; it is renamed into place before any
+        # entry refers to its new rows.
+        if self._embeddings is None or self._high_water > self._embeddings.shape[0]:
+            self._map_embeddings()
+
+    def get(self, key: str, with_embedding: bool = True) -> Optional[DataEntry]:
+        row = self._rows.get(key)
+        if row is None:
+            return None
+        return self._entry(row, with_embedding)
+
+    def get_all(self) -> List[DataEntry]:
+        return [self._entry(row) for row in self._rows.values()]
+
+    def put(self, key: str, record: MemoryRecord, timestamp: datetime) -> None:
+        self.put_many([DataEntry(key, record, timestamp)])
+
+    def put_many(self, entries: List[DataEntry]) -> None:
+        """
+        Writes the rows of several entries and appends their side file
+        entries in a single write; the last entry of a repeated key wins.
+        """
+        latest = list({entry.key: entry for entry in entries}.values())
+        if not latest:
+            return
+
+        vectors = asarray(
+            [asarray(entry.value.embedding, dtype=float).reshape(-1) for entry in latest]
+        )
+        if vectors.ndim != 2:
+            raise ValueError("All embeddings of a batch must have the same dimension")
+        if self._embeddings is None:
+            self._replace_embeddings(self.INITIAL_CAPACITY, vectors.shape[1])
+        elif self._embeddings.shape[1] != vectors.shape[1]:
+            raise ValueError(
+                f"Embedding dimension {vectors.shape[1]} does not match "
+                f"the collection dimension {self._embeddings.shape[1]}"
+            )
+
+        free_rows = sorted(self._free_rows, reverse=True)
+        high_water = self._high_water
+        rows = []
+        for entry in latest:
+            row = self._rows.get(entry.key)
+            if row is None and free_rows:
+                row = free_rows.pop()
+            elif row is None:
+                row = high_water
+                high_water += 1
+            rows.append(row)
+        if high_water > self._embeddings.shape[0]:
+            capacity = self._embeddings.shape[0]
+            while capacity < high_water:
+                capacity *= 2
+            self._replace_embeddings(capacity, vectors.shape[1])
+
+        # The rows are written before their side file entries, so readers
+        # never see metadata for a row whose vector is not in place yet.
+        norms = linalg.norm(vectors, axis=1)
+        self._embeddings[rows] = vectors / where(norms == 0, 1.0, norms)[:, None]
+        self._append(
+            b"".join(
+                self._encode_put(entry, row, norm)
+                for entry, row, norm in zip(latest, rows, norms.tolist())
+            )
+        )
+
+    def remove(self, key: str) -> None:
+        if key not in self._rows:
+            return
+        self._append(self._frame(self.REMOVE, pack_string(key)))
+
+    def search(
+        self,
+        query: ndarray,
+        limit: int,
+        min_relevance_score: float,
+        filter: Optional[MemoryFilter] = None,
+    ) -> List[Tuple[MemoryRecord, float]]:
+        if self._embeddings is None or len(self._rows) == 0:
+            return []
+
+        count = self._high_water
+        rows = None
+        if filter is not None:
+            self._index_metadata()
+            # Only the matching rows are read from the mapping.
+            rows = flatnonzero(
+                self._metadata.mask(filter, count, self._rows) & self._live[:count]
+            )
+
+        # `asarray` drops the memmap subclass without copying the pages.
+        rows, scores = top_k_rows(
+            query.reshape(1, -1),
+            asarray(self._embeddings[:count]),
+            self._norms[:count],
+            limit,
+            min_relevance_score,
+            rows,
+            self._live[:count],
+        )[0]
+        return [(self._record(row), score) for row, score in zip(rows, scores)]
+
+    def flush(self) -> None:
+        if self._embeddings is not None:
+            self._embeddings.flush()
+
+    def compact(self) -> None:
+        """
+        Rewrites the side file with a single entry per live record.
+        """
+        self.refresh()
+
+        temporary_path = self.records_path + ".tmp"
+        with open(temporary_path, "wb") as fp:
+            for row in self._rows.values():
+                offset = int(self._offsets[row])
+                (length, _) = self.FRAME.unpack_from(self._log, offset)
+                fp.write(self._log[offset : offset + self.FRAME.size + length])
+            fp.flush()
+            os.fsync(fp.fileno())
+        os.replace(temporary_path, self.records_path)
+
+        self._reset()
+        self._reserve_metadata(self._embeddings.shape[0])
+        self.refresh()
+
+    def _map_embeddings(self) -> None:
+        if not os.path.exists(self.embeddings_path):
+            return
+
+        inode = os.stat(self.embeddings_path).st_ino
+        if inode != self._embeddings_inode:
+            self._embeddings = open_memmap(self.embeddings_path, mode="r+")
+            self._embeddings_inode = inode
+            self._reserve_metadata(self._embeddings.shape[0])
+
+    def _reset(self) -> None:
+        self._norms = empty((0,), dtype=float)
+        self._live = zeros((0,), dtype=bool)
+        self._offsets = empty((0,), dtype=int64)
+        self._unindexed_rows = []
+        self._metadata = MetadataIndex()
+        self._rows = {}
+        self._free_rows = set()
+        self._high_water = 0
+        self._log = None
+        self._log_inode = None
+        self._log_offset = 0
+        self._log_entries = 0
+
+    def _reserve_metadata(self, capacity: int) -> None:
+        size = self._offsets.shape[0]
+        if capacity <= size:
+            return
+
+        norms = zeros((capacity,), dtype=float)
+        norms[:size] = self._norms[:size]
+        live = zeros((capacity,), dtype=bool)
+        live[:size] = self._live[:size]
+        offsets = full((capacity,), -1, dtype=int64)
+        offsets[:size] = self._offsets[:size]
+        self._norms = norms
+        self._live = live
+        self._offsets = offsets
+
+    def _replace_embeddings(self, capacity: int, dimension: int) -> None:
+        # The grown matrix is written to a temporary file and renamed over
+        # the old one, so readers keep a consistent mapping until they remap.
+        temporary_path = self.embeddings_path + ".tmp"
+        grown = open_memmap(
+            temporary_path, mode="w+", dtype=self._dtype, shape=(capacity, dimension)
+        )
+        if self._embeddings is not None:
+            grown[: self._high_water] = self._embeddings[: self._high_water]
+        grown.flush()
+        os.replace(temporary_path, self.embeddings_path)
+
+        self._embeddings = grown
+        self._embeddings_inode = os.stat(self.embeddings_path).st_ino
+        self._reserve_metadata(capacity)
+
+    def _append(self, data: bytes) -> None:
+        descriptor = os.open(
+            self.records_path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644
+        )
+        try:
+            view = memoryview(data)
+            while view:
+                view = view[os.write(descriptor, view) :]
+        finally:
+            os.close(descriptor)
+
+        self.refresh()
+        if self._log_entries > max(
+            self.COMPACTION_MIN_ENTRIES, self.COMPACTION_RATIO * len(self._rows)
+        ):
+            self.compact()
+
+    def _apply(self, op: int, offset: int) -> None:
+        self._log_entries += 1
+        position = offset + self.FRAME.size
+
+        if op == self.REMOVE:
+            key, _ = unpack_string(self._log, position)
+            row = self._rows.pop(key, None)
+            if row is not None:
+                self._live[row] = False
+                self._offsets[row] = -1
+                self._free_rows.add(row)
+            return
+
+        row, norm, _, _ = self.PUT_FIELDS.unpack_from(self._log, position)
+        key, _ = unpack_string(self._log, position + self.PUT_FIELDS.size)
+        previous = self._rows.get(key)
+        if previous is not None and previous != row:
+            self._live[previous] = False
+            self._offsets[previous] = -1
+            self._free_rows.add(previous)
+
+        self._reserve_metadata(row + 1)
+        for free_row in range(self._high_water, row):
+            self._free_rows.add(free_row)
+        self._high_water = max(self._high_water, row + 1)
+        self._free_rows.discard(row)
+
+        self._rows[key] = row
+        self._live[row] = True
+        self._norms[row] = norm
+        self._offsets[row] = offset
+        self._unindexed_rows.append(row)
+
+    def _index_metadata(self) -> None:
+        # Filter fields are only decoded once a filter needs them.
+        self._metadata.reserve(self._high_water)
+        for row in self._unindexed_rows:
+            if self._live[row]:
+                record = self._entry(row, with_embedding=False).value
+                self._metadata.set_values(
+                    row, [getattr(record, field) for field in MemoryFilter.FIELDS]
+                )
+        self._unindexed_rows = []
+
+    def _record(self, row: int) -> MemoryRecord:
+        return self._entry(row).value
+
+    def _entry(self, row: int, with_embedding: bool = True) -> DataEntry:
+        position = int(self._offsets[row]) + self.FRAME.size
+        _, _, timestamp, is_reference = self.PUT_FIELDS.unpack_from(self._log, position)
+        position += self.PUT_FIELDS.size
+        key, position = unpack_string(self._log, position)
+        external_source_name, position = unpack_string(self._log, position)
+        id, position = unpack_string(self._log, position)
+        description, position = unpack_string(self._log, position)
+        text, position = unpack_string(self._log, position)
+
+        embedding = None
+        if with_embedding:
+            embedding = self._embeddings[row].astype(float) * self._norms[row]
+        record = MemoryRecord(
+            is_reference, external_source_name, id, description, text, embedding
+        )
+        return DataEntry(key, record, datetime.fromtimestamp(timestamp))
+
+    def _encode_put(self, entry: DataEntry, row: int, norm: float) -> bytes:
+        record = entry.value
+        return self._frame(
+            self.PUT,
+            b"".join(
+                [
+                    self.PUT_FIELDS.pack(
+                        row, norm, entry.timestamp.timestamp(), record.is_reference
+                    ),
+                    pack_string(entry.key),
+                    pack_string(record.external_source_name),
+                    pack_string(record.id),
+                    pack_string(record.description),
+                    pack_string(record.text),
+                ]
+            ),
+        )
+
+    def _frame(self, op: int, payload: bytes) -> bytes:
+        return self.FRAME.pack(len(payload), op) + payload
+
+class MmapMemoryStore(MemoryStoreBase):
+    """
+    Memory store that keeps each collection in its own directory under
+    `directory` as an MmapCollection, so a restarted worker reopens its
+    collections by mapping them rather than reloading or re-embedding them.
+    """
+
+    _directory: str
+    _dtype: DTypeLike
+    _collections: Dict[str, MmapCollection]
+
+    def __init__(
+        self,
+        directory: str,
+        logger: Optional[Logger] = None,
+        dtype: DTypeLike = float32,
+    ) -> None:
+        os.makedirs(directory, exist_ok=True)
+        self._directory = directory
+        self._dtype = dtype
+        self._collections = {}
+        self._logger = logger or NullLogger()
+
+    def flush(self) -> None:
+        for collection in self._collections.values():
+            collection.flush()
+
+    def _get_collection(
+        self, collection: str, create: bool = False
+    ) -> Optional[MmapCollection]:
+        if collection in self._collections:
+            self._collections[collection].refresh()
+            return self._collections[collection]
+
+        if not collection or collection in (".", "..") or os.sep in collection:
+            raise ValueError(f"Invalid collection name: '{collection}'")
+
+        path = os.path.join(self._directory, collection)
+        if not create and not os.path.isdir(path):
+            return None
+
+        self._collections[collection] = MmapCollection(path, self._dtype)
+        return self._collections[collection]
+
+    async def get_collections_async(self) -> List[str]:
+        return [
+            name
+            for name in os.listdir(self._directory)
+            if os.path.isdir(os.path.join(self._directory, name))
+        ]
+
+    async def get_all_async(self, collection: str) -> List[DataEntry]:
+        store = self._get_collection(collection)
+        if store is None:
+            return []
+
+        return store.get_all()
+
+    async def get_async(self, collection: str, key: str) -> Optional[DataEntry]:
+        store = self._get_collection(collection)
+        if store is None:
+            return None
+
+        return store.get(key)
+
+    async def get_batch_async(
+        self, collection: str, keys: List[str], with_embeddings: bool = True
+    ) -> List[Optional[DataEntry]]:
+        # The collection is refreshed once for the whole batch.
+        store = self._get_collection(collection)
+        if store is None:
+            return [None for _ in keys]
+
+        return [store.get(key, with_embeddings) for key in keys]
+
+    async def put_async(self, collection: str, value: DataEntry) -> DataEntry:
+        self._get_collection(collection, create=True).put(
+            value.key, value.value, value.timestamp
+        )
+
+        return value
+
+    async def put_many_async(
+        self, collection: str, values: List[DataEntry]
+    ) -> List[DataEntry]:
+        self._get_collection(collection, create=True).put_many(values)
+
+        return values
+
+    async def remove_async(self, collection: str, key: str) -> None:
+        store = self._get_collection(collection)
+        if store is None:
+            return
+
+        store.remove(key)
+
+    async def get_nearest_matches_async(
+        self,
+        collection: str,
+        embedding: ndarray,
+        limit: int = 1,
+        min_relevance_score: float = 0.7,
+        filter: Optional[MemoryFilter] = None,
+    ) -> List[Tuple[MemoryRecord, float]]:
+        store = self._get_collection(collection)
+        if store is None or len(store) == 0:
+            return []
+
+        embedding = normalize_queries(embedding.reshape(-1))
+
+        return store.search(
+            embedding, limit, min_relevance_score, filter
+        )
@@ -1,5 +1,6 @@
 from typing import List, Optional
 
+from semantic_kernel.memory.memory_filter import MemoryFilter
 from semantic_kernel.memory.memory_query_result import MemoryQueryResult
 from semantic_kernel.memory.semantic_text_memory_base import SemanticTextMemoryBase
 
@@ -10,16 +11,71 @@ class NullMemory(SemanticTextMemoryBase):
     async def save_reference_async(self, collection: str, text: str, external_id: str, external_source_name: str, description:Optional[str]) -> None:
         return None
 
+    async def save_information_batch_async(
+        self,
+        collection: str,
+        texts: List[str],
+        ids: List[str],
+        descriptions: Optional[List[Optional[str]]] = None,
+        batch_size: int = 64,
+    ) -> None:
+        return None
+    
+    async def save_reference_batch_async(
+        self,
+        collection: str,
+        texts: List[str],
+        external_ids: List[str],
+        external_source_name: str,
+        descriptions: Optional[List[Optional[str]]] = None,
+        batch_size: int = 64,
+    ) -> None:
+        return None
+
     async def search_async(
         self,
         collection: str,
         query: str,
         limit: int = 1,
-        min_relevance_score: float = 0.7,    
+        min_relevance_score: float = 0.7,
+        filter: Optional[MemoryFilter] = None,
+        mmr_lambda: Optional[float] = None,
+    ) -> List[MemoryQueryResult]:
+        return []
+    
+    async def search_batch_async(
+        self,
+        collection: str,
+        queries: List[str],
+        limit: int = 1,
+        min_relevance_score: float = 0.7,
+        filter: Optional[MemoryFilter] = None,
+    ) -> List[List[MemoryQueryResult]]:
+        return [[] for _ in queries]
+    
+    async def hybrid_search_async(
+        self,
+        collection: str,
+        query: str,
+        limit: int = 1,
+        min_relevance_score: float = 0.0,
+        filter: Optional[MemoryFilter] = None,
+        fusion: str = "rrf",
+        vector_weight: float = 0.5,
     ) -> List[MemoryQueryResult]:
         return []
     
-    async def get_async(self, collection: str, query: str) -> List[str]:
+    async def get_async(
+        self, collection: str, query: str, with_embedding: bool = False
+    ) -> Optional[MemoryQueryResult]:
+        return None
+
+    async def get_batch_async(
+        self, collection: str, ids: List[str], with_embeddings: bool = False
+    ) -> List[Optional[MemoryQueryResult]]:
+        return [None for _ in ids]
+
+    async def get_collections_async(self) -> List[str]:
         return []
                 
 NullMemory.instance = NullMemory()  # type: ignore
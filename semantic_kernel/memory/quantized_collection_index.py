@@ -0,0 +1,184 @@
+from tempfile import TemporaryFile
+from typing import Iterator, List, Optional, Tuple
+
+from numpy import (
+    asarray,
+    empty,
+    float32,
+    int8,
+    maximum,
+    memmap,
+    minimum,
+    ndarray,
+    rint,
+)
+from numpy.typing import DTypeLike
+
+from semantic_kernel.memory.collection_index import CollectionIndex, CollectionView
+
+class QuantizedCollectionIndex(CollectionIndex):
+    """
+    Collection index that keeps its rows in memory only as int8 codes,
+    calibrated per dimension. Searches rank on the codes and rescore the
+    best candidates against full-precision rows memory-mapped from a
+    temporary file under `directory`.
+    """
+
+    # Candidates rescored per requested result, and the floor on that count.
+    RESCORE_FACTOR = 4
+    MIN_RESCORE_CANDIDATES = 32
+    # Fraction of the observed range added on each side when it must widen,
+    # so that recalibrating (and re-encoding every row) stays rare.
+    CALIBRATION_MARGIN = 0.1
+    # Rows read back from the mapped matrix at a time when re-encoding.
+    ENCODE_BLOCK_ROWS = 65536
+
+    _directory: Optional[str]
+    _codes: Optional[ndarray]
+    _low: Optional[ndarray]
+    _scale: Optional[ndarray]
+    _range_version: int
+    _range_version_at_compaction: int
+
+    def __init__(
+        self, dtype: DTypeLike = float32, directory: Optional[str] = None
+    ) -> None:
+        self._directory = directory
+        super().__init__(dtype)
+        self._codes = None
+        self._low = None
+        self._scale = None
+        self._range_version = 0
+        self._range_version_at_compaction = 0
+
+    @property
+    def codes(self) -> ndarray:
+        if self._codes is None:
+            return empty((0, 0), dtype=int8)
+        return self._codes[: len(self._keys)]
+
+    def candidate_count(self, limit: int) -> int:
+        return max(limit * self.RESCORE_FACTOR, self.MIN_RESCORE_CANDIDATES)
+
+    def approximate_scores(
+        self, queries: ndarray, rows: Optional[ndarray] = None
+    ) -> ndarray:
+        return self.view().approximate_scores(queries, rows)
+
+    def view(self) -> CollectionView:
+        return CollectionView(
+            self.embeddings,
+            self.norms,
+            self.live,
+            self._records,
+            self._keys,
+            self.codes,
+            self._low,
+            self._scale,
+        )
+
+    def recalibrate(self) -> None:
+        """
+        Fits the quantization range to the rows currently stored and
+        re-encodes them, tightening a range widened by earlier inserts.
+        """
+        low, high = None, None
+        for start, vectors in self._normalized_blocks():
+            vectors = vectors[self._live[start : start + len(vectors)]]
+            if len(vectors) == 0:
+                continue
+            block_low, block_high = vectors.min(axis=0), vectors.max(axis=0)
+            low = block_low if low is None else minimum(low, block_low)
+            high = block_high if high is None else maximum(high, block_high)
+        if low is None:
+            return
+
+        self._set_range(low, high)
+        self._encode_all()
+
+    def begin_compaction(self) -> ndarray:
+        self._range_version_at_compaction = self._range_version
+        return super().begin_compaction()
+
+    def finish_compaction(self, rows: ndarray, copies: List[ndarray]) -> None:
+        super().finish_compaction(rows, copies)
+
+        # A range change re-encoded every row after the codes were copied.
+        if self._codes is not None and (
+            self._range_version != self._range_version_at_compaction
+        ):
+            self._encode_all()
+
+    def _allocate(self, dimension: int) -> None:
+        self._dimension = dimension
+        self._matrix = self._mapped((self.INITIAL_CAPACITY, dimension))
+        self._codes = empty((self.INITIAL_CAPACITY, dimension), dtype=int8)
+        self._norms = empty((self.INITIAL_CAPACITY,), dtype=float)
+        self._low = None
+
+    def _mapped(self, shape: Tuple[int, ...]) -> ndarray:
+        # The file is deleted once closed; the mapping keeps it alive.
+        return memmap(
+            TemporaryFile(dir=self._directory), dtype=self._dtype, mode="w+", shape=shape
+        )
+
+    def _new_row_array(self, current: ndarray, capacity: int) -> ndarray:
+        if isinstance(current, memmap):
+            return self._mapped((capacity,) + current.shape[1:])
+        return super()._new_row_array(current, capacity)
+
+    def _write_rows(self, rows: List[int], vectors: ndarray) -> None:
+        self._matrix[rows] = vectors
+        self._calibrate(vectors)
+        self._codes[rows] = self._encode(vectors)
+
+    def _row_arrays(self) -> List[ndarray]:
+        return [self._matrix, self._codes, self._norms]
+
+    def _set_row_arrays(self, arrays: List[ndarray]) -> None:
+        self._matrix, self._codes, self._norms = arrays
+
+    def _calibrate(self, vectors: ndarray) -> None:
+        vectors = vectors.astype(float32)
+        low = vectors.min(axis=0)
+        high = vectors.max(axis=0)
+        if self._low is None:
+            self._set_range(low, high, self.CALIBRATION_MARGIN)
+            return
+
+        current_high = self._low + 255 * self._scale
+        if (low >= self._low).all() and (high <= current_high).all():
+            return
+
+        self._set_range(
+            minimum(self._low, low),
+            maximum(current_high, high),
+            self.CALIBRATION_MARGIN,
+        )
+        self._encode_all()
+
+    def _set_range(self, low: ndarray, high: ndarray, margin: float = 0.0) -> None:
+        padding = maximum((high - low) * margin, 1e-6)
+        low = low - padding
+        high = high + padding
+
+        self._low = low.astype(float32)
+        self._scale = (maximum(high - low, 1e-6) / 255).astype(float32)
+        self._range_version += 1
+
+    def _encode(self, vectors: ndarray) -> ndarray:
+        levels = rint((vectors.astype(float32) - self._low) / self._scale) - 128
+        return levels.clip(-128, 127).astype(int8)
+
+    def _encode_all(self) -> None:
+        for start, vectors in self._normalized_blocks():
+            self._codes[start : start + len(vectors)] = self._encode(vectors)
+
+    def _normalized_blocks(self) -> Iterator[Tuple[int, ndarray]]:
+        # The normalized rows, read back from the mapped matrix a block at
+        # a time.
+        size = len(self._keys)
+        for start in range(0, size, self.ENCODE_BLOCK_ROWS):
+            yield start, asarray(
+                self._matrix[start : start + self.ENCODE_BLOCK_ROWS], dtype=float32
+            )
@@ -1,20 +1,64 @@
-from typing import List, Optional
+from datetime import datetime
+from functools import partial
+from hashlib import sha256
+from logging import Logger
+from typing import Callable, Dict, List, Optional, Set, Tuple, Union
+
+from numpy import asarray, flatnonzero, inf, linalg, ndarray, stack, triu_indices
 
 from semantic_kernel.memory.semantic_text_memory_base import SemanticTextMemoryBase
+from semantic_kernel.memory.memory_filter import MemoryFilter
 from semantic_kernel.memory.memory_query_result import MemoryQueryResult
 from semantic_kernel.memory.memory_record import MemoryRecord
-from semantic_kernel.ai.embeddings.embedding_generator_base import EmbeddingGeneratorBase
+from semantic_kernel.connectors.ai.embeddings.embedding_generator_base import EmbeddingGeneratorBase
 from semantic_kernel.memory.memory_store_base import MemoryStoreBase
+from semantic_kernel.memory.similarity import mmr_indices
+from semantic_kernel.memory.storage.data_entry import DataEntry
+from semantic_kernel.utils.null_logger import NullLogger
 
 class SemanticTextMemory(SemanticTextMemoryBase):
+    # Reciprocal rank fusion constant, and how many candidates each
+    # retriever contributes per requested result.
+    RRF_K = 60
+    HYBRID_CANDIDATE_FACTOR = 4
+    # How many candidates MMR re-ranking chooses from per requested result.
+    MMR_CANDIDATE_FACTOR = 4
+
+    DUPLICATE_POLICIES = ("skip", "merge", "replace")
+
     _storage: MemoryStoreBase
     _embeddings_generator: EmbeddingGeneratorBase
+    _duplicate_policy: Optional[str]
+    _near_duplicate_threshold: Optional[float]
+    _content_indexes: Dict[str, Dict[str, str]]
+    _logger: Logger
 
     def __init__(
-        self, storage: MemoryStoreBase, embeddings_generator: EmbeddingGeneratorBase
+        self,
+        storage: MemoryStoreBase,
+        embeddings_generator: EmbeddingGeneratorBase,
+        duplicate_policy: Optional[str] = None,
+        near_duplicate_threshold: Optional[float] = 0.95,
+        logger: Optional[Logger] = None,
     ) -> None:
+        """
+        `duplicate_policy` decides what saving a duplicate of a stored text
+        does: "skip" keeps the stored record, "merge" adds the new description
+        to it and "replace" stores the new record instead; None saves every
+        text. A cosine similarity of `near_duplicate_threshold` or more makes
+        a near-duplicate; None only catches exact ones.
+        """
+        if duplicate_policy is not None and (
+            duplicate_policy not in self.DUPLICATE_POLICIES
+        ):
+            raise ValueError(f"Unknown duplicate policy '{duplicate_policy}'")
+
         self._storage = storage
         self._embeddings_generator = embeddings_generator
+        self._duplicate_policy = duplicate_policy
+        self._near_duplicate_threshold = near_duplicate_threshold
+        self._content_indexes = {}
+        self._logger = logger or NullLogger()
 
     async def save_information_async(
         self,
@@ -23,6 +67,14 @@ class SemanticTextMemory(SemanticTextMemoryBase):
         id: str,
         description: Optional[str] = None,
     ) -> None:
+        if self._duplicate_policy is not None:
+            await self._save_records_async(
+                collection,
+                [text],
+                [partial(MemoryRecord.local_record, id, text, description)],
+            )
+            return
+
         embedding = await self._embeddings_generator.generate_embeddings_async([text])
         data = MemoryRecord.local_record(id, text, description, embedding)
 
@@ -36,6 +88,21 @@ class SemanticTextMemory(SemanticTextMemoryBase):
         external_source_name: str,
         description: Optional[str] = None,
     ) -> None:
+        if self._duplicate_policy is not None:
+            await self._save_records_async(
+                collection,
+                [text],
+                [
+                    partial(
+                        MemoryRecord.reference_record,
+                        external_id,
+                        external_source_name,
+                        description,
+                    )
+                ],
+            )
+            return
+
         embedding = await self._embeddings_generator.generate_embeddings_async([text])
         data = MemoryRecord.reference_record(
             external_id, external_source_name, description, embedding
@@ -43,12 +110,321 @@ class SemanticTextMemory(SemanticTextMemoryBase):
 
         await self._storage.put_value_async(collection, external_id, data)
 
+    async def save_information_batch_async(
+        self,
+        collection: str,
+        texts: List[str],
+        ids: List[str],
+        descriptions: Optional[List[Optional[str]]] = None,
+        batch_size: int = 64,
+    ) -> None:
+        """
+        Saves many texts with one embedding call and one bulk store write
+        per `batch_size` texts.
+        """
+        descriptions = self._check_batch(texts, ids, descriptions, batch_size)
+
+        for start in range(0, len(texts), batch_size):
+            end = start + batch_size
+            await self._save_records_async(
+                collection,
+                texts[start:end],
+                [
+                    partial(MemoryRecord.local_record, id, text, description)
+                    for id, text, description in zip(
+                        ids[start:end], texts[start:end], descriptions[start:end]
+                    )
+                ],
+            )
+
+    async def save_reference_batch_async(
+        self,
+        collection: str,
+        texts: List[str],
+        external_ids: List[str],
+        external_source_name: str,
+        descriptions: Optional[List[Optional[str]]] = None,
+        batch_size: int = 64,
+    ) -> None:
+        """
+        Saves many references with one embedding call and one bulk store
+        write per `batch_size` texts.
+        """
+        descriptions = self._check_batch(texts, external_ids, descriptions, batch_size)
+
+        for start in range(0, len(texts), batch_size):
+            end = start + batch_size
+            await self._save_records_async(
+                collection,
+                texts[start:end],
+                [
+                    partial(
+                        MemoryRecord.reference_record,
+                        external_id,
+                        external_source_name,
+                        description,
+                    )
+                    for external_id, description in zip(
+                        external_ids[start:end], descriptions[start:end]
+                    )
+                ],
+            )
+
+    async def _save_records_async(
+        self,
+        collection: str,
+        texts: List[str],
+        create_records: List[Callable[[ndarray], MemoryRecord]],
+    ) -> None:
+        # `create_records` builds the record of each text from its embedding.
+        if self._duplicate_policy is None:
+            embeddings = await self._embeddings_generator.generate_embeddings_async(
+                texts
+            )
+            await self._put_records_async(
+                collection,
+                [
+                    create_record(embedding)
+                    for create_record, embedding in zip(create_records, embeddings)
+                ],
+            )
+            return
+
+        # Exact duplicates are found by content hash, of a stored record or
+        # of an earlier text in the batch, and reuse its embedding.
+        content_index = await self._get_content_index_async(collection)
+        digests = [self._digest(text) for text in texts]
+        duplicates: List[Union[None, int, MemoryRecord]] = [None] * len(texts)
+        first_texts: Dict[str, int] = {}
+        embedded: List[int] = []
+        for i, (text, digest) in enumerate(zip(texts, digests)):
+            if digest in first_texts:
+                duplicates[i] = first_texts[digest]
+                continue
+
+            first_texts[digest] = i
+            duplicates[i] = await self._get_stored_text_async(
+                collection, content_index.get(digest), text
+            )
+            if duplicates[i] is None:
+                embedded.append(i)
+
+        new_records: Dict[int, MemoryRecord] = {}
+        if embedded:
+            vectors = await self._embeddings_generator.generate_embeddings_async(
+                [texts[i] for i in embedded]
+            )
+            vectors = vectors.reshape(len(embedded), -1)
+            for i, vector in zip(embedded, vectors):
+                new_records[i] = create_records[i](vector)
+            if self._near_duplicate_threshold is not None:
+                await self._find_near_duplicates_async(
+                    collection, embedded, vectors, new_records, duplicates
+                )
+
+        # Texts are resolved in order, so a duplicate of an earlier text in
+        # the batch is compared with whatever that text was resolved to.
+        # Resolving a duplicate merges or replaces its record, so every text
+        # resolved to that record is moved on to the result.
+        resolved: List[MemoryRecord] = []
+        resolved_by_id: Dict[str, List[int]] = {}
+        records: Dict[str, MemoryRecord] = {}
+        removed: Set[str] = set()
+        for i, create_record in enumerate(create_records):
+            duplicate = duplicates[i]
+            if isinstance(duplicate, int):
+                duplicate = resolved[duplicate]
+            # Only exact duplicates are not embedded.
+            record = new_records.get(i) or create_record(duplicate.embedding)
+            record = self._resolve_duplicate(duplicate, record, records, removed)
+
+            resolved.append(record)
+            moved = []
+            if duplicate is not None:
+                moved = resolved_by_id.pop(duplicate.id, [])
+            for j in moved:
+                resolved[j] = record
+            moved.append(i)
+            resolved_by_id.setdefault(record.id, []).extend(moved)
+
+        for key in removed:
+            await self._storage.remove_async(collection, key)
+        await self._put_records_async(collection, list(records.values()))
+        for digest, record in zip(digests, resolved):
+            content_index[digest] = record.id
+
+    async def _get_content_index_async(self, collection: str) -> Dict[str, str]:
+        # The content hash -> id index is built from the stored texts on
+        # first use. Entries may be stale, so every hit is checked.
+        content_index = self._content_indexes.get(collection)
+        if content_index is None:
+            content_index = {
+                self._digest(entry.value.text): entry.key
+                for entry in await self._storage.get_all_async(collection)
+                if entry.value.text is not None
+            }
+            self._content_indexes[collection] = content_index
+        return content_index
+
+    async def _get_stored_text_async(
+        self, collection: str, key: Optional[str], text: str
+    ) -> Optional[MemoryRecord]:
+        if key is None:
+            return None
+
+        entry = await self._storage.get_async(collection, key)
+        if entry is None:
+            return None
+        # References do not keep their text, so the hash has to do.
+        if entry.value.text is not None and entry.value.text != text:
+            return None
+        return entry.value
+
+    async def _find_near_duplicates_async(
+        self,
+        collection: str,
+        embedded: List[int],
+        vectors: ndarray,
+        new_records: Dict[int, MemoryRecord],
+        duplicates: List[Union[None, int, MemoryRecord]],
+    ) -> None:
+        threshold = self._near_duplicate_threshold
+        norms = linalg.norm(vectors, axis=1)
+        valid = flatnonzero(norms)
+        if len(valid) == 0:
+            return
+
+        # The closest stored record, or earlier text in the batch, at or
+        # above the threshold. Two matches are fetched per text in case
+        # the first is the record the text is about to overwrite.
+        matches = await self._storage.get_nearest_matches_batch_async(
+            collection, vectors[valid], 2, threshold
+        )
+        unit_vectors = vectors[valid] / norms[valid].reshape(-1, 1)
+        similarities = unit_vectors.dot(unit_vectors.T)
+        similarities[triu_indices(len(valid))] = -inf
+
+        for position, (row, row_matches) in enumerate(zip(valid, matches)):
+            i = embedded[row]
+            best_score = -inf
+            for record, score in row_matches:
+                if record.id != new_records[i].id:
+                    duplicates[i], best_score = record, score
+                    break
+
+            earlier = int(similarities[position].argmax()) if position > 0 else None
+            if (
+                earlier is not None
+                and similarities[position, earlier] >= threshold
+                and similarities[position, earlier] > best_score
+            ):
+                duplicates[i] = embedded[valid[earlier]]
+
+    def _resolve_duplicate(
+        self,
+        duplicate: Optional[MemoryRecord],
+        record: MemoryRecord,
+        records: Dict[str, MemoryRecord],
+        removed: Set[str],
+    ) -> MemoryRecord:
+        """
+        Applies the duplicate policy to a new record, updating the records to
+        write and the keys to remove, and returns the record holding its content.
+        """
+        if duplicate is not None and duplicate.id != record.id:
+            if self._duplicate_policy == "skip":
+                return duplicate
+
+            if self._duplicate_policy == "merge":
+                description = duplicate.description
+                if record.description and record.description not in (
+                    description or ""
+                ).split("\n"):
+                    description = (
+                        f"{description}\n{record.description}"
+                        if description
+                        else record.description
+                    )
+                record = MemoryRecord(
+                    duplicate.is_reference,
+                    duplicate.external_source_name,
+                    duplicate.id,
+                    description,
+                    duplicate.text,
+                    duplicate.embedding,
+                )
+            else:
+                records.pop(duplicate.id, None)
+                removed.add(duplicate.id)
+
+        records[record.id] = record
+        removed.discard(record.id)
+        return record
+
+    @staticmethod
+    def _digest(text: str) -> str:
+        return sha256(text.encode("utf-8")).hexdigest()
+
+    async def _put_records_async(
+        self, collection: str, records: List[MemoryRecord]
+    ) -> None:
+        now = datetime.now()
+        await self._storage.put_many_async(
+            collection, [DataEntry(record.id, record, now) for record in records]
+        )
+
+    @staticmethod
+    def _check_batch(
+        texts: List[str],
+        ids: List[str],
+        descriptions: Optional[List[Optional[str]]],
+        batch_size: int,
+    ) -> List[Optional[str]]:
+        if batch_size <= 0:
+            raise ValueError("The batch size must be a positive integer")
+        if len(ids) != len(texts):
+            raise ValueError("The number of ids must match the number of texts")
+        if descriptions is None:
+            return [None] * len(texts)
+        if len(descriptions) != len(texts):
+            raise ValueError(
+                "The number of descriptions must match the number of texts"
+            )
+        return descriptions
+
     async def get_async(
         self,
         collection: str,
         query: str,
+        with_embedding: bool = False,
     ) -> Optional[MemoryQueryResult]:
-        raise NotImplementedError()
+        """
+        Looks a memory up by the id it was saved under, without an embedding
+        call or a search.
+        """
+        entry = await self._storage.get_async(collection, query)
+        if entry is None:
+            return None
+
+        return MemoryQueryResult.from_memory_record(entry.value, 1.0, with_embedding)
+
+    async def get_batch_async(
+        self,
+        collection: str,
+        ids: List[str],
+        with_embeddings: bool = False,
+    ) -> List[Optional[MemoryQueryResult]]:
+        """
+        Looks many memories up by id in one store call, with None for the ids
+        not found.
+        """
+        entries = await self._storage.get_batch_async(collection, ids, with_embeddings)
+        return [
+            MemoryQueryResult.from_memory_record(entry.value, 1.0, with_embeddings)
+            if entry is not None
+            else None
+            for entry in entries
+        ]
 
     async def search_async(
         self,
@@ -56,16 +432,146 @@ class SemanticTextMemory(SemanticTextMemoryBase):
         query: str,
         limit: int = 1,
         min_relevance_score: float = 0.7,
+        filter: Optional[MemoryFilter] = None,
+        mmr_lambda: Optional[float] = None,
     ) -> List[MemoryQueryResult]:
+        """
+        Searches a collection by embedding similarity. With `mmr_lambda` the
+        matches are re-ranked by maximal marginal relevance, from 1 (relevance
+        only) to 0 (diversity only).
+        """
+        if mmr_lambda is not None and not 0 <= mmr_lambda <= 1:
+            raise ValueError("The MMR lambda must be between 0 and 1")
+
         query_embedding = await self._embeddings_generator.generate_embeddings_async(
             [query]
         )
-        results = await self._storage.get_nearest_matches_async(
-            collection, query_embedding, limit, min_relevance_score
-        )
+        if mmr_lambda is None:
+            results = await self._storage.get_nearest_matches_async(
+                collection, query_embedding, limit, min_relevance_score, filter
+            )
+        else:
+            candidates = await self._storage.get_nearest_matches_async(
+                collection,
+                query_embedding,
+                limit * self.MMR_CANDIDATE_FACTOR,
+                min_relevance_score,
+                filter,
+            )
+            results = self._rerank_mmr(candidates, limit, mmr_lambda)
 
         return [MemoryQueryResult.from_memory_record(r[0], r[1]) for r in results]
 
+    @staticmethod
+    def _rerank_mmr(
+        candidates: List[Tuple[MemoryRecord, float]], limit: int, mmr_lambda: float
+    ) -> List[Tuple[MemoryRecord, float]]:
+        if not candidates:
+            return []
+
+        embeddings = stack(
+            [
+                asarray(record.embedding, dtype=float).reshape(-1)
+                for record, _ in candidates
+            ]
+        )
+        selected = mmr_indices(
+            [score for _, score in candidates], embeddings, limit, mmr_lambda
+        )
+        return [candidates[i] for i in selected]
+
+    async def search_batch_async(
+        self,
+        collection: str,
+        queries: List[str],
+        limit: int = 1,
+        min_relevance_score: float = 0.7,
+        filter: Optional[MemoryFilter] = None,
+    ) -> List[List[MemoryQueryResult]]:
+        if not queries:
+            return []
+
+        query_embeddings = await self._embeddings_generator.generate_embeddings_async(
+            queries
+        )
+        batch_results = await self._storage.get_nearest_matches_batch_async(
+            collection, query_embeddings, limit, min_relevance_score, filter
+        )
+
+        return [
+            [MemoryQueryResult.from_memory_record(r[0], r[1]) for r in results]
+            for results in batch_results
+        ]
+
+
+    async def hybrid_search_async(
+        self,
+        collection: str,
+        query: str,
+        limit: int = 1,
+        min_relevance_score: float = 0.0,
+        filter: Optional[MemoryFilter] = None,
+        fusion: str = "rrf",
+        vector_weight: float = 0.5,
+    ) -> List[MemoryQueryResult]:
+        """
+        Searches a collection by embedding similarity and by BM25, and fuses
+        the two rankings by reciprocal rank ("rrf") or by weighted score
+        ("weighted"). Stores without a lexical index for the collection fall
+        back to the vector search, with a warning.
+        """
+        if fusion not in ("rrf", "weighted"):
+            raise ValueError(f"Unknown fusion method '{fusion}'")
+        has_lexical_index = self._storage.has_lexical_index(collection)
+        if not has_lexical_index:
+            self._logger.warning(
+                f"{type(self._storage).__name__} keeps no lexical index for "
+                f"collection '{collection}'; hybrid search falls back to "
+                f"vector similarity alone. Create the store or collection "
+                f"with lexical_index=True to fuse BM25 scores."
+            )
+
+        candidate_count = limit * self.HYBRID_CANDIDATE_FACTOR
+        query_embedding = await self._embeddings_generator.generate_embeddings_async(
+            [query]
+        )
+        vector_matches = await self._storage.get_nearest_matches_async(
+            collection, query_embedding, candidate_count, min_relevance_score, filter
+        )
+        if not has_lexical_index:
+            return [
+                MemoryQueryResult.from_memory_record(record, score)
+                for record, score in vector_matches[:limit]
+            ]
+        lexical_matches = await self._storage.get_lexical_matches_async(
+            collection, query, candidate_count, filter
+        )
+
+        records: Dict[str, MemoryRecord] = {}
+        scores: Dict[str, float] = {}
+        if fusion == "rrf":
+            for matches in (vector_matches, lexical_matches):
+                for rank, (record, _) in enumerate(matches):
+                    records[record.id] = record
+                    scores[record.id] = scores.get(record.id, 0.0) + 1 / (
+                        self.RRF_K + rank + 1
+                    )
+        else:
+            for record, score in vector_matches:
+                records[record.id] = record
+                scores[record.id] = vector_weight * float(score)
+            top_lexical_score = lexical_matches[0][1] if lexical_matches else 1.0
+            for record, score in lexical_matches:
+                records[record.id] = record
+                scores[record.id] = scores.get(record.id, 0.0) + (
+                    1 - vector_weight
+                ) * float(score / top_lexical_score)
+
+        ranked = sorted(scores.items(), key=lambda item: item[1], reverse=True)
+        return [
+            MemoryQueryResult.from_memory_record(records[id], score)
+            for id, score in ranked[:limit]
+        ]
 
     async def get_collections_async(self) -> List[str]:
-        raise NotImplementedError()
\ No newline at end of file
+        return await self._storage.get_collections_async()
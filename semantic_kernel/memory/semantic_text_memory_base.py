@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
 from typing import List, Optional
+from semantic_kernel.memory.memory_filter import MemoryFilter
 from semantic_kernel.memory.memory_query_result import MemoryQueryResult
 
 class SemanticTextMemoryBase(ABC):
@@ -22,11 +23,41 @@ class SemanticTextMemoryBase(ABC):
         description: Optional[str] = None,) -> None:
         pass
     
+    @abstractmethod
+    async def save_information_batch_async(
+        self,
+        collection: str,
+        texts: List[str],
+        ids: List[str],
+        descriptions: Optional[List[Optional[str]]] = None,
+        batch_size: int = 64,) -> None:
+        pass
+    
+    @abstractmethod
+    async def save_reference_batch_async(
+        self,
+        collection: str,
+        texts: List[str],
+        external_ids: List[str],
+        external_source_name: str,
+        descriptions: Optional[List[Optional[str]]] = None,
+        batch_size: int = 64,) -> None:
+        pass
+    
     @abstractmethod
     async def get_async(
         self,
         collection: str,
-        query: str,) -> Optional[MemoryQueryResult]:
+        query: str,
+        with_embedding: bool = False,) -> Optional[MemoryQueryResult]:
+        pass
+    
+    @abstractmethod
+    async def get_batch_async(
+        self,
+        collection: str,
+        ids: List[str],
+        with_embeddings: bool = False,) -> List[Optional[MemoryQueryResult]]:
         pass
     
     @abstractmethod
@@ -35,7 +66,31 @@ class SemanticTextMemoryBase(ABC):
         collection: str,
         query: str,
         limit: int = 1,
-        min_relevance_score: float = 0.7,) -> List[MemoryQueryResult]:
+        min_relevance_score: float = 0.7,
+        filter: Optional[MemoryFilter] = None,
+        mmr_lambda: Optional[float] = None,) -> List[MemoryQueryResult]:
+        pass
+    
+    @abstractmethod
+    async def search_batch_async(
+        self,
+        collection: str,
+        queries: List[str],
+        limit: int = 1,
+        min_relevance_score: float = 0.7,
+        filter: Optional[MemoryFilter] = None,) -> List[List[MemoryQueryResult]]:
+        pass
+    
+    @abstractmethod
+    async def hybrid_search_async(
+        self,
+        collection: str,
+        query: str,
+        limit: int = 1,
+        min_relevance_score: float = 0.0,
+        filter: Optional[MemoryFilter] = None,
+        fusion: str = "rrf",
+        vector_weight: float = 0.5,) -> List[MemoryQueryResult]:
         pass
     
     @abstractmethod
@@ -0,0 +1,322 @@
+from multiprocessing.shared_memory import SharedMemory
+from typing import Dict, List, Optional, Tuple
+
+from numpy import (
+    asarray,
+    concatenate,
+    dtype as numpy_dtype,
+    empty,
+    flatnonzero,
+    float32,
+    int64,
+    linalg,
+    ndarray,
+    searchsorted,
+)
+from numpy.typing import DTypeLike
+
+from semantic_kernel.memory.collection_index import with_embedding
+from semantic_kernel.memory.memory_filter import MemoryFilter
+from semantic_kernel.memory.memory_record import MemoryRecord
+from semantic_kernel.memory.metadata_index import MetadataIndex
+from semantic_kernel.memory.similarity import top_k_rows
+
+class SharedMemoryShard:
+    """
+    A fixed number of embedding rows in one `multiprocessing.shared_memory`
+    block: the normalized matrix, then the original norms, then the live
+    mask. Other processes attach to the block by name instead of being
+    sent the arrays.
+    """
+
+    ALIGNMENT = 64
+
+    capacity: int
+    dimension: int
+    dtype: numpy_dtype
+    embeddings: ndarray
+    norms: ndarray
+    live: ndarray
+
+    _memory: SharedMemory
+
+    def __init__(
+        self,
+        capacity: int,
+        dimension: int,
+        dtype: DTypeLike = float32,
+        name: Optional[str] = None,
+    ) -> None:
+        self.capacity = capacity
+        self.dimension = dimension
+        self.dtype = numpy_dtype(dtype)
+
+        norms_offset = self._align(capacity * dimension * self.dtype.itemsize)
+        live_offset = self._align(norms_offset + capacity * numpy_dtype(float).itemsize)
+        if name is None:
+            self._memory = SharedMemory(create=True, size=live_offset + capacity)
+        else:
+            self._memory = SharedMemory(name=name)
+
+        buffer = self._memory.buf
+        self.embeddings = ndarray((capacity, dimension), self.dtype, buffer)
+        self.norms = ndarray((capacity,), float, buffer, norms_offset)
+        self.live = ndarray((capacity,), bool, buffer, live_offset)
+        if name is None:
+            self.live[:] = False
+
+    @property
+    def name(self) -> str:
+        return self._memory.name
+
+    def close(self, unlink: bool = False) -> None:
+        # The block cannot be closed while arrays still point into it.
+        del self.embeddings, self.norms, self.live
+        self._memory.close()
+        if unlink:
+            self._memory.unlink()
+
+    def search(
+        self,
+        queries: ndarray,
+        count: int,
+        limit: int,
+        min_relevance_score: float,
+        rows: Optional[ndarray] = None,
+    ) -> List[Tuple[ndarray, ndarray]]:
+        """
+        Finds the top (rows, scores) of the shard for each normalized query,
+        among `rows` when given and otherwise the first `count` live rows.
+        """
+        return top_k_rows(
+            queries,
+            self.embeddings[:count],
+            self.norms[:count],
+            limit,
+            min_relevance_score,
+            rows,
+            self.live[:count],
+        )
+
+    def _align(self, offset: int) -> int:
+        return -(-offset // self.ALIGNMENT) * self.ALIGNMENT
+
+# Shards attached by a searcher process, by name. They stay attached for
+# the life of the process, so the memory of a released shard is only
+# returned once its searchers have exited.
+_attached_shards: Dict[str, SharedMemoryShard] = {}
+
+def search_shard(
+    name: str,
+    capacity: int,
+    dimension: int,
+    dtype: DTypeLike,
+    count: int,
+    queries: ndarray,
+    limit: int,
+    min_relevance_score: float,
+    rows: Optional[ndarray] = None,
+) -> List[Tuple[ndarray, ndarray]]:
+    """
+    Searches a shard by name, attaching to it on first use. Runs in the
+    searcher processes of a SharedMemoryStore.
+    """
+    shard = _attached_shards.get(name)
+    if shard is None:
+        shard = SharedMemoryShard(capacity, dimension, dtype, name)
+        _attached_shards[name] = shard
+    return shard.search(queries, count, limit, min_relevance_score, rows)
+
+class SharedMemoryIndex:
+    """
+    The embeddings of a memory collection, in shards of `shard_size` rows
+    held in shared memory, plus the records (without their embedding) and
+    MetadataIndex of every row. Removed rows are reused by later inserts,
+    and each row given to a new key is stamped with the next `generation`.
+    """
+
+    _shard_size: int
+    _dtype: numpy_dtype
+    _dimension: Optional[int]
+    _shards: List[SharedMemoryShard]
+    _keys: List[Optional[str]]
+    _records: List[Optional[MemoryRecord]]
+    _rows: Dict[str, int]
+    _free_rows: List[int]
+    _metadata: MetadataIndex
+    _generation: int
+    _row_generations: List[int]
+
+    def __init__(self, shard_size: int, dtype: DTypeLike = float32) -> None:
+        if shard_size < 1:
+            raise ValueError("The shard size must be at least 1")
+
+        self._shard_size = shard_size
+        self._dtype = numpy_dtype(dtype)
+        self._shards = []
+        # Not reset by `close`, so rows handed out before it stay older.
+        self._generation = 0
+        self._clear()
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._rows
+
+    @property
+    def shard_size(self) -> int:
+        return self._shard_size
+
+    @property
+    def shards(self) -> List[SharedMemoryShard]:
+        return self._shards
+
+    @property
+    def size(self) -> int:
+        # Rows in use, free ones included.
+        return len(self._keys)
+
+    @property
+    def keys(self) -> List[Optional[str]]:
+        return self._keys
+
+    @property
+    def generation(self) -> int:
+        return self._generation
+
+    @property
+    def row_bytes(self) -> int:
+        if self._dimension is None:
+            return 0
+        return self._dimension * self._dtype.itemsize + numpy_dtype(float).itemsize + 1
+
+    def record(self, row: int, generation: Optional[int] = None) -> Optional[MemoryRecord]:
+        """
+        The record of a row, or None if the row is free or was given to
+        another key after `generation`.
+        """
+        record = self._records[row] if row < len(self._records) else None
+        if record is None or (
+            generation is not None and self._row_generations[row] > generation
+        ):
+            return None
+
+        shard = self._shards[row // self._shard_size]
+        shard_row = row % self._shard_size
+        return with_embedding(
+            record, shard.embeddings[shard_row].astype(float) * shard.norms[shard_row]
+        )
+
+    def get_records(self, keys: List[str]) -> List[Optional[MemoryRecord]]:
+        return [self.record(self._rows[key]) if key in self._rows else None for key in keys]
+
+    def upsert(self, key: str, record: MemoryRecord) -> MemoryRecord:
+        """
+        Inserts or replaces a record, returning the copy kept without its
+        embedding.
+        """
+        vector = asarray(record.embedding, dtype=float).reshape(-1)
+
+        if self._dimension is None or (
+            len(self._rows) == 0 and self._dimension != vector.shape[0]
+        ):
+            self.close()
+            self._dimension = vector.shape[0]
+        elif self._dimension != vector.shape[0]:
+            raise ValueError(
+                f"Embedding dimension {vector.shape[0]} does not match "
+                f"the collection dimension {self._dimension}"
+            )
+
+        row = self._rows.get(key)
+        if row is None:
+            if self._free_rows:
+                row = self._free_rows.pop()
+            else:
+                row = len(self._keys)
+                self._keys.append(None)
+                self._records.append(None)
+                self._row_generations.append(0)
+            self._generation += 1
+            self._row_generations[row] = self._generation
+            if row // self._shard_size >= len(self._shards):
+                self._shards.append(
+                    SharedMemoryShard(self._shard_size, self._dimension, self._dtype)
+                )
+
+        shard = self._shards[row // self._shard_size]
+        shard_row = row % self._shard_size
+        norm = linalg.norm(vector)
+        shard.embeddings[shard_row] = vector / norm if norm != 0 else vector
+        shard.norms[shard_row] = norm
+        shard.live[shard_row] = True
+
+        self._rows[key] = row
+        self._keys[row] = key
+        self._records[row] = with_embedding(record, None)
+        self._metadata.set(row, record)
+        return self._records[row]
+
+    def remove(self, key: str) -> None:
+        row = self._rows.pop(key, None)
+        if row is None:
+            return
+
+        self._shards[row // self._shard_size].live[row % self._shard_size] = False
+        self._keys[row] = None
+        self._records[row] = None
+        self._free_rows.append(row)
+
+    def shard_counts(self) -> List[int]:
+        # The rows in use in each shard.
+        size = len(self._keys)
+        return [
+            min(self._shard_size, size - start)
+            for start in range(0, size, self._shard_size)
+        ]
+
+    def rows(self, filter: MemoryFilter) -> ndarray:
+        """
+        The live rows that match a filter, in order.
+        """
+        if not self._shards:
+            return empty((0,), dtype=int64)
+
+        live = concatenate(
+            [
+                shard.live[:count]
+                for shard, count in zip(self._shards, self.shard_counts())
+            ]
+        )
+        return flatnonzero(self._metadata.mask(filter, len(self._keys), self._rows) & live)
+
+    def split(self, rows: ndarray) -> List[Optional[ndarray]]:
+        """
+        Splits sorted rows by shard, renumbered within each shard.
+        """
+        bounds = searchsorted(
+            rows, range(0, self._shard_size * (len(self._shards) + 1), self._shard_size)
+        )
+        return [
+            rows[bounds[i] : bounds[i + 1]] - i * self._shard_size
+            for i in range(len(self._shards))
+        ]
+
+    def close(self) -> None:
+        """
+        Releases the shared memory of every shard.
+        """
+        for shard in self._shards:
+            shard.close(unlink=True)
+        self._shards = []
+        self._clear()
+
+    def _clear(self) -> None:
+        self._dimension = None
+        self._keys = []
+        self._records = []
+        self._rows = {}
+        self._free_rows = []
+        self._metadata = MetadataIndex()
+        self._row_generations = []
@@ -0,0 +1,168 @@
+import asyncio
+from concurrent.futures import ProcessPoolExecutor
+from logging import Logger
+from multiprocessing.context import BaseContext
+from typing import Dict, List, Optional, Tuple
+
+from numpy import float32, ndarray
+from numpy.typing import DTypeLike
+
+from semantic_kernel.memory.memory_filter import MemoryFilter
+from semantic_kernel.memory.memory_record import MemoryRecord
+from semantic_kernel.memory.memory_store_base import MemoryStoreBase
+from semantic_kernel.memory.shared_memory_index import SharedMemoryIndex, search_shard
+from semantic_kernel.memory.similarity import merge_top_k, normalize_queries
+from semantic_kernel.memory.storage.data_entry import DataEntry
+from semantic_kernel.memory.storage.indexed_data_store import IndexedDataStore
+
+from semantic_kernel.utils.null_logger import NullLogger
+
+class SharedMemoryStore(IndexedDataStore, MemoryStoreBase):
+    """
+    In-memory store whose collections are held in shards in
+    `multiprocessing.shared_memory` and searched by a pool of `max_workers`
+    processes, so only the queries and each shard's top rows cross process
+    boundaries. Call `close_async` to stop the searchers and release the
+    shared memory.
+    """
+
+    _indexes: Dict[str, SharedMemoryIndex]
+    _shard_size: int
+    _dtype: DTypeLike
+    _max_workers: Optional[int]
+    _mp_context: Optional[BaseContext]
+    _pool: Optional[ProcessPoolExecutor]
+
+    def __init__(
+        self,
+        logger: Optional[Logger] = None,
+        shard_size: int = 65536,
+        max_workers: Optional[int] = None,
+        dtype: DTypeLike = float32,
+        mp_context: Optional[BaseContext] = None,
+    ) -> None:
+        if shard_size < 1:
+            raise ValueError("The shard size must be at least 1")
+
+        super().__init__()
+        self._indexes = {}
+        self._shard_size = shard_size
+        self._dtype = dtype
+        self._max_workers = max_workers
+        self._mp_context = mp_context
+        self._pool = None
+        self._logger = logger or NullLogger()
+
+    async def put_async(self, collection: str, value: DataEntry) -> DataEntry:
+        if collection not in self._indexes:
+            self._indexes[collection] = SharedMemoryIndex(self._shard_size, self._dtype)
+        # The index keeps the only copy of the embedding.
+        record = self._indexes[collection].upsert(value.key, value.value)
+        await super().put_async(
+            collection, DataEntry(value.key, record, value.timestamp)
+        )
+
+        return value
+
+    async def remove_async(self, collection: str, key: str) -> None:
+        if collection in self._indexes:
+            self._indexes[collection].remove(key)
+
+        await super().remove_async(collection, key)
+
+    async def close_async(self) -> None:
+        # The searchers exit before the shards they attached are released.
+        if self._pool is not None:
+            await asyncio.get_running_loop().run_in_executor(
+                None, self._pool.shutdown
+            )
+            self._pool = None
+
+        for index in self._indexes.values():
+            index.close()
+        self._indexes = {}
+        self._store = {}
+
+    async def get_nearest_matches_async(
+        self,
+        collection: str,
+        embedding: ndarray,
+        limit: int = 1,
+        min_relevance_score: float = 0.7,
+        filter: Optional[MemoryFilter] = None,
+    ) -> List[Tuple[MemoryRecord, float]]:
+        results = await self.get_nearest_matches_batch_async(
+            collection, embedding.reshape(1, -1), limit, min_relevance_score, filter
+        )
+        return results[0]
+
+    async def get_nearest_matches_batch_async(
+        self,
+        collection: str,
+        embeddings: ndarray,
+        limit: int = 1,
+        min_relevance_score: float = 0.7,
+        filter: Optional[MemoryFilter] = None,
+    ) -> List[List[Tuple[MemoryRecord, float]]]:
+        embeddings = embeddings.reshape(embeddings.shape[0], -1)
+
+        await self._expire_async(collection)
+        index = self._indexes.get(collection)
+        if index is None or len(index) == 0:
+            return [[] for _ in range(embeddings.shape[0])]
+
+        queries = normalize_queries(embeddings)
+        generation = index.generation
+
+        shard_rows: List[Optional[ndarray]] = [None] * len(index.shards)
+        if filter is not None:
+            shard_rows = index.split(index.rows(filter))
+
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(
+                max_workers=self._max_workers, mp_context=self._mp_context
+            )
+
+        loop = asyncio.get_running_loop()
+        starts, searches = [], []
+        for i, (shard, count) in enumerate(zip(index.shards, index.shard_counts())):
+            rows = shard_rows[i]
+            if rows is not None and len(rows) == 0:
+                continue
+
+            starts.append(i * index.shard_size)
+            searches.append(
+                loop.run_in_executor(
+                    self._pool,
+                    search_shard,
+                    shard.name,
+                    shard.capacity,
+                    shard.dimension,
+                    shard.dtype,
+                    count,
+                    queries,
+                    limit,
+                    min_relevance_score,
+                    rows,
+                )
+            )
+        if not searches:
+            return [[] for _ in range(embeddings.shape[0])]
+        shard_results = await asyncio.gather(*searches)
+
+        # Rows removed, or given to another key, while the shards were
+        # searched are dropped.
+        results = []
+        for top_rows, scores in merge_top_k(starts, shard_results, limit):
+            matches = [
+                (row, index.record(row, generation), score)
+                for row, score in zip(top_rows.tolist(), scores)
+            ]
+            self._touch(
+                collection,
+                [index.keys[row] for row, record, _ in matches if record is not None],
+            )
+            results.append(
+                [(record, score) for _, record, score in matches if record is not None]
+            )
+        return results
@@ -0,0 +1,166 @@
+from typing import List, Optional, Tuple
+
+from numpy import (
+    argpartition,
+    asarray,
+    concatenate,
+    copyto,
+    einsum,
+    empty,
+    flatnonzero,
+    float16,
+    float32,
+    inf,
+    int8,
+    int64,
+    lexsort,
+    linalg,
+    maximum,
+    nan,
+    ndarray,
+    result_type,
+    where,
+)
+
+# Storage types without BLAS kernels, and the rows of such a matrix
+# converted to float32 at a time when scoring several queries; a block
+# of that size stays in cache.
+UPCAST_DTYPES = (float16, int8)
+UPCAST_BLOCK_ROWS = 512
+
+def top_k_indices(scores: ndarray, limit: int, min_relevance_score: float) -> ndarray:
+    """
+    Selects the rows of the `limit` highest scores that are at least
+    `min_relevance_score`, by descending score, with ties broken by row as
+    in a stable sort.
+    """
+    candidates = flatnonzero(scores >= min_relevance_score)
+    if limit <= 0:
+        return candidates[:0]
+
+    if len(candidates) > limit:
+        candidate_scores = scores[candidates]
+        partition = argpartition(-candidate_scores, limit - 1)[:limit]
+        kth_score = candidate_scores[partition].min()
+
+        above = candidates[candidate_scores > kth_score]
+        ties = candidates[candidate_scores == kth_score][: limit - len(above)]
+        candidates = concatenate([above, ties])
+
+    return candidates[lexsort((candidates, -scores[candidates]))]
+
+def normalize_queries(queries: ndarray) -> ndarray:
+    """
+    Scales queries to unit length, so that their dot products with
+    normalized rows are cosine similarity scores.
+    """
+    norms = linalg.norm(queries, axis=-1, keepdims=True)
+    if not norms.all():
+        raise ValueError(
+            f"Invalid vectors, cannot compute cosine similarity scores"
+            f"for zero vectors"
+            f"{queries}"
+        )
+    return queries / norms
+
+def score_rows(queries: ndarray, matrix: ndarray) -> ndarray:
+    """
+    Computes `queries @ matrix.T` in the precision of `matrix`, converting
+    float16 and int8 rows, which have no BLAS kernels, a block at a time
+    instead of copying the matrix.
+    """
+    if matrix.dtype not in UPCAST_DTYPES:
+        return queries.astype(result_type(matrix.dtype, float32), copy=False).dot(
+            matrix.T
+        )
+
+    queries = queries.astype(float32, copy=False)
+    if queries.shape[0] == 1:
+        return einsum(
+            "ij,j->i", matrix, queries[0], dtype=float32, casting="unsafe"
+        ).reshape(1, -1)
+
+    scores = empty((queries.shape[0], matrix.shape[0]), dtype=float32)
+    block = empty((min(UPCAST_BLOCK_ROWS, matrix.shape[0]), matrix.shape[1]), float32)
+    for start in range(0, matrix.shape[0], UPCAST_BLOCK_ROWS):
+        rows = matrix[start : start + UPCAST_BLOCK_ROWS]
+        copyto(block[: rows.shape[0]], rows, casting="unsafe")
+        scores[:, start : start + rows.shape[0]] = queries.dot(
+            block[: rows.shape[0]].T
+        )
+    return scores
+
+def top_k_rows(
+    queries: ndarray,
+    embeddings: ndarray,
+    norms: ndarray,
+    limit: int,
+    min_relevance_score: float,
+    rows: Optional[ndarray] = None,
+    live: Optional[ndarray] = None,
+) -> List[Tuple[ndarray, ndarray]]:
+    """
+    Scores normalized queries against the normalized rows of `embeddings`
+    and selects the top rows of each, as (rows, scores) pairs. Only `rows`
+    are scored when given; otherwise rows not set in `live` are skipped.
+    Rows with a zero norm score -1.
+    """
+    if rows is None:
+        scores = score_rows(queries, embeddings)
+        scores[:, norms == 0] = -1.0
+        if live is not None and not live.all():
+            scores[:, ~live] = nan
+    else:
+        scores = score_rows(queries, embeddings[rows])
+        scores[:, norms[rows] == 0] = -1.0
+
+    results = []
+    for query_scores in scores:
+        top = top_k_indices(query_scores, limit, min_relevance_score)
+        results.append((top if rows is None else rows[top], query_scores[top]))
+    return results
+
+def merge_top_k(
+    starts: List[int], shard_results: List[List[Tuple[ndarray, ndarray]]], limit: int
+) -> List[Tuple[ndarray, ndarray]]:
+    """
+    Merges the per-query (rows, scores) top rows of shards whose rows
+    begin at `starts` into the top `limit` rows of each query.
+    Concatenating the shards in order keeps ties broken by row.
+    """
+    results = []
+    for query_results in zip(*shard_results):
+        rows = concatenate(
+            [start + rows for start, (rows, _) in zip(starts, query_results)]
+        )
+        scores = concatenate([scores for _, scores in query_results])
+        top = top_k_indices(scores, limit, -inf)
+        results.append((rows[top], scores[top]))
+    return results
+
+def mmr_indices(
+    relevance_scores: ndarray, embeddings: ndarray, limit: int, mmr_lambda: float
+) -> ndarray:
+    """
+    Selects up to `limit` rows by maximal marginal relevance, weighing
+    relevance by `mmr_lambda` against similarity to the rows already taken.
+    """
+    count = min(limit, embeddings.shape[0])
+    if count <= 0:
+        return empty((0,), dtype=int64)
+
+    norms = linalg.norm(embeddings, axis=1)
+    vectors = embeddings / where(norms == 0, 1.0, norms).reshape(-1, 1)
+    similarities = vectors.dot(vectors.T)
+
+    # Nothing is taken yet for the first step, so it goes by relevance.
+    relevance = mmr_lambda * asarray(relevance_scores, dtype=float)
+    selected = [int(relevance.argmax())]
+    max_similarities = similarities[selected[0]].copy()
+    for _ in range(count - 1):
+        scores = relevance - (1 - mmr_lambda) * max_similarities
+        scores[selected] = -inf
+        row = int(scores.argmax())
+        selected.append(row)
+        maximum(max_similarities, similarities[row], out=max_similarities)
+    return asarray(selected, dtype=int64)
@@ -0,0 +1,281 @@
+from datetime import datetime
+from functools import partial
+from logging import Logger
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from numpy import asarray, flatnonzero, float32, frombuffer, ndarray, stack
+
+from semantic_kernel.memory.collection_index import CollectionIndex
+from semantic_kernel.memory.memory_filter import MemoryFilter
+from semantic_kernel.memory.memory_record import MemoryRecord
+from semantic_kernel.memory.memory_store_base import MemoryStoreBase
+from semantic_kernel.memory.similarity import normalize_queries, top_k_rows
+from semantic_kernel.memory.storage.data_entry import DataEntry
+
+from semantic_kernel.utils.null_logger import NullLogger
+from semantic_kernel.utils.sqlite_connection import SqliteConnection
+
+class SqliteMemoryStore(MemoryStoreBase):
+    """
+    Durable single-file memory store on the standard library `sqlite3`
+    module, with embeddings stored as float32 blobs. A collection is loaded
+    into a CollectionIndex on first search, which later writes update in
+    place.
+    """
+
+    _SCHEMA = """
+        CREATE TABLE IF NOT EXISTS memory_records (
+            collection TEXT NOT NULL,
+            key TEXT NOT NULL,
+            id TEXT NOT NULL,
+            is_reference INTEGER NOT NULL,
+            external_source_name TEXT,
+            description TEXT,
+            text TEXT,
+            embedding BLOB NOT NULL,
+            timestamp TEXT NOT NULL,
+            PRIMARY KEY (collection, key)
+        )
+    """
+    _COLUMNS = (
+        "key, id, is_reference, external_source_name, description, text, "
+        "embedding, timestamp"
+    )
+    # The same columns, with no embedding read.
+    _COLUMNS_WITHOUT_EMBEDDING = _COLUMNS.replace("embedding", "NULL")
+
+    # Keys per lookup query, below SQLite's bound parameter limit.
+    GET_BATCH_SIZE = 500
+
+    _sqlite: SqliteConnection
+    _cache: Dict[str, CollectionIndex]
+
+    def __init__(self, path: str, logger: Optional[Logger] = None) -> None:
+        self._sqlite = SqliteConnection(path, self._SCHEMA, "sqlite-memory-store")
+        self._cache = {}
+        self._logger = logger or NullLogger()
+
+    async def close_async(self) -> None:
+        await self._sqlite.close_async()
+        self._cache.clear()
+
+    async def get_collections_async(self) -> List[str]:
+        rows = await self._sqlite.run(
+            self._query, "SELECT DISTINCT collection FROM memory_records"
+        )
+        return [row[0] for row in rows]
+
+    async def get_all_async(self, collection: str) -> List[DataEntry]:
+        rows = await self._sqlite.run(
+            self._query,
+            f"SELECT {self._COLUMNS} FROM memory_records WHERE collection = ?",
+            (collection,),
+        )
+        return [self._entry(row) for row in rows]
+
+    async def get_async(self, collection: str, key: str) -> Optional[DataEntry]:
+        rows = await self._sqlite.run(
+            self._query,
+            f"SELECT {self._COLUMNS} FROM memory_records "
+            f"WHERE collection = ? AND key = ?",
+            (collection, key),
+        )
+        return self._entry(rows[0]) if rows else None
+
+    async def get_batch_async(
+        self, collection: str, keys: List[str], with_embeddings: bool = True
+    ) -> List[Optional[DataEntry]]:
+        """
+        Looks many keys up with one primary key query per
+        `GET_BATCH_SIZE` keys.
+        """
+        columns = self._COLUMNS if with_embeddings else self._COLUMNS_WITHOUT_EMBEDDING
+        entries: Dict[str, DataEntry] = {}
+        unique_keys = list(dict.fromkeys(keys))
+        for start in range(0, len(unique_keys), self.GET_BATCH_SIZE):
+            batch = unique_keys[start : start + self.GET_BATCH_SIZE]
+            rows = await self._sqlite.run(
+                self._query,
+                f"SELECT {columns} FROM memory_records "
+                f"WHERE collection = ? AND key IN ({', '.join('?' * len(batch))})",
+                (collection, *batch),
+            )
+            entries.update((row[0], self._entry(row)) for row in rows)
+        return [entries.get(key) for key in keys]
+
+    async def put_async(self, collection: str, value: DataEntry) -> DataEntry:
+        await self.put_many_async(collection, [value])
+        return value
+
+    async def put_many_async(
+        self, collection: str, values: List[DataEntry]
+    ) -> List[DataEntry]:
+        """
+        Upserts many entries into a collection in a single transaction.
+        """
+        if not values:
+            return values
+
+        vectors = stack(
+            [
+                asarray(entry.value.embedding, dtype=float32).reshape(-1)
+                for entry in values
+            ]
+        )
+        rows = [
+            (
+                collection,
+                entry.key,
+                entry.value.id,
+                int(entry.value.is_reference),
+                entry.value.external_source_name,
+                entry.value.description,
+                entry.value.text,
+                vector.tobytes(),
+                entry.timestamp.isoformat(),
+            )
+            for entry, vector in zip(values, vectors)
+        ]
+        await self._sqlite.run(
+            self._write,
+            collection,
+            f"INSERT OR REPLACE INTO memory_records (collection, {self._COLUMNS}) "
+            f"VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            rows,
+            partial(
+                self._put_cached,
+                [entry.key for entry in values],
+                [entry.value for entry in values],
+                vectors,
+            ),
+        )
+        return values
+
+    async def remove_async(self, collection: str, key: str) -> None:
+        await self._sqlite.run(
+            self._write,
+            collection,
+            "DELETE FROM memory_records WHERE collection = ? AND key = ?",
+            [(collection, key)],
+            partial(self._remove_cached, key),
+        )
+
+    async def get_nearest_matches_async(
+        self,
+        collection: str,
+        embedding: ndarray,
+        limit: int = 1,
+        min_relevance_score: float = 0.7,
+        filter: Optional[MemoryFilter] = None,
+    ) -> List[Tuple[MemoryRecord, float]]:
+        embedding = normalize_queries(embedding.reshape(-1))
+
+        return await self._sqlite.run(
+            self._search,
+            collection,
+            embedding,
+            limit,
+            min_relevance_score,
+            filter,
+        )
+
+    def _query(self, sql: str, parameters: Tuple[Any, ...] = ()) -> List[Tuple]:
+        return self._sqlite.connection.execute(sql, parameters).fetchall()
+
+    def _write(
+        self,
+        collection: str,
+        sql: str,
+        rows: List[Tuple],
+        update: Callable[[CollectionIndex], None],
+    ) -> None:
+        # A loaded collection is updated with `update` once the write is
+        # committed, instead of being read again.
+        with self._sqlite.connection as connection:
+            connection.executemany(sql, rows)
+        index = self._cache.get(collection)
+        if index is not None:
+            update(index)
+
+    def _load(self, collection: str) -> CollectionIndex:
+        index = self._cache.get(collection)
+        if index is not None:
+            return index
+
+        rows = self._query(
+            f"SELECT {self._COLUMNS} FROM memory_records WHERE collection = ?",
+            (collection,),
+        )
+        index = CollectionIndex()
+        if rows:
+            # The records are kept without their embedding, which the
+            # index holds.
+            vectors = frombuffer(b"".join(row[6] for row in rows), dtype=float32)
+            self._put_cached(
+                [row[0] for row in rows],
+                [self._record(row[:6] + (None,)) for row in rows],
+                vectors.reshape(len(rows), -1),
+                index,
+            )
+        self._cache[collection] = index
+        return index
+
+    def _search(
+        self,
+        collection: str,
+        query: ndarray,
+        limit: int,
+        min_relevance_score: float,
+        filter: Optional[MemoryFilter],
+    ) -> List[Tuple[MemoryRecord, float]]:
+        index = self._load(collection)
+        if len(index) == 0:
+            return []
+
+        view = index.view()
+        rows, scores = top_k_rows(
+            query.reshape(1, -1),
+            view.embeddings,
+            view.norms,
+            limit,
+            min_relevance_score,
+            None if filter is None else flatnonzero(index.mask(filter)),
+            view.live,
+        )[0]
+        return [(view.record(row), score) for row, score in zip(rows, scores)]
+
+    @staticmethod
+    def _put_cached(
+        keys: List[str],
+        records: List[MemoryRecord],
+        vectors: ndarray,
+        index: CollectionIndex,
+    ) -> None:
+        index.upsert_many(keys, records, vectors)
+
+    @staticmethod
+    def _remove_cached(key: str, index: CollectionIndex) -> None:
+        index.remove(key)
+        if index.needs_compaction:
+            index.compact()
+
+    @staticmethod
+    def _record(row: Tuple) -> MemoryRecord:
+        return MemoryRecord(
+            is_reference=bool(row[2]),
+            external_source_name=row[3],
+            id=row[1],
+            description=row[4],
+            text=row[5],
+            embedding=(
+                frombuffer(row[6], dtype=float32).copy() if row[6] is not None else None
+            ),
+        )
+
+    @staticmethod
+    def _entry(row: Tuple) -> DataEntry:
+        return DataEntry(
+            row[0],
+            SqliteMemoryStore._record(row),
+            datetime.fromisoformat(row[7]),
+        )
@@ -0,0 +1,25 @@
+from struct import Struct
+from typing import Any, Optional, Tuple
+
+LENGTH = Struct("<I")
+NONE_LENGTH = 0xFFFFFFFF
+
+def pack_string(value: Optional[str]) -> bytes:
+    """
+    Encodes an optional string as its UTF-8 length followed by its bytes.
+    """
+    if value is None:
+        return LENGTH.pack(NONE_LENGTH)
+    data = value.encode("utf-8")
+    return LENGTH.pack(len(data)) + data
+
+def unpack_string(payload: Any, offset: int) -> Tuple[Optional[str], int]:
+    """
+    Decodes a string written by `pack_string` from bytes or a mapped file,
+    returning it with the offset right after it.
+    """
+    (length,) = LENGTH.unpack_from(payload, offset)
+    offset += LENGTH.size
+    if length == NONE_LENGTH:
+        return None, offset
+    return payload[offset : offset + length].decode("utf-8"), offset + length
@@ -3,6 +3,8 @@ from datetime import datetime
 from semantic_kernel.memory.memory_record import MemoryRecord
 
 class DataEntry:
+    __slots__ = ("_key", "_value", "_timestamp")
+
     _key: str
     _value: MemoryRecord
     _timestamp: datetime
@@ -12,22 +14,22 @@ class DataEntry:
         self._value = value
         self._timestamp = timestamp
         
-        @property
-        def key(self) -> str:
-            return self._key
-        
-        @property
-        def value(self) -> MemoryRecord:
-            return self._value
-        
-        @value.setter
-        def value(self, value: MemoryRecord) -> None:
-            self._value = value
+    @property
+    def key(self) -> str:
+        return self._key
+    
+    @property
+    def value(self) -> MemoryRecord:
+        return self._value
+    
+    @value.setter
+    def value(self, value: MemoryRecord) -> None:
+        self._value = value
 
-        @property
-        def timestamp(self) -> datetime:
-            return self._timestamp
+    @property
+    def timestamp(self) -> datetime:
+        return self._timestamp
 
-        @timestamp.setter
-        def timestamp(self, timestamp: datetime) -> None:
-            self._timestamp = timestamp
\ No newline at end of file
+    @timestamp.setter
+    def timestamp(self, timestamp: datetime) -> None:
+        self._timestamp = timestamp
@@ -16,10 +16,18 @@ class DataStoreBase(ABC):
     async def get_async(self, collection: str, key: str) -> Optional[DataEntry]:
         pass
 
+    async def get_batch_async(
+        self, collection: str, keys: List[str]
+    ) -> List[Optional[DataEntry]]:
+        return [await self.get_async(collection, key) for key in keys]
+
     @abstractmethod
     async def put_async(self, collection: str, value: Any) -> DataEntry:
         pass    
     
+    async def put_many_async(self, collection: str, values: List[Any]) -> List[DataEntry]:
+        return [await self.put_async(collection, value) for value in values]
+    
     @abstractmethod
     async def remove_async(self, collection: str, key: str) -> None:
         pass
@@ -0,0 +1,186 @@
+from collections import OrderedDict
+from heapq import heapify, heappop, heappush
+from typing import Dict, List, Set, Tuple
+
+from numpy import asarray
+
+from semantic_kernel.memory.storage.data_entry import DataEntry
+from semantic_kernel.memory.storage.eviction_policy import EvictionPolicy
+
+class EvictionIndex:
+    """
+    The entries of a collection in eviction order under an EvictionPolicy:
+    an OrderedDict for LRU, and binary heaps with lazy deletion for LFU and
+    expiry, so nothing is ever scanned.
+    """
+
+    HEAP_SLACK = 64
+
+    _policy: EvictionPolicy
+    _bytes: Dict[str, int]
+    _total_bytes: int
+    _recency: "OrderedDict[str, None]"
+    _uses: Dict[str, Tuple[int, int]]
+    _use_heap: List[Tuple[int, int, str]]
+    _expiries: Dict[str, float]
+    _expiry_heap: List[Tuple[float, str]]
+    _clock: int
+
+    def __init__(self, policy: EvictionPolicy) -> None:
+        self._policy = policy
+        self._bytes = {}
+        self._total_bytes = 0
+        self._recency = OrderedDict()
+        self._uses = {}
+        self._use_heap = []
+        self._expiries = {}
+        self._expiry_heap = []
+        self._clock = 0
+
+    def __len__(self) -> int:
+        return len(self._bytes)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._bytes
+
+    @property
+    def policy(self) -> EvictionPolicy:
+        return self._policy
+
+    @property
+    def size_bytes(self) -> int:
+        return self._total_bytes
+
+    @property
+    def over_capacity(self) -> bool:
+        policy = self._policy
+        return (
+            policy.max_records is not None and len(self._bytes) > policy.max_records
+        ) or (policy.max_bytes is not None and self._total_bytes > policy.max_bytes)
+
+    def put(self, entry: DataEntry, size: int) -> None:
+        key = entry.key
+        self._total_bytes += size - self._bytes.get(key, 0)
+        self._bytes[key] = size
+
+        if self._policy.ttl is not None:
+            expiry = entry.timestamp.timestamp() + self._policy.ttl
+            self._expiries[key] = expiry
+            heappush(self._expiry_heap, (expiry, key))
+            if len(self._expiry_heap) > 2 * len(self._expiries) + self.HEAP_SLACK:
+                self._expiry_heap = [
+                    (expiry, key) for key, expiry in self._expiries.items()
+                ]
+                heapify(self._expiry_heap)
+
+        self.touch(key)
+
+    def touch(self, key: str) -> None:
+        if key not in self._bytes:
+            return
+
+        self._clock += 1
+        if self._policy.order == "lru":
+            self._recency[key] = None
+            self._recency.move_to_end(key)
+            return
+
+        count = self._uses[key][0] + 1 if key in self._uses else 1
+        self._uses[key] = (count, self._clock)
+        heappush(self._use_heap, (count, self._clock, key))
+        if len(self._use_heap) > 2 * len(self._uses) + self.HEAP_SLACK:
+            self._use_heap = [
+                (count, clock, key) for key, (count, clock) in self._uses.items()
+            ]
+            heapify(self._use_heap)
+
+    def remove(self, key: str) -> None:
+        size = self._bytes.pop(key, None)
+        if size is None:
+            return
+
+        # Heap items of removed keys are dropped lazily.
+        self._total_bytes -= size
+        self._recency.pop(key, None)
+        self._uses.pop(key, None)
+        self._expiries.pop(key, None)
+
+    def is_expired(self, key: str, now: float) -> bool:
+        expiry = self._expiries.get(key)
+        return expiry is not None and expiry <= now
+
+    def expired(self, now: float, protected: Set[str]) -> List[str]:
+        """
+        Removes and returns the keys that expired by `now`, except the
+        protected ones.
+        """
+        keys, held = [], []
+        while self._expiry_heap and self._expiry_heap[0][0] <= now:
+            expiry, key = heappop(self._expiry_heap)
+            if self._expiries.get(key) != expiry:
+                continue
+            if key in protected:
+                held.append((expiry, key))
+                continue
+            self.remove(key)
+            keys.append(key)
+
+        for item in held:
+            heappush(self._expiry_heap, item)
+        return keys
+
+    def victims(self, protected: Set[str]) -> List[str]:
+        """
+        Removes and returns the keys to evict until the collection is back
+        within its bounds. The protected keys go only once no other key is
+        left, the least recently written first, and the last of them stays.
+        """
+        keys: List[str] = []
+        if self._policy.order == "lru":
+            # The protected keys were just written, so they are at the end
+            # in the order written.
+            while self.over_capacity and len(self._bytes) > 1:
+                key = next(iter(self._recency))
+                self.remove(key)
+                keys.append(key)
+            return keys
+
+        held = []
+        while self.over_capacity and self._use_heap:
+            count, clock, key = heappop(self._use_heap)
+            if self._uses.get(key) != (count, clock):
+                continue
+            if key in protected:
+                held.append((count, clock, key))
+                continue
+            self.remove(key)
+            keys.append(key)
+
+        # Only protected keys are left, so a batch larger than the bounds
+        # keeps its last entries.
+        held.sort(key=lambda item: item[1])
+        while self.over_capacity and len(held) > 1:
+            _, _, key = held.pop(0)
+            self.remove(key)
+            keys.append(key)
+
+        for item in held:
+            heappush(self._use_heap, item)
+        return keys
+
+    @staticmethod
+    def entry_bytes(entry: DataEntry) -> int:
+        # The embedding, if the record holds it, plus the characters of the
+        # key and string fields.
+        record = entry.value
+        size = asarray(record.embedding).nbytes if record.embedding is not None else 0
+        for value in (
+            entry.key,
+            record.id,
+            record.text,
+            record.description,
+            record.external_source_name,
+        ):
+            if value:
+                size += len(value)
+        return size
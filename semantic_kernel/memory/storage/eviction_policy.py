@@ -0,0 +1,37 @@
+from typing import Optional
+
+class EvictionPolicy:
+    """
+    Bounds on a collection of a data store: entries older than `ttl`
+    seconds expire, and past `max_records` entries or `max_bytes` bytes the
+    least recently ("lru") or least frequently ("lfu") used are evicted.
+    Writes, gets and search results count as uses.
+    """
+
+    ORDERS = ("lru", "lfu")
+
+    max_records: Optional[int]
+    max_bytes: Optional[int]
+    ttl: Optional[float]
+    order: str
+
+    def __init__(
+        self,
+        max_records: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+        ttl: Optional[float] = None,
+        order: str = "lru",
+    ) -> None:
+        if max_records is not None and max_records <= 0:
+            raise ValueError("The maximum number of records must be positive")
+        if max_bytes is not None and max_bytes <= 0:
+            raise ValueError("The maximum size must be a positive number of bytes")
+        if ttl is not None and ttl <= 0:
+            raise ValueError("The time to live must be a positive number of seconds")
+        if order not in self.ORDERS:
+            raise ValueError(f"Unknown eviction order '{order}'")
+
+        self.max_records = max_records
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.order = order
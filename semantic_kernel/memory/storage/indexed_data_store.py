@@ -0,0 +1,90 @@
+import asyncio
+from typing import Any, Coroutine, Dict, List, Optional, Tuple
+
+from semantic_kernel.memory.memory_record import MemoryRecord
+from semantic_kernel.memory.storage.data_entry import DataEntry
+from semantic_kernel.memory.storage.volatile_data_store import VolatileDataStore
+
+class IndexedDataStore(VolatileDataStore):
+    """
+    VolatileDataStore whose entries hold records without their embedding,
+    the only copy of which is kept by the collection's index in `_indexes`.
+    Entries read from the store get their embedding back from the index's
+    `get_records`, and eviction sizes count the index's `row_bytes`.
+    """
+
+    _indexes: Dict[str, Any]
+
+    async def get_all_async(self, collection: str) -> List[DataEntry]:
+        return self._restore_entries(collection, await super().get_all_async(collection))
+
+    async def get_async(self, collection: str, key: str) -> Optional[DataEntry]:
+        entry = await super().get_async(collection, key)
+        if entry is None:
+            return None
+
+        return self._restore_entries(collection, [entry])[0]
+
+    async def get_batch_async(
+        self, collection: str, keys: List[str], with_embeddings: bool = True
+    ) -> List[Optional[DataEntry]]:
+        entries = await super().get_batch_async(collection, keys)
+        if not with_embeddings:
+            return entries
+
+        restored = iter(
+            self._restore_entries(
+                collection, [entry for entry in entries if entry is not None]
+            )
+        )
+        return [next(restored) if entry is not None else None for entry in entries]
+
+    def _matched_records(
+        self, collection: str, matches: List[Tuple[str, float]]
+    ) -> List[Tuple[MemoryRecord, float]]:
+        # Turns the (key, score) matches of an index into (record, score)
+        # pairs, touching the keys returned.
+        keys = [key for key, _ in matches]
+        self._touch(collection, keys)
+        records = self._indexes[collection].get_records(keys)
+        return [
+            (record, score)
+            for record, (_, score) in zip(records, matches)
+            if record is not None
+        ]
+
+    def _restore_entries(
+        self, collection: str, entries: List[DataEntry]
+    ) -> List[DataEntry]:
+        if not entries:
+            return entries
+
+        records = self._indexes[collection].get_records(
+            [entry.key for entry in entries]
+        )
+        return [
+            DataEntry(entry.key, record, entry.timestamp)
+            for entry, record in zip(entries, records)
+        ]
+
+    def _entry_bytes(self, collection: str, entry: DataEntry) -> int:
+        # The embedding of a stored entry is a row of the collection index.
+        index = self._indexes.get(collection)
+        row_bytes = index.row_bytes if index is not None else 0
+        return super()._entry_bytes(collection, entry) + row_bytes
+
+    @staticmethod
+    def _start_task(
+        tasks: Dict[str, asyncio.Task], collection: str, coroutine: Coroutine
+    ) -> asyncio.Task:
+        # Runs background work on a collection's index, listed in `tasks`
+        # until it is done.
+        task = asyncio.get_running_loop().create_task(coroutine)
+        tasks[collection] = task
+
+        def done(_: asyncio.Task) -> None:
+            if tasks.get(collection) is task:
+                del tasks[collection]
+
+        task.add_done_callback(done)
+        return task
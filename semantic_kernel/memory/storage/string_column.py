@@ -0,0 +1,76 @@
+from typing import List, Optional
+
+from numpy import empty, int32, int64, ndarray
+
+class StringColumn:
+    """
+    Optional strings of a column of rows packed into one UTF-8 buffer,
+    addressed by a per-row offset and length. Replaced values are only
+    reclaimed by `select`.
+    """
+
+    INITIAL_CAPACITY = 16
+    NONE_LENGTH = -1
+
+    _buffer: bytearray
+    _offsets: ndarray
+    _lengths: ndarray
+
+    def __init__(self, capacity: int = INITIAL_CAPACITY) -> None:
+        self._buffer = bytearray()
+        self._offsets = empty((max(capacity, 1),), dtype=int64)
+        self._lengths = empty((max(capacity, 1),), dtype=int32)
+
+    @property
+    def size_bytes(self) -> int:
+        return len(self._buffer) + self._offsets.nbytes + self._lengths.nbytes
+
+    def get(self, row: int) -> Optional[str]:
+        length = int(self._lengths[row])
+        if length == self.NONE_LENGTH:
+            return None
+
+        offset = int(self._offsets[row])
+        return self._buffer[offset : offset + length].decode("utf-8")
+
+    def set(self, row: int, value: Optional[str]) -> None:
+        self._reserve(row + 1)
+        if value is None:
+            self._lengths[row] = self.NONE_LENGTH
+            return
+
+        data = value.encode("utf-8")
+        self._offsets[row] = len(self._buffer)
+        self._lengths[row] = len(data)
+        self._buffer += data
+
+    def select(self, rows: List[int]) -> "StringColumn":
+        """
+        A copy holding only the given rows, renumbered in the order given.
+        """
+        column = StringColumn(len(rows))
+        for new_row, row in enumerate(rows):
+            length = int(self._lengths[row])
+            column._lengths[new_row] = length
+            if length == self.NONE_LENGTH:
+                continue
+
+            offset = int(self._offsets[row])
+            column._offsets[new_row] = len(column._buffer)
+            column._buffer += self._buffer[offset : offset + length]
+        return column
+
+    def _reserve(self, size: int) -> None:
+        capacity = self._offsets.shape[0]
+        if size <= capacity:
+            return
+
+        while capacity < size:
+            capacity *= 2
+
+        offsets = empty((capacity,), dtype=int64)
+        offsets[: self._offsets.shape[0]] = self._offsets
+        lengths = empty((capacity,), dtype=int32)
+        lengths[: self._lengths.shape[0]] = self._lengths
+        self._offsets = offsets
+        self._lengths = lengths
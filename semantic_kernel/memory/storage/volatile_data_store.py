@@ -1,15 +1,97 @@
 from datetime import datetime
+from time import time
 from typing import Dict, List, Optional
 
 from semantic_kernel.memory.memory_record import MemoryRecord
 from semantic_kernel.memory.storage.data_entry import DataEntry
 from semantic_kernel.memory.storage.data_store_base import DataStoreBase
+from semantic_kernel.memory.storage.eviction_index import EvictionIndex
+from semantic_kernel.memory.storage.eviction_policy import EvictionPolicy
 
 class VolatileDataStore(DataStoreBase):
+    """
+    In-memory data store. A collection given an EvictionPolicy drops
+    expired and excess entries on every write to it, or when
+    `evict_async` is called; reads drop the entries expired since, so
+    they are never returned. Evictions go through `remove_async`.
+    """
+
     _store: Dict[str, Dict[str, DataEntry]]
+    _eviction_indexes: Dict[str, EvictionIndex]
     
     def __init__(self) -> None:
         self._store = {}
+        self._eviction_indexes = {}
+
+    async def set_eviction_policy_async(
+        self, collection: str, policy: Optional[EvictionPolicy]
+    ) -> None:
+        """
+        Applies a policy to a collection, evicting at once what it does not
+        admit; None lifts the current policy.
+        """
+        if policy is None:
+            self._eviction_indexes.pop(collection, None)
+            return
+
+        eviction_index = EvictionIndex(policy)
+        entries = self._store.get(collection, {}).values()
+        for entry in sorted(entries, key=lambda entry: entry.timestamp):
+            eviction_index.put(entry, self._entry_bytes(collection, entry))
+        self._eviction_indexes[collection] = eviction_index
+        await self._evict_async(collection)
+
+    async def evict_async(self, collection: Optional[str] = None) -> None:
+        """
+        Evicts the expired and excess entries of a collection, or of every
+        collection with a policy.
+        """
+        collections = (
+            list(self._eviction_indexes) if collection is None else [collection]
+        )
+        for name in collections:
+            await self._evict_async(name)
+
+    def _track_entries(self, collection: str, values: List[DataEntry]) -> None:
+        eviction_index = self._eviction_indexes.get(collection)
+        if eviction_index is not None:
+            for value in values:
+                eviction_index.put(value, self._entry_bytes(collection, value))
+
+    def _entry_bytes(self, collection: str, entry: DataEntry) -> int:
+        return EvictionIndex.entry_bytes(entry)
+
+    def _touch(self, collection: str, keys: List[str]) -> None:
+        # Entries returned by any read, searches included, count as used.
+        eviction_index = self._eviction_indexes.get(collection)
+        if eviction_index is not None:
+            for key in keys:
+                eviction_index.touch(key)
+
+    async def _expire_async(self, collection: str) -> None:
+        # Reads drop the entries that expired since the last write, which
+        # costs a look at the top of the expiry heap when there are none.
+        eviction_index = self._eviction_indexes.get(collection)
+        if eviction_index is None:
+            return
+
+        for key in eviction_index.expired(time(), set()):
+            await self.remove_async(collection, key)
+
+    async def _evict_async(
+        self, collection: str, protected: Optional[List[str]] = None
+    ) -> None:
+        # Entries written by the current call are protected, so that a
+        # write never evicts itself.
+        eviction_index = self._eviction_indexes.get(collection)
+        if eviction_index is None:
+            return
+
+        protected_keys = set(protected or [])
+        keys = eviction_index.expired(time(), protected_keys)
+        keys.extend(eviction_index.victims(protected_keys))
+        for key in keys:
+            await self.remove_async(collection, key)
     
     async def get_collections_async(self) -> List[str]:
         return list(self._store.keys())
@@ -17,6 +99,8 @@ class VolatileDataStore(DataStoreBase):
     async def get_all_async(self, collection: str) -> List[DataEntry]:
         if collection not in self._store:
             return []
+
+        await self._expire_async(collection)
         
         return list(self._store[collection].values())
 
@@ -25,14 +109,37 @@ class VolatileDataStore(DataStoreBase):
             return None
         if key not in self._store[collection]:
             return None
+
+        eviction_index = self._eviction_indexes.get(collection)
+        if eviction_index is not None:
+            if eviction_index.is_expired(key, time()):
+                await self.remove_async(collection, key)
+                return None
+            eviction_index.touch(key)
         
         return self._store[collection][key]
 
+    async def get_batch_async(
+        self, collection: str, keys: List[str]
+    ) -> List[Optional[DataEntry]]:
+        if collection not in self._store:
+            return [None for _ in keys]
+
+        await self._expire_async(collection)
+
+        entries = self._store[collection]
+        found = [entries.get(key) for key in keys]
+        self._touch(collection, [entry.key for entry in found if entry is not None])
+
+        return found
+
     async def put_async(self, collection: str, value: DataEntry) -> DataEntry:
         if collection not in self._store:
             self._store[collection] = {}
         
         self._store[collection][value.key] = value
+        self._track_entries(collection, [value])
+        await self._evict_async(collection, [value.key])
         
         return value
 
@@ -44,6 +151,8 @@ class VolatileDataStore(DataStoreBase):
             return
         
         del self._store[collection][key]
+        if collection in self._eviction_indexes:
+            self._eviction_indexes[collection].remove(key)
     
     async def get_value_async(self, collection: str, key: str) -> MemoryRecord:
         entry = await self.get_async(collection, key)
@@ -0,0 +1,221 @@
+import asyncio
+import os
+from logging import Logger
+from struct import Struct
+from typing import Iterator, List, Optional
+from zlib import crc32
+
+from semantic_kernel.utils.null_logger import NullLogger
+
+class WriteAheadLog:
+    """
+    Append-only log in numbered segment files, each record framed by its
+    length and CRC32 so a torn tail ends replay. Appends are group-committed
+    every `commit_interval` seconds off the event loop; once a write fails,
+    every later append and flush raises the error.
+    """
+
+    HEADER = Struct("<II")
+    SEGMENT_PREFIX = "wal-"
+    SEGMENT_SUFFIX = ".log"
+
+    _directory: str
+    _commit_interval: float
+    _segment: int
+    _file: Optional[int]
+    _pending: List[bytes]
+    _pending_bytes: int
+    _waiters: List[asyncio.Future]
+    _flush_task: Optional[asyncio.Task]
+    _write_lock: Optional[asyncio.Lock]
+    _segment_bytes: int
+    _error: Optional[Exception]
+    _logger: Logger
+
+    def __init__(
+        self,
+        directory: str,
+        commit_interval: float = 0.005,
+        logger: Optional[Logger] = None,
+    ) -> None:
+        os.makedirs(directory, exist_ok=True)
+        self._directory = directory
+        self._commit_interval = commit_interval
+        self._logger = logger or NullLogger()
+        self._error = None
+        self._pending = []
+        self._pending_bytes = 0
+        self._waiters = []
+        self._flush_task = None
+        self._write_lock = None
+
+        segments = self.segments()
+        self._segment = segments[-1] + 1 if segments else 1
+        self._file = None
+        self._open_segment()
+
+    @property
+    def segment(self) -> int:
+        return self._segment
+
+    @property
+    def segment_bytes(self) -> int:
+        # Includes records still waiting for the next group commit.
+        return self._segment_bytes + self._pending_bytes
+
+    def segments(self) -> List[int]:
+        return sorted(
+            int(name[len(self.SEGMENT_PREFIX) : -len(self.SEGMENT_SUFFIX)])
+            for name in os.listdir(self._directory)
+            if name.startswith(self.SEGMENT_PREFIX)
+            and name.endswith(self.SEGMENT_SUFFIX)
+        )
+
+    def segment_path(self, segment: int) -> str:
+        return os.path.join(
+            self._directory,
+            f"{self.SEGMENT_PREFIX}{segment:08d}{self.SEGMENT_SUFFIX}",
+        )
+
+    def read(self, first_segment: int = 0) -> Iterator[bytes]:
+        """
+        Yields the payloads of every intact record in the segments numbered
+        `first_segment` and above, oldest first.
+        """
+        for segment in self.segments():
+            if segment < first_segment:
+                continue
+
+            with open(self.segment_path(segment), "rb") as fp:
+                data = fp.read()
+
+            offset = 0
+            while offset + self.HEADER.size <= len(data):
+                length, checksum = self.HEADER.unpack_from(data, offset)
+                start = offset + self.HEADER.size
+                payload = data[start : start + length]
+                if len(payload) < length or crc32(payload) != checksum:
+                    break
+                yield payload
+                offset = start + length
+
+    def append(self, payload: bytes) -> asyncio.Future:
+        """
+        Buffers a record for the next group commit and returns a future
+        resolved once it is durable.
+        """
+        if self._error is not None:
+            raise self._error
+
+        loop = asyncio.get_running_loop()
+        waiter = loop.create_future()
+
+        record = self.HEADER.pack(len(payload), crc32(payload)) + payload
+        self._pending.append(record)
+        self._pending_bytes += len(record)
+        self._waiters.append(waiter)
+        if self._flush_task is None:
+            self._flush_task = loop.create_task(self._flush_later())
+
+        return waiter
+
+    async def flush_async(self) -> None:
+        if self._flush_task is not None:
+            await asyncio.shield(self._flush_task)
+        if self._pending:
+            await self._commit_pending()
+        if self._error is not None:
+            raise self._error
+
+    async def rotate_async(self) -> int:
+        """
+        Commits everything buffered and starts a new segment, returning its
+        number.
+        """
+        await self.flush_async()
+        self._close_segment()
+        self._segment += 1
+        self._open_segment()
+        return self._segment
+
+    def remove_segments_before(self, segment: int) -> None:
+        for old_segment in self.segments():
+            if old_segment < segment:
+                os.remove(self.segment_path(old_segment))
+
+    async def close_async(self) -> None:
+        try:
+            await self.flush_async()
+        finally:
+            self._close_segment()
+
+    async def _flush_later(self) -> None:
+        try:
+            await asyncio.sleep(self._commit_interval)
+            while self._pending:
+                try:
+                    await self._commit_pending()
+                except Exception:
+                    # Kept in self._error and raised by the next append or
+                    # flush; the batches left fail with it.
+                    pass
+        finally:
+            self._flush_task = None
+
+    async def _commit_pending(self) -> None:
+        batch, waiters = self._pending, self._waiters
+        self._pending, self._waiters = [], []
+        data = b"".join(batch)
+        self._pending_bytes -= len(data)
+
+        # Batches are taken in order and the lock is FIFO, so they also
+        # reach the file in order. The lock is created on first use so it
+        # belongs to the running event loop.
+        if self._write_lock is None:
+            self._write_lock = asyncio.Lock()
+        try:
+            async with self._write_lock:
+                # A failed fsync leaves the file in an unknown state, so no
+                # batch may be written after it.
+                if self._error is not None:
+                    raise self._error
+                await asyncio.get_running_loop().run_in_executor(
+                    None, self._write, data
+                )
+        except Exception as e:
+            if self._error is None:
+                self._error = e
+                self._logger.error(f"Writing to the write-ahead log failed: {e}")
+            self._fail(waiters, e)
+            raise
+
+        self._segment_bytes += len(data)
+        for waiter in waiters:
+            if not waiter.done():
+                waiter.set_result(None)
+
+    @staticmethod
+    def _fail(waiters: List[asyncio.Future], error: Exception) -> None:
+        for waiter in waiters:
+            if not waiter.done():
+                waiter.set_exception(error)
+                # Callers that do not wait for commits never retrieve the
+                # error from the future; it is logged and raised instead.
+                waiter.exception()
+
+    def _write(self, data: bytes) -> None:
+        view = memoryview(data)
+        while view:
+            written = os.write(self._file, view)
+            view = view[written:]
+        os.fsync(self._file)
+
+    def _open_segment(self) -> None:
+        path = self.segment_path(self._segment)
+        self._file = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        self._segment_bytes = os.path.getsize(path)
+
+    def _close_segment(self) -> None:
+        if self._file is not None:
+            os.close(self._file)
+            self._file = None
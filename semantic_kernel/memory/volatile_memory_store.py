@@ -1,70 +1,459 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from logging import Logger
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 
-from numpy import array, linalg, ndarray
+from numpy import (
+    flatnonzero,
+    float32,
+    inf,
+    linalg,
+    nan,
+    ndarray,
+    searchsorted,
+    where,
+)
+from numpy.typing import DTypeLike
 
+from semantic_kernel.memory.bm25_index import Bm25Index
+from semantic_kernel.memory.collection_index import CollectionIndex, CollectionView
+from semantic_kernel.memory.memory_filter import MemoryFilter
 from semantic_kernel.memory.memory_record import MemoryRecord
 from semantic_kernel.memory.memory_store_base import MemoryStoreBase
-from semantic_kernel.memory.storage.volatile_data_store import VolatileDataStore
+from semantic_kernel.memory.quantized_collection_index import QuantizedCollectionIndex
+from semantic_kernel.memory.similarity import (
+    merge_top_k,
+    score_rows,
+    top_k_indices,
+    top_k_rows,
+)
+from semantic_kernel.memory.storage.data_entry import DataEntry
+from semantic_kernel.memory.storage.indexed_data_store import IndexedDataStore
 
 from semantic_kernel.utils.null_logger import NullLogger
     
-class VolatileMemoryStore(VolatileDataStore, MemoryStoreBase):
-    def __init__(self, logger: Optional[Logger] = None) -> None:
+class VolatileMemoryStore(IndexedDataStore, MemoryStoreBase):
+    """
+    In-memory store that keeps each collection in a CollectionIndex, whose
+    matrix holds the only copy of the embeddings. Dead rows are compacted
+    away by a background task, collections larger than `shard_size` are
+    searched in shards on a thread pool (shut down by `close_async`), and
+    `lexical_index` adds a BM25 index for `get_lexical_matches_async`.
+    """
+
+    _indexes: Dict[str, CollectionIndex]
+    _lexical_indexes: Dict[str, Bm25Index]
+    _compaction_tasks: Dict[str, asyncio.Task]
+    _dtype: DTypeLike
+    _quantized: bool
+    _quantized_directory: Optional[str]
+    _lexical_index: bool
+    _shard_size: int
+    _max_workers: Optional[int]
+    _executor: Optional[ThreadPoolExecutor]
+
+    def __init__(
+        self,
+        logger: Optional[Logger] = None,
+        dtype: DTypeLike = float32,
+        quantized: bool = False,
+        shard_size: int = 16384,
+        max_workers: Optional[int] = None,
+        lexical_index: bool = False,
+        quantized_directory: Optional[str] = None,
+    ) -> None:
+        if shard_size < 1:
+            raise ValueError("The shard size must be at least 1")
+
         super().__init__()
+        self._indexes = {}
+        self._lexical_indexes = {}
+        self._compaction_tasks = {}
+        self._dtype = dtype
+        self._quantized = quantized
+        self._quantized_directory = quantized_directory
+        self._lexical_index = lexical_index
+        self._shard_size = shard_size
+        self._max_workers = max_workers
+        self._executor = None
         self._logger = logger or NullLogger()
 
+    async def create_collection_async(
+        self,
+        collection: str,
+        dtype: Optional[DTypeLike] = None,
+        quantized: Optional[bool] = None,
+        lexical_index: Optional[bool] = None,
+    ) -> None:
+        if collection in self._indexes and len(self._indexes[collection]) > 0:
+            raise ValueError(
+                f"Collection '{collection}' already exists and is not empty"
+            )
+
+        if lexical_index is None:
+            lexical_index = self._lexical_index
+
+        self._indexes[collection] = self._create_index(dtype, quantized)
+        self._lexical_indexes.pop(collection, None)
+        if lexical_index:
+            self._lexical_indexes[collection] = Bm25Index()
+        if collection not in self._store:
+            self._store[collection] = {}
+
+    async def put_async(self, collection: str, value: DataEntry) -> DataEntry:
+        stored = self._index_entries(collection, [value])
+        await super().put_async(collection, stored[0])
+
+        return value
+
+    async def put_many_async(
+        self, collection: str, values: List[DataEntry]
+    ) -> List[DataEntry]:
+        stored = self._index_entries(collection, values)
+
+        if collection not in self._store:
+            self._store[collection] = {}
+        self._store[collection].update((entry.key, entry) for entry in stored)
+        self._track_entries(collection, stored)
+        await self._evict_async(collection, [value.key for value in values])
+
+        return values
+
+    def _index_entries(
+        self, collection: str, values: List[DataEntry]
+    ) -> List[DataEntry]:
+        # The index keeps the only copy of the embeddings, so the entries
+        # stored hold its records rather than the caller's.
+        if collection not in self._indexes:
+            self._indexes[collection] = self._create_index()
+            if self._lexical_index:
+                self._lexical_indexes[collection] = Bm25Index()
+        index = self._indexes[collection]
+        rows = index.upsert_many(
+            [value.key for value in values], [value.value for value in values]
+        )
+
+        stored = [
+            DataEntry(value.key, index.records[row], value.timestamp)
+            for value, row in zip(values, rows)
+        ]
+
+        lexical_index = self._lexical_indexes.get(collection)
+        if lexical_index is not None:
+            for entry in stored:
+                lexical_index.upsert(entry.key, entry.value)
+
+        return stored
+
+    def _unindex_entry(self, collection: str, key: str) -> None:
+        if collection in self._indexes:
+            self._indexes[collection].remove(key)
+        if collection in self._lexical_indexes:
+            self._lexical_indexes[collection].remove(key)
+
+    def _create_index(
+        self, dtype: Optional[DTypeLike] = None, quantized: Optional[bool] = None
+    ) -> CollectionIndex:
+        dtype = dtype if dtype is not None else self._dtype
+        quantized = quantized if quantized is not None else self._quantized
+
+        if quantized:
+            return QuantizedCollectionIndex(dtype, self._quantized_directory)
+        return CollectionIndex(dtype)
+
+    async def remove_async(self, collection: str, key: str) -> None:
+        self._unindex_entry(collection, key)
+
+        await super().remove_async(collection, key)
+
+        index = self._indexes.get(collection)
+        if (
+            index is not None
+            and index.needs_compaction
+            and collection not in self._compaction_tasks
+        ):
+            self._start_compaction(collection)
+
+    async def compact_async(self, collection: Optional[str] = None) -> None:
+        """
+        Rewrites the given collection, or every collection, without its
+        dead rows, waiting for any compaction already running.
+        """
+        collections = list(self._indexes) if collection is None else [collection]
+        for name in collections:
+            task = self._compaction_tasks.get(name)
+            if task is not None:
+                await asyncio.shield(task)
+            if name in self._indexes and self._indexes[name].dead_rows > 0:
+                await asyncio.shield(self._start_compaction(name))
+
+    def _start_compaction(self, collection: str) -> asyncio.Task:
+        return self._start_task(
+            self._compaction_tasks,
+            collection,
+            self._compact_index_async(collection, self._indexes[collection]),
+        )
+
+    async def _compact_index_async(
+        self, collection: str, index: CollectionIndex
+    ) -> None:
+        try:
+            rows = index.begin_compaction()
+            copies = await asyncio.get_running_loop().run_in_executor(
+                None, index.copy_rows, rows
+            )
+            index.finish_compaction(rows, copies)
+        except Exception as e:
+            self._logger.error(f"Compacting collection '{collection}' failed: {e}")
+
+    def has_lexical_index(self, collection: str) -> bool:
+        return collection in self._lexical_indexes
+
+    async def get_lexical_matches_async(
+        self,
+        collection: str,
+        query: str,
+        limit: int,
+        filter: Optional[MemoryFilter] = None,
+    ) -> List[Tuple[MemoryRecord, float]]:
+        if collection not in self._indexes:
+            return []
+        await self._expire_async(collection)
+        lexical_index = self._lexical_indexes.get(collection)
+        if lexical_index is None:
+            raise NotImplementedError(
+                f"Collection '{collection}' does not keep a lexical index"
+            )
+
+        return self._matched_records(
+            collection, lexical_index.search(query, limit, filter)
+        )
+
     async def get_nearest_matches_async(
         self,
         collection: str,
         embedding: ndarray,
         limit: int = 1,
         min_relevance_score: float = 0.7,
+        filter: Optional[MemoryFilter] = None,
     ) -> List[Tuple[MemoryRecord, float]]:
-        if collection not in self._store:
-            return []
-        
-        embedding_collection = list([x.value for x in self._store[collection].values()])
-        embedding_array = array(
-            [x.embedding for x in embedding_collection], dtype=float
+        results = await self.get_nearest_matches_batch_async(
+            collection, embedding.reshape(1, -1), limit, min_relevance_score, filter
         )
-        embedding_array = embedding_array.reshape(embedding_array.shape[0], -1)
-        if len(embedding.shape) == 2:
-            embedding = embedding.reshape(
-                embedding.shape[1],
+        return results[0]
+
+    async def get_nearest_matches_batch_async(
+        self,
+        collection: str,
+        embeddings: ndarray,
+        limit: int = 1,
+        min_relevance_score: float = 0.7,
+        filter: Optional[MemoryFilter] = None,
+    ) -> List[List[Tuple[MemoryRecord, float]]]:
+        embeddings = embeddings.reshape(embeddings.shape[0], -1)
+
+        await self._expire_async(collection)
+        index = self._indexes.get(collection)
+        if index is None or len(index) == 0:
+            return [[] for _ in range(embeddings.shape[0])]
+
+        # Filters select the candidate rows up front so that only those
+        # are scored.
+        view = index.view()
+        if filter is not None:
+            rows = flatnonzero(index.mask(filter))
+            if len(rows) == 0:
+                return [[] for _ in range(embeddings.shape[0])]
+            queries = self._normalize_queries(
+                embeddings, view.embeddings, view.norms[rows]
             )
-        similarity_scores = self.compute_similarity_scores(embedding, embedding_array)
-        
-        sorted_results = sorted(
-            zip(embedding_collection, similarity_scores),
-            key=lambda x: x[1],
-            reverse=True,            
+        else:
+            rows = None
+            queries = self._normalize_queries(
+                embeddings, view.embeddings, view.norms[view.live]
+            )
+
+        candidate_count = (
+            index.candidate_count(limit)
+            if isinstance(index, QuantizedCollectionIndex)
+            else limit
         )
-        filtered_results = [x for x in sorted_results if x[1] >= min_relevance_score]
-        top_results = filtered_results[:limit]
-        return top_results
-    
-    def compute_similarity_scores(self, embedding:ndarray, embedding_array: ndarray) -> ndarray:        
-        query_norm = linalg.norm(embedding)
-        collection_norms = linalg.norm(embedding_array, axis=1)
-        
-        valid_indices = (query_norm != 0) & (collection_norms != 0)
-        
-        similarity_scores = array([-1.0] * embedding_array.shape[0])
-        if valid_indices.any():
-            similarity_scores[valid_indices] = embedding.dot(
-                embedding_array[valid_indices].T
-            ) / (query_norm * collection_norms[valid_indices])
-            if not valid_indices.all():
-                self._logger.warning(
-                    "Some vectors in the embedding collection are zero vectors."
-                    "Ignoring cosine similarity score computation for those vectors."
-                )
+        if len(view) <= self._shard_size:
+            results = self._search_view(
+                view, queries, limit, min_relevance_score, candidate_count, rows
+            )
         else:
+            results = await self._search_shards_async(
+                view, queries, limit, min_relevance_score, candidate_count, rows
+            )
+
+        # Rows removed while the shards were searched have no record.
+        matches = [
+            [
+                (row, view.record(row), score)
+                for row, score in zip(top_rows.tolist(), scores)
+            ]
+            for top_rows, scores in results
+        ]
+        self._touch(
+            collection,
+            [
+                view.keys[row]
+                for query_matches in matches
+                for row, record, _ in query_matches
+                if record is not None
+            ],
+        )
+        return [
+            [(record, score) for _, record, score in query_matches if record is not None]
+            for query_matches in matches
+        ]
+
+    async def close_async(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    async def _search_shards_async(
+        self,
+        view: CollectionView,
+        queries: ndarray,
+        limit: int,
+        min_relevance_score: float,
+        candidate_count: int,
+        rows: Optional[ndarray] = None,
+    ) -> List[Tuple[ndarray, ndarray]]:
+        # Each shard is searched for its own top `limit` rows on the thread
+        # pool; BLAS releases the GIL, so the shards are scored in parallel
+        # and the event loop keeps running meanwhile.
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self._max_workers, thread_name_prefix="memory-search"
+            )
+
+        loop = asyncio.get_running_loop()
+        starts, searches = [], []
+        for start in range(0, len(view), self._shard_size):
+            end = start + self._shard_size
+            shard_rows = None
+            if rows is not None:
+                first, last = searchsorted(rows, [start, end])
+                if first == last:
+                    continue
+                shard_rows = rows[first:last] - start
+
+            starts.append(start)
+            searches.append(
+                loop.run_in_executor(
+                    self._executor,
+                    self._search_view,
+                    view.rows(start, end),
+                    queries,
+                    limit,
+                    min_relevance_score,
+                    candidate_count,
+                    shard_rows,
+                )
+            )
+        return merge_top_k(starts, await asyncio.gather(*searches), limit)
+
+    def _search_view(
+        self,
+        view: CollectionView,
+        queries: ndarray,
+        limit: int,
+        min_relevance_score: float,
+        candidate_count: int,
+        rows: Optional[ndarray] = None,
+    ) -> List[Tuple[ndarray, ndarray]]:
+        # Only reads the view, so it may run on the thread pool. `queries`
+        # must be normalized.
+        if view.codes is not None:
+            return self._search_view_quantized(
+                view, queries, limit, min_relevance_score, candidate_count, rows
+            )
+
+        return top_k_rows(
+            queries,
+            view.embeddings,
+            view.norms,
+            limit,
+            min_relevance_score,
+            rows,
+            view.live,
+        )
+
+    def _search_view_quantized(
+        self,
+        view: CollectionView,
+        queries: ndarray,
+        limit: int,
+        min_relevance_score: float,
+        candidate_count: int,
+        rows: Optional[ndarray] = None,
+    ) -> List[Tuple[ndarray, ndarray]]:
+        # Rank on the int8 codes, then rescore the shortlist exactly. The
+        # threshold is only applied to exact scores.
+        approximate_scores = view.approximate_scores(queries, rows)
+        if rows is None:
+            live = view.live
+            if not live.all():
+                approximate_scores[:, ~live] = nan
+
+        results = []
+        for query, query_scores in zip(queries, approximate_scores):
+            candidates = top_k_indices(query_scores, candidate_count, -inf)
+            if rows is not None:
+                candidates = rows[candidates]
+            candidates, exact_scores = view.exact_scores(query, candidates)
+            top = top_k_indices(exact_scores, limit, min_relevance_score)
+            results.append((candidates[top], exact_scores[top]))
+        return results
+
+    def compute_similarity_scores(
+        self,
+        embedding: ndarray,
+        embedding_array: ndarray,
+        collection_norms: Optional[ndarray] = None,
+    ) -> ndarray:
+        return self.compute_similarity_scores_batch(
+            embedding.reshape(1, -1), embedding_array, collection_norms
+        )[0]
+
+    def compute_similarity_scores_batch(
+        self,
+        embeddings: ndarray,
+        embedding_array: ndarray,
+        collection_norms: Optional[ndarray] = None,
+    ) -> ndarray:
+        # `embedding_array` is expected to hold unit rows when
+        # `collection_norms` is given, which reduces cosine to a dot product.
+        if collection_norms is None:
+            collection_norms = linalg.norm(embedding_array, axis=1)
+            embedding_array = embedding_array / where(
+                collection_norms == 0, 1.0, collection_norms
+            ).reshape(-1, 1)
+
+        queries = self._normalize_queries(embeddings, embedding_array, collection_norms)
+        similarity_scores = score_rows(queries, embedding_array)
+        similarity_scores[:, collection_norms == 0] = -1.0
+        return similarity_scores
+
+    def _normalize_queries(
+        self, embeddings: ndarray, embedding_array: ndarray, collection_norms: ndarray
+    ) -> ndarray:
+        query_norms = linalg.norm(embeddings, axis=1)
+        valid_indices = collection_norms != 0
+        if not valid_indices.any() or not query_norms.all():
             raise ValueError(
                 f"Invalid vectors, cannot compute cosine similarity scores"
                 f"for zero vectors"
-                f"{embedding_array} or {embedding}"
+                f"{embedding_array} or {embeddings}"
             )
-        return similarity_scores
-    
\ No newline at end of file
+
+        if not valid_indices.all():
+            self._logger.warning(
+                "Some vectors in the embedding collection are zero vectors."
+                "Ignoring cosine similarity score computation for those vectors."
+            )
+        return embeddings / query_norms.reshape(-1, 1)
@@ -0,0 +1,56 @@
+import asyncio
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, Callable, Optional
+
+class SqliteConnection:
+    """
+    A SQLite connection in WAL mode used only from its own thread, so that
+    database work never blocks the event loop; `connection` may only be used
+    by functions given to `run`.
+    """
+
+    _path: str
+    _schema: str
+    _timeout: float
+    _executor: ThreadPoolExecutor
+    _connection: Optional[sqlite3.Connection]
+
+    def __init__(
+        self, path: str, schema: str, thread_name_prefix: str, timeout: float = 5.0
+    ) -> None:
+        self._path = path
+        self._schema = schema
+        self._timeout = timeout
+        self._executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix=thread_name_prefix
+        )
+        self._connection = None
+
+        self._executor.submit(self._connect).result()
+
+    @property
+    def connection(self) -> Optional[sqlite3.Connection]:
+        return self._connection
+
+    async def run(self, function: Callable[..., Any], *args: Any) -> Any:
+        return await asyncio.get_running_loop().run_in_executor(
+            self._executor, partial(function, *args)
+        )
+
+    async def close_async(self) -> None:
+        await self.run(self._close)
+        self._executor.shutdown(wait=True)
+
+    def _connect(self) -> None:
+        self._connection = sqlite3.connect(self._path, timeout=self._timeout)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.execute(self._schema)
+        self._connection.commit()
+
+    def _close(self) -> None:
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
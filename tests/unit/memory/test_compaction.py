@@ -0,0 +1,71 @@
+import numpy as np
+import pytest
+
+from semantic_kernel.memory.collection_index import CollectionIndex
+from semantic_kernel.memory.memory_filter import MemoryFilter
+from semantic_kernel.memory.memory_record import MemoryRecord
+from semantic_kernel.memory.quantized_collection_index import QuantizedCollectionIndex
+from semantic_kernel.memory.similarity import normalize_queries, top_k_rows
+
+
+def mutate(index, expected, rng, count):
+    # Random upserts (new keys and overwrites) and removes, mirrored in
+    # `expected`.
+    for _ in range(count):
+        key = f"k{int(rng.integers(0, 300))}"
+        if rng.random() < 0.4:
+            index.remove(key)
+            expected.pop(key, None)
+        else:
+            description = f"d{int(rng.integers(0, 3))}"
+            vector = rng.normal(size=8)
+            index.upsert(key, MemoryRecord.local_record(key, "text", description, vector))
+            expected[key] = (description, vector)
+
+
+def brute_force(expected, query, limit, description=None):
+    scores = {
+        key: float(vector.dot(query) / np.linalg.norm(vector))
+        for key, (row_description, vector) in expected.items()
+        if description is None or row_description == description
+    }
+    return sorted(scores, key=scores.get, reverse=True)[:limit]
+
+
+def search(index, query, limit, filter=None):
+    view = index.view()
+    rows = None if filter is None else np.flatnonzero(index.mask(filter))
+    top, _ = top_k_rows(
+        query.reshape(1, -1), view.embeddings, view.norms, limit, -1.0, rows, view.live
+    )[0]
+    return [view.keys[row] for row in top]
+
+
+@pytest.mark.parametrize("index_type", [CollectionIndex, QuantizedCollectionIndex])
+def test_compaction_with_concurrent_writes_matches_brute_force(index_type):
+    rng = np.random.default_rng(0)
+    index = index_type()
+    expected = {}
+    mutate(index, expected, rng, 400)
+
+    for _ in range(30):
+        # Writes land before the copy, during it (between the two) and
+        # after it, as they would while `copy_rows` runs on another thread.
+        rows = index.begin_compaction()
+        mutate(index, expected, rng, int(rng.integers(0, 40)))
+        copies = index.copy_rows(rows)
+        mutate(index, expected, rng, int(rng.integers(0, 40)))
+        index.finish_compaction(rows, copies)
+        mutate(index, expected, rng, int(rng.integers(0, 40)))
+
+        assert len(index) == len(expected)
+        keys = sorted(expected)
+        for key, record in zip(keys, index.get_records(keys)):
+            assert record.description == expected[key][0]
+            assert np.allclose(record.embedding, expected[key][1], atol=1e-5)
+
+        query = normalize_queries(rng.normal(size=8))
+        assert search(index, query, 10) == brute_force(expected, query, 10)
+        assert search(
+            index, query, 10, MemoryFilter(description="d1")
+        ) == brute_force(expected, query, 10, "d1")
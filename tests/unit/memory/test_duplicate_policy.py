@@ -0,0 +1,127 @@
+import asyncio
+import hashlib
+
+import numpy as np
+import pytest
+
+from semantic_kernel.connectors.ai.embeddings.embedding_generator_base import (
+    EmbeddingGeneratorBase,
+)
+from semantic_kernel.memory.semantic_text_memory import SemanticTextMemory
+from semantic_kernel.memory.volatile_memory_store import VolatileMemoryStore
+
+
+class StemEmbeddingGenerator(EmbeddingGeneratorBase):
+    # Texts equal up to "#" get the same embedding, so they are
+    # near-duplicates of each other.
+    def __init__(self):
+        self.texts = []
+
+    async def generate_embeddings_async(self, texts):
+        self.texts.extend(texts)
+        return np.array(
+            [
+                np.random.default_rng(
+                    int(hashlib.md5(text.split("#")[0].encode()).hexdigest()[:8], 16)
+                ).normal(size=16)
+                for text in texts
+            ]
+        )
+
+
+def stored(store):
+    async def run():
+        return sorted(
+            (entry.key, entry.value.text, entry.value.description)
+            for entry in await store.get_all_async("test")
+        )
+
+    return asyncio.run(run())
+
+
+@pytest.mark.parametrize(
+    "policy, expected",
+    [
+        ("skip", [("1", "alpha", "first")]),
+        ("merge", [("1", "alpha", "first\nsecond")]),
+        ("replace", [("2", "alpha", "second")]),
+    ],
+)
+def test_exact_duplicates_follow_the_policy_without_being_embedded(policy, expected):
+    store = VolatileMemoryStore()
+    generator = StemEmbeddingGenerator()
+    memory = SemanticTextMemory(store, generator, duplicate_policy=policy)
+
+    async def run():
+        await memory.save_information_async("test", "alpha", "1", "first")
+        await memory.save_information_async("test", "alpha", "2", "second")
+
+    asyncio.run(run())
+
+    assert stored(store) == expected
+    assert generator.texts == ["alpha"]
+
+
+@pytest.mark.parametrize(
+    "policy, expected",
+    [
+        ("skip", [("4", "beta", "e4")]),
+        ("merge", [("4", "beta", "e4\ne5\ne6")]),
+        ("replace", [("6", "beta#y", "e6")]),
+    ],
+)
+def test_duplicate_chains_within_a_batch_resolve_in_order(policy, expected):
+    # "beta" repeats exactly and "beta#y" is a near-duplicate of both.
+    store = VolatileMemoryStore()
+    memory = SemanticTextMemory(
+        store, StemEmbeddingGenerator(), duplicate_policy=policy
+    )
+
+    asyncio.run(
+        memory.save_information_batch_async(
+            "test", ["beta", "beta", "beta#y"], ["4", "5", "6"], ["e4", "e5", "e6"]
+        )
+    )
+
+    assert stored(store) == expected
+
+
+def test_near_duplicates_are_kept_without_a_threshold():
+    store = VolatileMemoryStore()
+    memory = SemanticTextMemory(
+        store,
+        StemEmbeddingGenerator(),
+        duplicate_policy="skip",
+        near_duplicate_threshold=None,
+    )
+
+    async def run():
+        await memory.save_information_async("test", "gamma", "1")
+        await memory.save_information_async("test", "gamma#x", "2")
+        await memory.save_information_async("test", "gamma", "3")
+
+    asyncio.run(run())
+
+    assert stored(store) == [("1", "gamma", None), ("2", "gamma#x", None)]
+
+
+def test_saving_an_id_again_is_not_a_duplicate_of_itself():
+    store = VolatileMemoryStore()
+    memory = SemanticTextMemory(
+        store, StemEmbeddingGenerator(), duplicate_policy="skip"
+    )
+
+    async def run():
+        await memory.save_information_async("test", "delta", "1", "old")
+        await memory.save_information_async("test", "delta#new", "1", "new")
+
+    asyncio.run(run())
+
+    assert stored(store) == [("1", "delta#new", "new")]
+
+
+def test_unknown_policies_are_rejected():
+    with pytest.raises(ValueError):
+        SemanticTextMemory(
+            VolatileMemoryStore(), StemEmbeddingGenerator(), duplicate_policy="drop"
+        )
@@ -0,0 +1,151 @@
+import asyncio
+import os
+from datetime import datetime
+
+import numpy as np
+import pytest
+
+from semantic_kernel.memory.durable_memory_store import DurableMemoryStore
+from semantic_kernel.memory.memory_record import MemoryRecord
+from semantic_kernel.memory.storage.data_entry import DataEntry
+from semantic_kernel.memory.storage.write_ahead_log import WriteAheadLog
+
+
+def entry(key, vector, description=None):
+    record = MemoryRecord.local_record(key, f"text {key}", description, vector)
+    return DataEntry(key, record, datetime(2024, 1, 2, 3, 4, 5))
+
+
+def contents(store):
+    async def run():
+        return {
+            entry.key: (entry.value.text, entry.value.description, entry.value.embedding)
+            for entry in await store.get_all_async("test")
+        }
+
+    return asyncio.run(run())
+
+
+def assert_contents(store, expected):
+    found = contents(store)
+    assert sorted(found) == sorted(expected)
+    for key, (text, description, embedding) in found.items():
+        assert (text, description) == (f"text {key}", expected[key][0])
+        assert np.allclose(embedding, expected[key][1], atol=1e-6)
+
+
+def test_puts_and_removes_survive_a_restart(tmp_path):
+    rng = np.random.default_rng(0)
+    vectors = rng.normal(size=(20, 8))
+    expected = {}
+
+    async def write():
+        store = DurableMemoryStore(str(tmp_path))
+        await store.put_many_async(
+            "test", [entry(f"k{i}", vectors[i], "many") for i in range(10)]
+        )
+        for i in range(10, 20):
+            await store.put_async("test", entry(f"k{i}", vectors[i]))
+        await store.put_async("test", entry("k3", vectors[0], "again"))
+        await store.remove_async("test", "k5")
+        await store.close_async()
+
+    asyncio.run(write())
+    expected.update((f"k{i}", ("many", vectors[i])) for i in range(10))
+    expected.update((f"k{i}", (None, vectors[i])) for i in range(10, 20))
+    expected["k3"] = ("again", vectors[0])
+    del expected["k5"]
+
+    store = DurableMemoryStore(str(tmp_path))
+    assert_contents(store, expected)
+
+    matches = asyncio.run(store.get_nearest_matches_async("test", vectors[12], 1, 0.9))
+    assert [record.id for record, _ in matches] == ["k12"]
+
+
+def test_the_log_after_a_snapshot_is_replayed_on_top_of_it(tmp_path):
+    rng = np.random.default_rng(1)
+    vectors = rng.normal(size=(30, 8))
+
+    async def write():
+        store = DurableMemoryStore(str(tmp_path))
+        await store.put_many_async(
+            "test", [entry(f"k{i}", vectors[i]) for i in range(20)]
+        )
+        await store.remove_async("test", "k0")
+        await store.snapshot_async()
+        first_snapshot_segments = store._wal.segments()
+
+        await store.put_many_async(
+            "test", [entry(f"k{i}", vectors[i]) for i in range(20, 30)]
+        )
+        await store.put_async("test", entry("k1", vectors[29], "after"))
+        await store.remove_async("test", "k2")
+        await store.remove_async("test", "k25")
+        await store.snapshot_async()
+        await store.put_async("test", entry("k3", vectors[28], "last"))
+        await store.close_async()
+        return first_snapshot_segments, store._wal.segments()
+
+    first_segments, last_segments = asyncio.run(write())
+
+    # Each snapshot removes the segments it covers and the older snapshot.
+    assert len(first_segments) == 1
+    assert min(last_segments) > first_segments[0]
+    snapshots = [name for name in os.listdir(tmp_path) if name.startswith("snapshot-")]
+    assert len(snapshots) == 1
+
+    expected = {f"k{i}": (None, vectors[i]) for i in range(30)}
+    expected["k1"] = ("after", vectors[29])
+    expected["k3"] = ("last", vectors[28])
+    for key in ("k0", "k2", "k25"):
+        del expected[key]
+
+    assert_contents(DurableMemoryStore(str(tmp_path)), expected)
+
+
+def test_a_torn_log_tail_ends_replay_without_failing_it(tmp_path):
+    rng = np.random.default_rng(2)
+    vectors = rng.normal(size=(6, 8))
+
+    async def write(store, keys):
+        for key in keys:
+            await store.put_async("test", entry(key, vectors[int(key[1:])]))
+        await store.close_async()
+
+    asyncio.run(write(DurableMemoryStore(str(tmp_path)), ["k0", "k1", "k2"]))
+
+    # A crash in the middle of the last record.
+    wal = os.path.join(tmp_path, "wal")
+    segment = os.path.join(wal, sorted(os.listdir(wal))[-1])
+    os.truncate(segment, os.path.getsize(segment) - 3)
+
+    store = DurableMemoryStore(str(tmp_path))
+    assert sorted(contents(store)) == ["k0", "k1"]
+
+    # Writes after recovery go to a new segment, past the torn tail.
+    asyncio.run(write(store, ["k3", "k4"]))
+    assert_contents(
+        DurableMemoryStore(str(tmp_path)),
+        {key: (None, vectors[int(key[1:])]) for key in ("k0", "k1", "k3", "k4")},
+    )
+
+
+def test_a_failed_log_write_fails_every_later_write(tmp_path):
+    wal = WriteAheadLog(str(tmp_path), commit_interval=0.001)
+
+    def fail(data):
+        raise OSError("disk full")
+
+    wal._write = fail
+
+    async def run():
+        with pytest.raises(OSError, match="disk full"):
+            await wal.append(b"first")
+        with pytest.raises(OSError, match="disk full"):
+            wal.append(b"second")
+        with pytest.raises(OSError, match="disk full"):
+            await wal.close_async()
+
+    asyncio.run(run())
+    assert list(wal.read()) == []
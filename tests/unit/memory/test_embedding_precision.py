@@ -0,0 +1,133 @@
+import asyncio
+import gc
+import weakref
+
+import numpy as np
+import pytest
+
+from semantic_kernel.memory.hnsw_memory_store import HnswMemoryStore
+from semantic_kernel.memory.ivf_memory_store import IvfMemoryStore
+from semantic_kernel.memory.memory_record import MemoryRecord
+from semantic_kernel.memory.shared_memory_store import SharedMemoryStore
+from semantic_kernel.memory.volatile_memory_store import VolatileMemoryStore
+
+DIMENSION = 256
+COLLECTION_SIZE = 2000
+QUERY_COUNT = 20
+LIMIT = 10
+
+
+def fill_store(store, vectors):
+    async def fill():
+        for i, vector in enumerate(vectors):
+            record = MemoryRecord.local_record(str(i), f"text {i}", None, vector)
+            await store.put_value_async("test", str(i), record)
+
+    asyncio.run(fill())
+
+
+def search(store, queries):
+    return asyncio.run(
+        store.get_nearest_matches_batch_async("test", queries, LIMIT, -1.0)
+    )
+
+
+@pytest.mark.parametrize(
+    "dtype, max_score_delta, min_overlap",
+    [(np.float32, 1e-6, 1.0), (np.float16, 1e-3, 0.95)],
+)
+def test_low_precision_scores_match_float64(dtype, max_score_delta, min_overlap):
+    rng = np.random.default_rng(0)
+    vectors = rng.normal(size=(COLLECTION_SIZE, DIMENSION))
+    queries = rng.normal(size=(QUERY_COUNT, DIMENSION))
+
+    exact_store = VolatileMemoryStore(dtype=np.float64)
+    store = VolatileMemoryStore(dtype=dtype)
+    fill_store(exact_store, vectors)
+    fill_store(store, vectors)
+
+    exact_results = search(exact_store, queries)
+    results = search(store, queries)
+
+    score_deltas = []
+    overlaps = []
+    for exact_matches, matches in zip(exact_results, results):
+        exact_scores = {record.id: score for record, score in exact_matches}
+        overlaps.append(
+            len(exact_scores.keys() & {record.id for record, _ in matches}) / LIMIT
+        )
+        score_deltas.extend(
+            abs(float(score) - float(exact_scores[record.id]))
+            for record, score in matches
+            if record.id in exact_scores
+        )
+
+    assert max(score_deltas) <= max_score_delta
+    assert np.mean(overlaps) >= min_overlap
+
+
+def test_records_get_embeddings_back_in_store_precision():
+    rng = np.random.default_rng(1)
+    vectors = rng.normal(size=(10, DIMENSION))
+    store = VolatileMemoryStore(dtype=np.float16)
+    fill_store(store, vectors)
+
+    entry = asyncio.run(store.get_async("test", "3"))
+    matches = search(store, vectors[3].reshape(1, -1))[0]
+
+    assert np.allclose(entry.value.embedding, vectors[3], rtol=1e-3, atol=1e-3)
+    assert matches[0][0].id == "3"
+    assert np.allclose(matches[0][0].embedding, vectors[3], rtol=1e-3, atol=1e-3)
+
+
+@pytest.mark.parametrize(
+    "store_type", [VolatileMemoryStore, HnswMemoryStore, IvfMemoryStore, SharedMemoryStore]
+)
+def test_store_does_not_keep_the_callers_embedding(store_type):
+    store = store_type()
+    vector = np.random.default_rng(2).normal(size=DIMENSION)
+    expected = vector.copy()
+    reference = weakref.ref(vector)
+
+    async def put_and_get():
+        record = MemoryRecord.local_record("id", "text", None, vector)
+        await store.put_value_async("test", "id", record)
+        return await store.get_value_async("test", "id")
+
+    try:
+        stored = asyncio.run(put_and_get())
+        del vector
+        gc.collect()
+
+        assert reference() is None
+        assert np.allclose(stored.embedding, expected)
+    finally:
+        if store_type is SharedMemoryStore:
+            asyncio.run(store.close_async())
+
+
+def test_quantized_store_rescores_from_mapped_rows(tmp_path):
+    rng = np.random.default_rng(3)
+    vectors = rng.normal(size=(COLLECTION_SIZE, DIMENSION))
+    queries = rng.normal(size=(QUERY_COUNT, DIMENSION))
+    exact_store = VolatileMemoryStore(dtype=np.float64)
+    store = VolatileMemoryStore(quantized=True, quantized_directory=str(tmp_path))
+    fill_store(exact_store, vectors)
+    fill_store(store, vectors)
+
+    for exact_matches, matches in zip(
+        search(exact_store, queries), search(store, queries)
+    ):
+        exact_scores = {record.id: score for record, score in exact_matches}
+        assert [record.id for record, _ in matches] == list(exact_scores)
+        assert all(
+            abs(float(score) - float(exact_scores[record.id])) <= 1e-6
+            for record, score in matches
+        )
+
+    # The records hold no embedding; it is restored from the mapped row.
+    index = store._indexes["test"]
+    assert all(record.embedding is None for record in index.records)
+    assert index.row_bytes < DIMENSION * np.dtype(np.float32).itemsize
+    entry = asyncio.run(store.get_async("test", "3"))
+    assert np.allclose(entry.value.embedding, vectors[3], rtol=1e-5, atol=1e-5)
@@ -0,0 +1,36 @@
+import asyncio
+
+import numpy as np
+import pytest
+
+from semantic_kernel.memory.hnsw_memory_store import HnswMemoryStore
+from semantic_kernel.memory.ivf_memory_store import IvfMemoryStore
+from semantic_kernel.memory.memory_record import MemoryRecord
+from semantic_kernel.memory.storage.eviction_policy import EvictionPolicy
+from semantic_kernel.memory.volatile_memory_store import VolatileMemoryStore
+
+
+@pytest.mark.parametrize("order", ["lru", "lfu"])
+@pytest.mark.parametrize(
+    "store_type", [VolatileMemoryStore, HnswMemoryStore, IvfMemoryStore]
+)
+def test_records_returned_by_searches_count_as_used(store_type, order):
+    vectors = np.eye(4)
+    store = store_type()
+
+    async def run():
+        await store.set_eviction_policy_async(
+            "test", EvictionPolicy(max_records=3, order=order)
+        )
+        for i in range(3):
+            record = MemoryRecord.local_record(f"k{i}", "text", None, vectors[i])
+            await store.put_value_async("test", f"k{i}", record)
+
+        matches = await store.get_nearest_matches_async("test", vectors[0], 1, 0.5)
+        assert [record.id for record, _ in matches] == ["k0"]
+
+        record = MemoryRecord.local_record("k3", "text", None, vectors[3])
+        await store.put_value_async("test", "k3", record)
+        return sorted(entry.key for entry in await store.get_all_async("test"))
+
+    assert asyncio.run(run()) == ["k0", "k2", "k3"]
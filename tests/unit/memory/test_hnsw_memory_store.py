@@ -0,0 +1,95 @@
+import asyncio
+
+import numpy as np
+
+from semantic_kernel.memory.hnsw_memory_store import HnswMemoryStore
+from semantic_kernel.memory.memory_record import MemoryRecord
+from semantic_kernel.memory.volatile_memory_store import VolatileMemoryStore
+
+DIMENSION = 32
+COLLECTION_SIZE = 2000
+LIMIT = 10
+
+
+def clustered_vectors(rng, count):
+    centers = rng.normal(size=(40, DIMENSION))
+    return centers[rng.integers(0, len(centers), count)] + 0.5 * rng.normal(
+        size=(count, DIMENSION)
+    )
+
+
+async def put(stores, key, vector):
+    record = MemoryRecord.local_record(key, key, None, vector)
+    for store in stores:
+        await store.put_value_async("test", key, record)
+
+
+async def remove(stores, key):
+    for store in stores:
+        await store.remove_async("test", key)
+
+
+async def mean_recall(exact_store, store, queries):
+    recalls = []
+    for query in queries:
+        exact_matches = await exact_store.get_nearest_matches_async(
+            "test", query, LIMIT, -1.0
+        )
+        matches = await store.get_nearest_matches_async("test", query, LIMIT, -1.0)
+        exact_ids = {record.id for record, _ in exact_matches}
+        recalls.append(len(exact_ids & {record.id for record, _ in matches}) / LIMIT)
+    return np.mean(recalls)
+
+
+def test_recall_against_exact_store_through_inserts_and_deletes():
+    async def run():
+        rng = np.random.default_rng(0)
+        vectors = clustered_vectors(rng, COLLECTION_SIZE)
+        queries = rng.normal(size=(50, DIMENSION))
+        exact_store = VolatileMemoryStore()
+        store = HnswMemoryStore(m=8, ef_construction=100, ef_search=64, seed=1)
+        stores = [exact_store, store]
+
+        for i, vector in enumerate(vectors):
+            await put(stores, str(i), vector)
+        assert await mean_recall(exact_store, store, queries) >= 0.9
+
+        # Delete most of the collection, then insert into the freed slots.
+        for i in range(COLLECTION_SIZE):
+            if i % 4 != 0:
+                await remove(stores, str(i))
+        assert await mean_recall(exact_store, store, queries) >= 0.9
+
+        for i, vector in enumerate(clustered_vectors(rng, COLLECTION_SIZE // 2)):
+            await put(stores, f"new{i}", vector)
+        assert await mean_recall(exact_store, store, queries) >= 0.9
+
+        index = store._indexes["test"]
+        assert len(index) == COLLECTION_SIZE // 4 + COLLECTION_SIZE // 2
+        assert len(index._keys) <= COLLECTION_SIZE + 1
+
+    asyncio.run(run())
+
+
+def test_scores_match_exact_store():
+    async def run():
+        rng = np.random.default_rng(1)
+        exact_store = VolatileMemoryStore()
+        store = HnswMemoryStore(seed=1)
+        for i, vector in enumerate(rng.normal(size=(200, DIMENSION))):
+            await put([exact_store, store], str(i), vector)
+
+        query = rng.normal(size=DIMENSION)
+        exact_scores = {
+            record.id: score
+            for record, score in await exact_store.get_nearest_matches_async(
+                "test", query, LIMIT, -1.0
+            )
+        }
+        for record, score in await store.get_nearest_matches_async(
+            "test", query, LIMIT, -1.0
+        ):
+            if record.id in exact_scores:
+                assert abs(float(score) - float(exact_scores[record.id])) < 1e-5
+
+    asyncio.run(run())
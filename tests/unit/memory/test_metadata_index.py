@@ -0,0 +1,44 @@
+import numpy as np
+
+from semantic_kernel.memory.memory_filter import MemoryFilter
+from semantic_kernel.memory.memory_record import MemoryRecord
+from semantic_kernel.memory.metadata_index import MetadataIndex
+
+
+def record(i, source):
+    return MemoryRecord.reference_record(f"id{i}", source, f"description {i}", None)
+
+
+def test_select_keeps_only_the_codes_of_kept_rows():
+    index = MetadataIndex()
+    for row in range(1000):
+        index.set(row, record(row, f"source {row}"))
+
+    index.select(np.array([998, 3], dtype=np.int64))
+
+    assert [len(values) for values in index._values] == [1, 2]
+    assert list(index.mask(MemoryFilter(external_source_name="source 3"), 2)) == [
+        False,
+        True,
+    ]
+
+
+def test_id_and_description_filters_match_brute_force():
+    rng = np.random.default_rng(0)
+    records = [record(i, f"source {i % 3}") for i in range(200)]
+    rows_by_key = {r.id: row for row, r in enumerate(records)}
+    index = MetadataIndex()
+    for row, r in enumerate(records):
+        index.set(row, r)
+
+    for _ in range(50):
+        picks = rng.integers(0, 200, size=5)
+        filter = MemoryFilter(
+            external_source_name=["source 0", "source 1"],
+            id=[f"id{i}" for i in picks[:3]] + ["missing"],
+            description=[f"description {i}" for i in picks[1:]],
+        )
+        expected = [filter.matches(r) for r in records]
+
+        assert list(index.mask(filter, len(records), rows_by_key)) == expected
+        assert list(index.mask(filter, len(records))) == expected
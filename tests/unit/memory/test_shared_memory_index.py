@@ -0,0 +1,30 @@
+import numpy as np
+
+from semantic_kernel.memory.memory_record import MemoryRecord
+from semantic_kernel.memory.shared_memory_index import SharedMemoryIndex
+
+
+def record(id, vector):
+    return MemoryRecord.local_record(id, f"text {id}", None, vector)
+
+
+def test_rows_given_to_another_key_after_a_search_started_are_dropped():
+    rng = np.random.default_rng(0)
+    index = SharedMemoryIndex(shard_size=4)
+    try:
+        for i in range(6):
+            index.upsert(f"k{i}", record(f"k{i}", rng.normal(size=8)))
+        generation = index.generation
+        row = index._rows["k2"]
+
+        # The search's rows are scored, then k2's row is reused by k9.
+        index.remove("k2")
+        index.upsert("k9", record("k9", rng.normal(size=8)))
+        index.upsert("k1", record("k1", rng.normal(size=8)))
+
+        assert index._rows["k9"] == row
+        assert index.record(row, generation) is None
+        assert index.record(index._rows["k1"], generation).id == "k1"
+        assert index.record(row).id == "k9"
+    finally:
+        index.close()
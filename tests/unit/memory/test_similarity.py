@@ -0,0 +1,41 @@
+import numpy as np
+import pytest
+
+from semantic_kernel.memory.similarity import normalize_queries, top_k_indices
+
+
+def sorted_indices(scores, limit, min_relevance_score):
+    # The full stable descending sort that top_k_indices replaces.
+    order = sorted(range(len(scores)), key=lambda i: scores[i], reverse=True)
+    return [i for i in order if scores[i] >= min_relevance_score][:limit]
+
+
+@pytest.mark.parametrize("min_relevance_score", [-2.0, 0.0, 0.3])
+def test_top_k_indices_matches_full_sort_with_ties(min_relevance_score):
+    rng = np.random.default_rng(1)
+    for _ in range(1000):
+        # Few distinct values, so most selections cut through a tie.
+        scores = rng.integers(-3, 4, size=int(rng.integers(0, 40))) / 3.0
+        limit = int(rng.integers(0, 10))
+
+        assert list(top_k_indices(scores, limit, min_relevance_score)) == (
+            sorted_indices(scores, limit, min_relevance_score)
+        )
+
+
+def test_top_k_indices_matches_full_sort_on_large_input():
+    rng = np.random.default_rng(2)
+    scores = rng.normal(size=100_000).astype(np.float32)
+
+    assert list(top_k_indices(scores, 100, 0.5)) == sorted_indices(scores, 100, 0.5)
+
+
+def test_top_k_indices_skips_nan_scores():
+    scores = np.array([0.9, np.nan, 0.8, np.nan, 0.95])
+
+    assert list(top_k_indices(scores, 10, -1.0)) == [4, 0, 2]
+
+
+def test_normalize_queries_rejects_zero_queries():
+    with pytest.raises(ValueError):
+        normalize_queries(np.array([[1.0, 0.0], [0.0, 0.0]]))